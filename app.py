@@ -1,36 +1,43 @@
 from kivy.lang import Builder
 from kivy.core.window import Window
-from kivy.properties import ObjectProperty, StringProperty, NumericProperty
+from kivy.properties import StringProperty, NumericProperty, BooleanProperty
 from kivy.clock import Clock
-from kivy.uix.checkbox import CheckBox
+from kivy.uix.recycleview.views import RecycleDataViewBehavior
+import bisect
 import os
-import json
+import threading
 
 from kivymd.app import MDApp
 from kivymd.uix.screen import MDScreen
 from kivymd.uix.screenmanager import MDScreenManager
-from kivymd.uix.list import OneLineListItem, TwoLineListItem
 from kivymd.uix.boxlayout import MDBoxLayout
-from kivymd.uix.card import MDCard
-from kivymd.uix.chip import MDChip
-from kivymd.uix.dialog import MDDialog
-from kivymd.uix.button import MDFlatButton
-from kivymd.uix.textfield import MDTextField
-from kivymd.uix.label import MDLabel
-from kivymd.uix.toolbar import MDTopAppBar
-from kivymd.toast import toast
 
 from auth import AuthManager
-from project_manager import ProjectManager
-from checklist_manager import ChecklistManager
-from stats_manager import StatsManager
-from export_manager import ExportManager
-from dialogs import CreateProjectDialog, AddCustomItemDialog, NotesDialog, StatsDialog, ExportDialog, ConfirmationDialog
+from background import BackgroundExecutor
+from database import timed_action
+
+# Everything else (list/card/chip/dialog widgets, dialogs.py and the
+# project, checklist, stats and export managers) is imported where it is
+# first used, so cold start only pays for the login screen.
+
+# Background work shorter than this (seconds) never shows the loading dialog
+SPINNER_DELAY = 0.3
+
+# Seconds between export status bar refreshes while exports run
+EXPORT_STATUS_INTERVAL = 0.5
+
+# Typing pause (seconds) before the search box runs a query, and the
+# shortest text it searches for
+SEARCH_DELAY = 0.25
+SEARCH_MIN_LENGTH = 2
 
 # Set window size for mobile development
 Window.size = (360, 640)
 
-Builder.load_string('''
+# KV rules per screen. Each block is compiled the first time its screen
+# is built (see LazyScreenManager), not at import time.
+SCREEN_KV = {
+    'login': '''
 <LoginScreen>:
     MDBoxLayout:
         orientation: 'vertical'
@@ -83,7 +90,9 @@ Builder.load_string('''
             on_press: root.go_to_register()
             size_hint_y: None
             height: "30dp"
+''',
 
+    'register': '''
 <RegisterScreen>:
     MDBoxLayout:
         orientation: 'vertical'
@@ -135,7 +144,9 @@ Builder.load_string('''
             on_press: root.go_to_login()
             size_hint_y: None
             height: "30dp"
+''',
 
+    'projects': '''
 <ProjectsScreen>:
     MDBoxLayout:
         orientation: 'vertical'
@@ -151,7 +162,9 @@ Builder.load_string('''
                 id: projects_list
                 padding: "10dp"
                 spacing: "10dp"
+''',
 
+    'checklist': '''
 <ChecklistScreen>:
     project_name: "Project"
     
@@ -162,7 +175,18 @@ Builder.load_string('''
             title: root.project_name
             elevation: 4
             left_action_items: [["arrow-left", lambda x: root.go_back()]]
-            right_action_items: [["chart-box", lambda x: root.show_stats()], ["export", lambda x: root.export_data()], ["plus", lambda x: root.add_custom_item()]]
+            right_action_items: [["checkbox-multiple-outline", lambda x: root.toggle_select_mode()], ["chart-box", lambda x: root.show_stats()], ["export", lambda x: root.export_data()], ["import", lambda x: root.import_data()], ["plus", lambda x: root.add_custom_item()]]
+
+        MDBoxLayout:
+            size_hint_y: None
+            height: dp(64)
+            padding: dp(10), dp(8), dp(10), 0
+
+            MDTextField:
+                id: search_field
+                hint_text: "Search tasks and notes"
+                mode: "rectangle"
+                on_text: root.on_search_text(self.text)
 
         MDBoxLayout:
             orientation: 'vertical'
@@ -192,12 +216,132 @@ Builder.load_string('''
                 size_hint_y: None
                 height: self.texture_size[1]
 
-        ScrollView:
-            MDList:
-                id: checklist_list
-                padding: "10dp"
-                spacing: "10dp"
-''')
+        MDBoxLayout:
+            size_hint_y: None
+            height: dp(40) if root.transfer_status else 0
+            opacity: 1 if root.transfer_status else 0
+            disabled: not root.transfer_status
+            padding: dp(10), 0
+
+            MDLabel:
+                text: root.transfer_status
+                theme_text_color: "Secondary"
+
+            MDFlatButton:
+                text: "CANCEL"
+                on_release: root.cancel_transfers()
+
+        # Bulk actions for the rows selected in select mode
+        MDBoxLayout:
+            size_hint_y: None
+            height: dp(48) if root.select_mode else 0
+            opacity: 1 if root.select_mode else 0
+            disabled: not root.select_mode
+            padding: dp(10), 0
+
+            MDLabel:
+                text: root.selection_label
+                theme_text_color: "Secondary"
+
+            MDIconButton:
+                icon: "select-all"
+                on_release: root.select_all_items()
+
+            MDIconButton:
+                icon: "check-all"
+                on_release: root.bulk_action('complete')
+
+            MDIconButton:
+                icon: "restore"
+                on_release: root.bulk_action('reset')
+
+            MDIconButton:
+                icon: "folder-move"
+                on_release: root.move_selected()
+
+            MDIconButton:
+                icon: "delete"
+                on_release: root.delete_selected()
+
+            MDIconButton:
+                icon: "close"
+                on_release: root.toggle_select_mode()
+
+        MDLabel:
+            id: empty_label
+            text: ""
+            theme_text_color: "Secondary"
+            halign: "center"
+            size_hint_y: None
+            height: self.texture_size[1] if self.text else 0
+
+        RecycleView:
+            id: checklist_list
+            viewclass: 'ChecklistItem'
+            on_scroll_y: root.on_list_scroll(self)
+
+            RecycleBoxLayout:
+                orientation: 'vertical'
+                default_size: None, dp(80)
+                default_size_hint: 1, None
+                size_hint_y: None
+                height: self.minimum_height
+                padding: dp(10)
+                spacing: dp(10)
+
+<ChecklistItem>:
+    orientation: 'horizontal'
+    size_hint_y: None
+    height: "80dp"
+    padding: "10dp"
+    spacing: "10dp"
+    radius: [dp(8)]
+    md_bg_color: (0.85, 0.93, 0.92, 1) if root.selected else ((0.95, 0.95, 0.95, 1) if root.is_completed else (1, 1, 1, 1))
+
+    # Select-mode toggle; collapsed outside select mode
+    MDIconButton:
+        icon: "checkbox-marked-circle" if root.selected else "checkbox-blank-circle-outline"
+        on_release: root.toggle_selected()
+        disabled: not root.select_mode
+        opacity: 1 if root.select_mode else 0
+        size_hint: None, None
+        size: ("40dp", "40dp") if root.select_mode else (0, "40dp")
+
+    CheckBox:
+        size_hint: None, None
+        size: "30dp", "30dp"
+        active: root.is_completed
+        on_active: root.on_checkbox_active(self, self.active)
+
+    MDLabel:
+        text: "[s]%s[/s]" % root.task_text if root.is_completed else root.task_text
+        markup: True
+        size_hint_x: 0.5
+        halign: "left"
+        valign: "center"
+        theme_text_color: "Primary"
+
+    MDFlatButton:
+        text: "Notes"
+        theme_text_color: "Custom"
+        text_color: app.theme_cls.primary_color
+        on_release: root.show_notes_dialog(self)
+        size_hint: None, None
+        size: "60dp", "40dp"
+
+    # Custom items only; collapsed rather than removed so the row
+    # layout can be recycled between default and custom items
+    MDFlatButton:
+        text: "Delete"
+        theme_text_color: "Custom"
+        text_color: app.theme_cls.error_color
+        on_release: root.delete_item(self)
+        disabled: not root.is_custom
+        opacity: 1 if root.is_custom else 0
+        size_hint: None, None
+        size: ("60dp", "40dp") if root.is_custom else (0, "40dp")
+''',
+}
 
 
 class LoginScreen(MDScreen):
@@ -210,18 +354,25 @@ class LoginScreen(MDScreen):
             app.show_toast("Please enter both email and password")
             return
             
-        app.show_loading("Logging in...")
-        # Use Clock to prevent UI freezing during login
-        Clock.schedule_once(lambda dt: self._perform_login(email, password), 0.1)
+        app.run_in_background(
+            self._perform_login, email, password,
+            on_result=self._login_finished,
+            loading="Logging in...",
+            key='login'
+        )
     
+    @timed_action
     def _perform_login(self, email, password):
         app = MDApp.get_running_app()
-        success, message = app.auth_manager.login_user(email, password)
-        
-        app.hide_loading()
+        return app.auth_manager.login_user(email, password)
+    
+    def _login_finished(self, result):
+        app = MDApp.get_running_app()
+        success, message = result
         
         if success:
             app.user_id = app.auth_manager.current_user['id']
+            app.start_reminders()
             self.manager.current = 'projects'
             self.ids.email_input.text = ""
             self.ids.password_input.text = ""
@@ -250,14 +401,15 @@ class RegisterScreen(MDScreen):
             return
         
         app = MDApp.get_running_app()
-        app.show_loading("Creating account...")
-        Clock.schedule_once(lambda dt: self._perform_registration(email, password), 0.1)
+        app.run_in_background(
+            app.auth_manager.register_user, email, password,
+            on_result=self._registration_finished,
+            loading="Creating account..."
+        )
     
-    def _perform_registration(self, email, password):
+    def _registration_finished(self, result):
         app = MDApp.get_running_app()
-        success, message = app.auth_manager.register_user(email, password)
-        
-        app.hide_loading()
+        success, message = result
         
         if success:
             app.show_toast("Account created! Please log in.")
@@ -288,15 +440,23 @@ class ProjectsScreen(MDScreen):
             app.show_toast("Please log in first")
             return
             
-        app.show_loading("Loading projects...")
-        Clock.schedule_once(lambda dt: self._load_projects_async(), 0.1)
+        app.run_in_background(
+            self._load_projects_async, app.user_id,
+            on_result=self._show_projects,
+            loading="Loading projects...",
+            key='projects'
+        )
     
-    def _load_projects_async(self):
-        app = MDApp.get_running_app()
-        project_manager = ProjectManager(app.user_id)
-        projects = project_manager.get_user_projects()
+    @timed_action
+    def _load_projects_async(self, user_id):
+        from project_manager import ProjectManager
+        
+        project_manager = ProjectManager(user_id)
+        return project_manager.get_dashboard()
+    
+    def _show_projects(self, projects):
+        from kivymd.uix.list import OneLineListItem, ThreeLineListItem
         
-        app.hide_loading()
         self.ids.projects_list.clear_widgets()
         
         if not projects:
@@ -308,21 +468,36 @@ class ProjectsScreen(MDScreen):
             return
         
         for project in projects:
-            item = TwoLineListItem(
+            item = ThreeLineListItem(
                 text=project['name'],
                 secondary_text=project['description'] or "No description",
+                tertiary_text=self._project_summary(project),
                 on_release=lambda x, pid=project['id']: self.open_project(pid)
             )
             self.ids.projects_list.add_widget(item)
     
+    def _project_summary(self, project):
+        summary = f"{project['completed']}/{project['total']} done ({project['percentage']}%)"
+        if project['overdue']:
+            summary += f" · {project['overdue']} overdue"
+        # Timestamps are 'YYYY-MM-DD HH:MM:SS'; the day is enough here
+        return f"{summary} · active {str(project['last_activity'])[:10]}"
+    
     def open_project(self, project_id):
+        from project_manager import ProjectManager
+        
         app = MDApp.get_running_app()
         app.current_project_id = project_id
         
         # Load project details
         project_manager = ProjectManager(app.user_id)
-        project_details = project_manager.get_project_details(project_id)
-        
+        app.run_in_background(
+            project_manager.get_project_details, project_id,
+            on_result=self._show_project,
+            key='open_project'
+        )
+    
+    def _show_project(self, project_details):
         if project_details:
             checklist_screen = self.manager.get_screen('checklist')
             checklist_screen.project_name = project_details['name']
@@ -330,6 +505,8 @@ class ProjectsScreen(MDScreen):
         self.manager.current = 'checklist'
     
     def create_new_project(self):
+        from dialogs import CreateProjectDialog
+        
         app = MDApp.get_running_app()
         if not hasattr(app, 'create_project_dialog'):
             app.create_project_dialog = CreateProjectDialog(app, self.create_project_callback)
@@ -341,15 +518,22 @@ class ProjectsScreen(MDScreen):
             app.show_toast("Project name is required")
             return
             
-        app.show_loading("Creating project...")
-        Clock.schedule_once(lambda dt: self._create_project_async(name, description), 0.1)
+        app.run_in_background(
+            self._create_project_async, app.user_id, name, description,
+            on_result=lambda result: self._project_created(name, result),
+            loading="Creating project..."
+        )
     
-    def _create_project_async(self, name, description):
-        app = MDApp.get_running_app()
-        project_manager = ProjectManager(app.user_id)
-        project_id, message = project_manager.create_project(name, description)
+    @timed_action
+    def _create_project_async(self, user_id, name, description):
+        from project_manager import ProjectManager
         
-        app.hide_loading()
+        project_manager = ProjectManager(user_id)
+        return project_manager.create_project(name, description)
+    
+    def _project_created(self, name, result):
+        app = MDApp.get_running_app()
+        project_id, message = result
         
         if project_id:
             self.load_projects()
@@ -358,6 +542,8 @@ class ProjectsScreen(MDScreen):
             app.show_toast(message)
     
     def logout(self):
+        from dialogs import ConfirmationDialog
+        
         app = MDApp.get_running_app()
         confirmation = ConfirmationDialog(
             app, 
@@ -370,119 +556,93 @@ class ProjectsScreen(MDScreen):
     def _perform_logout(self):
         app = MDApp.get_running_app()
         app.auth_manager.logout()
+        app.stop_reminders()
         app.user_id = None
         app.current_project_id = None
         self.manager.current = 'login'
         app.show_toast("Logged out successfully")
 
 
-class ChecklistItem(MDBoxLayout):
-    def __init__(self, item_id, task_text, category, is_completed, is_custom, notes, **kwargs):
-        super().__init__(**kwargs)
-        self.item_id = item_id
-        self.task_text = task_text
-        self.category = category
-        self.is_completed = is_completed
-        self.is_custom = is_custom
-        self.notes = notes
-        
-        self.orientation = 'horizontal'
-        self.size_hint_y = None
-        self.height = "80dp"
-        self.padding = "10dp"
-        self.spacing = "10dp"
-        
-        # Use standard Kivy CheckBox
-        self.checkbox = CheckBox(
-            size_hint=(None, None),
-            size=("30dp", "30dp"),
-            active=bool(is_completed)
-        )
-        self.checkbox.bind(active=self.on_checkbox_active)
-        self.add_widget(self.checkbox)
-        
-        self.task_label = MDLabel(
-            text=task_text,
-            size_hint_x=0.5,
-            halign="left",
-            valign="center",
-            theme_text_color="Primary"
-        )
-        self.add_widget(self.task_label)
-        
-        self.notes_btn = MDFlatButton(
-            text="Notes",
-            theme_text_color="Custom",
-            text_color=MDApp.get_running_app().theme_cls.primary_color,
-            on_release=self.show_notes_dialog,
-            size_hint=(None, None),
-            size=("60dp", "40dp")
-        )
-        self.add_widget(self.notes_btn)
-        
-        if is_custom:
-            self.delete_btn = MDFlatButton(
-                text="Delete",
-                theme_text_color="Custom",
-                text_color=MDApp.get_running_app().theme_cls.error_color,
-                on_release=self.delete_item,
-                size_hint=(None, None),
-                size=("60dp", "40dp")
-            )
-            self.add_widget(self.delete_btn)
-        
-        # Set initial state
-        self.update_visual_state()
+class ChecklistItem(RecycleDataViewBehavior, MDBoxLayout):
+    """A recycled checklist row.
     
-    def update_visual_state(self):
-        if self.checkbox.active:
-            self.task_label.text = f"[s]{self.task_text}[/s]"
-            self.md_bg_color = (0.95, 0.95, 0.95, 1)
-        else:
-            self.task_label.text = self.task_text
-            self.md_bg_color = (1, 1, 1, 1)
+    The RecycleView keeps only enough of these for the visible rows and
+    rebinds them to whichever items scroll into view: refresh_view_attrs
+    copies the item's entry in ChecklistScreen's data onto the properties
+    below, and the KV rule renders from those properties.
+    """
+    item_id = NumericProperty(0)
+    task_text = StringProperty("")
+    category = StringProperty("")
+    is_completed = BooleanProperty(False)
+    is_custom = BooleanProperty(False)
+    notes = StringProperty("")
+    selected = BooleanProperty(False)
+    select_mode = BooleanProperty(False)
+    index = None
+    
+    def refresh_view_attrs(self, rv, index, data):
+        self.index = index
+        return super().refresh_view_attrs(rv, index, data)
     
     def on_checkbox_active(self, checkbox, value):
-        app = MDApp.get_running_app()
-        checklist_manager = ChecklistManager(app.current_project_id)
-        success = checklist_manager.update_item_status(self.item_id, value)
+        # Rebinding the row to another item also moves the checkbox;
+        # only a change the user made differs from the bound state
+        if value == self.is_completed:
+            return
         
-        if success:
-            self.update_visual_state()
-        else:
-            app.show_toast("Failed to update task")
-            # Revert checkbox state
-            checkbox.active = not value
+        app = MDApp.get_running_app()
+        self.is_completed = value
+        # Shown now, written by the screen's write-behind queue
+        app.root.get_screen('checklist').queue_edit(self.item_id, self.index, is_completed=value)
+    
+    def toggle_selected(self):
+        app = MDApp.get_running_app()
+        app.root.get_screen('checklist').toggle_selected(self.item_id, self.index)
     
     def show_notes_dialog(self, instance):
+        from dialogs import NotesDialog
+        
         app = MDApp.get_running_app()
         
+        # The row may be rebound to another item while the dialog is open
+        item_id, index = self.item_id, self.index
+        
         def update_notes_callback(notes):
-            checklist_manager = ChecklistManager(app.current_project_id)
-            if checklist_manager.update_item_notes(self.item_id, notes):
-                self.notes = notes
-                app.show_toast("Notes updated!")
-            else:
-                app.show_toast("Failed to update notes")
+            app.root.get_screen('checklist').queue_edit(item_id, index, notes=notes)
+            app.show_toast("Notes updated!")
         
         notes_dialog = NotesDialog(app, self.task_text, self.notes, update_notes_callback)
         notes_dialog.open()
     
     def delete_item(self, instance):
+        from dialogs import ConfirmationDialog
+        
         app = MDApp.get_running_app()
         confirmation = ConfirmationDialog(
             app,
             "Delete Task",
             "Are you sure you want to delete this task?",
-            lambda: self._perform_delete(app)
+            lambda item_id=self.item_id: self._perform_delete(app, item_id)
         )
         confirmation.open()
     
-    def _perform_delete(self, app):
+    def _perform_delete(self, app, item_id):
+        from checklist_manager import ChecklistManager
+        
+        # The deleted item's counts must reflect its queued edits
+        app.root.get_screen('checklist').flush_edits()
         checklist_manager = ChecklistManager(app.current_project_id)
-        if checklist_manager.delete_custom_item(self.item_id):
+        app.run_in_background(
+            checklist_manager.delete_custom_item, item_id,
+            on_result=lambda item: self._item_deleted(app, item)
+        )
+    
+    def _item_deleted(self, app, item):
+        if item:
             checklist_screen = app.root.get_screen('checklist')
-            checklist_screen.load_checklist_items()
+            checklist_screen.remove_item(item['id'])
+            checklist_screen.apply_item_change(old_item=item)
             app.show_toast("Task deleted!")
         else:
             app.show_toast("Failed to delete task")
@@ -491,18 +651,111 @@ class ChecklistItem(MDBoxLayout):
 class ChecklistScreen(MDScreen):
     project_name = StringProperty("Project")
     current_category = StringProperty("All")
+    transfer_status = StringProperty("")
+    select_mode = BooleanProperty(False)
+    selection_label = StringProperty("")
+    
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # {category: [total, completed]} for the open project. Loaded once
+        # on entry, then kept current by the edit handlers, so the chips
+        # and progress label never need a re-query after an edit.
+        self.category_counts = {}
+        # Keyset cursor of the last loaded row; None once the list is complete
+        self.items_cursor = None
+        self._loading_more = False
+        self._export_watcher = None
+        self._import_cancel = None
+        # Export and import report separately; the status bar shows both
+        self._export_status = ""
+        self._import_status = ""
+        self._file_manager = None
+        self.write_queue = None
+        # Select mode: explicit ids, or select_all for the whole current
+        # filter, including rows not loaded yet
+        self.selected_ids = set()
+        self.select_all = False
+        # Text the list is currently filtered by; "" shows the full list
+        self.search_text = ""
+        self._search_event = None
     
     def on_enter(self):
+        from write_queue import WriteBehindQueue
+        
+        app = MDApp.get_running_app()
+        if app.current_project_id:
+            self.write_queue = app.write_queue = WriteBehindQueue(
+                app.current_project_id,
+                executor=app.background,
+                on_failure=self._edits_failed
+            )
+        self.search_text = ""
+        self.ids.search_field.text = ""
         self.load_checklist_items()
+        self.load_summary()
     
-    def load_categories(self):
+    def on_leave(self):
+        self.flush_edits()
+        MDApp.get_running_app().write_queue = self.write_queue = None
+    
+    def flush_edits(self):
+        """Write any queued edits now; reads that must see them call this first"""
+        if self.write_queue is not None:
+            self.write_queue.flush()
+    
+    def queue_edit(self, item_id, index=None, **changes):
+        """Show an edit to one row immediately and queue it for writing"""
+        index = self._find_row(item_id, index)
+        if index is None or self.write_queue is None:
+            return
+        row = self.ids.checklist_list.data[index]
+        original = {'is_completed': row['is_completed'], 'notes': row['notes']}
+        self.write_queue.record(item_id, original, **changes)
+        self._patch_row(index, row, changes)
+    
+    def _patch_row(self, index, row, changes):
+        old_item = {'category': row['category'], 'is_completed': row['is_completed']}
+        self.patch_item(row['item_id'], index, **changes)
+        if 'is_completed' in changes:
+            self.apply_item_change(old_item, dict(old_item, is_completed=changes['is_completed']))
+    
+    def _edits_failed(self, reverts):
+        """Put rows whose queued edits failed to write back as stored"""
+        for item_id, fields in reverts.items():
+            index = self._find_row(item_id)
+            if index is not None:
+                self._patch_row(index, self.ids.checklist_list.data[index], fields)
+        MDApp.get_running_app().show_toast(f"Failed to save {len(reverts)} change(s); reverted")
+    
+    def load_summary(self):
+        """Load the per-category counts behind the chips and progress label"""
         app = MDApp.get_running_app()
         if not app.current_project_id:
             return
-            
-        checklist_manager = ChecklistManager(app.current_project_id)
-        categories = checklist_manager.get_categories()
         
+        app.run_in_background(
+            self._load_summary_async, app.current_project_id,
+            on_result=self._show_summary,
+            key='summary'
+        )
+    
+    @timed_action
+    def _load_summary_async(self, project_id):
+        from stats_manager import StatsManager
+        
+        self.flush_edits()
+        stats_manager = StatsManager(project_id)
+        return stats_manager.get_category_counts()
+    
+    def _show_summary(self, counts):
+        self.category_counts = {category: list(count) for category, count in counts.items()}
+        self.load_categories()
+        self.update_progress_label()
+    
+    def load_categories(self):
+        from kivymd.uix.chip import MDChip
+        
+        app = MDApp.get_running_app()
         self.ids.categories_container.clear_widgets()
         
         # Add "All" category chip
@@ -515,7 +768,7 @@ class ChecklistScreen(MDScreen):
             all_chip.text_color = (1, 1, 1, 1)
         self.ids.categories_container.add_widget(all_chip)
         
-        for category in categories:
+        for category in sorted(self.category_counts):
             chip = MDChip(
                 text=category,
                 on_release=lambda x, cat=category: self.filter_by_category(cat)
@@ -530,79 +783,208 @@ class ChecklistScreen(MDScreen):
         self.load_checklist_items()
         self.load_categories()
     
+    def on_search_text(self, text):
+        """Search once typing pauses for SEARCH_DELAY, not on every key"""
+        if self._search_event is not None:
+            self._search_event.cancel()
+        self._search_event = Clock.schedule_once(lambda dt: self.search(text), SEARCH_DELAY)
+    
+    def search(self, text):
+        self._search_event = None
+        text = text.strip()
+        if len(text) < SEARCH_MIN_LENGTH:
+            text = ""
+        if text != self.search_text:
+            self.search_text = text
+            self.load_checklist_items()
+    
     def load_checklist_items(self):
         app = MDApp.get_running_app()
-        self.ids.checklist_list.clear_widgets()
         
         if not app.current_project_id:
-            empty_label = OneLineListItem(text="No project selected")
-            self.ids.checklist_list.add_widget(empty_label)
+            self.items_cursor = None
+            self.show_items([], "No project selected")
+            return
+        
+        # The rows on screen belong to the previous load until this one
+        # lands; drop their cursor so a scroll meanwhile can't request the
+        # old list's next page and supersede this load under the same key
+        self.items_cursor = None
+        self._loading_more = False
+        
+        if self.search_text:
+            # Same key as the page loads, so the latest query or page wins
+            app.run_in_background(
+                self._search_async, app.current_project_id, self.search_text,
+                self.current_category,
+                on_result=self._show_search_results,
+                key='items'
+            )
             return
         
-        app.show_loading("Loading tasks...")
-        Clock.schedule_once(lambda dt: self._load_items_async(), 0.1)
+        # Only the first page is loaded here; on_list_scroll fetches the
+        # rest. A newer request (e.g. another category tap) supersedes this one.
+        app.run_in_background(
+            self._load_items_async, app.current_project_id, self.current_category, None,
+            on_result=self._show_loaded_items,
+            loading="Loading tasks...",
+            key='items'
+        )
+    
+    @timed_action
+    def _load_items_async(self, project_id, category, after):
+        from checklist_manager import ChecklistManager
+        
+        self.flush_edits()
+        checklist_manager = ChecklistManager(project_id)
+        return checklist_manager.get_items_page(category, after)
     
-    def _load_items_async(self):
+    @timed_action
+    def _search_async(self, project_id, text, category):
+        from checklist_manager import ChecklistManager
+        
+        self.flush_edits()
+        checklist_manager = ChecklistManager(project_id)
+        return checklist_manager.search_items(text, category)
+    
+    def _show_search_results(self, items):
+        # Results are ranked and capped, so there is nothing to page in
+        self.items_cursor = None
+        self._loading_more = False
+        self.show_items(items, "No matching tasks")
+    
+    def _show_loaded_items(self, page):
+        items, self.items_cursor = page
+        self._loading_more = False
+        self.show_items(items, "No tasks in this category")
+    
+    def on_list_scroll(self, view):
+        # scroll_y runs from 1 at the top to 0 at the bottom
+        if self.items_cursor is not None and not self._loading_more and view.scroll_y < 0.2:
+            self.load_more_items()
+    
+    def load_more_items(self):
         app = MDApp.get_running_app()
-        checklist_manager = ChecklistManager(app.current_project_id)
-        items = checklist_manager.get_checklist_items(self.current_category)
+        self._loading_more = True
+        app.run_in_background(
+            self._load_items_async, app.current_project_id, self.current_category,
+            self.items_cursor,
+            on_result=self._append_items,
+            on_error=self._load_more_failed,
+            key='items'
+        )
+    
+    def _append_items(self, page):
+        items, self.items_cursor = page
+        self._loading_more = False
+        self.ids.checklist_list.data.extend(self._row_data(item) for item in items)
+    
+    def _load_more_failed(self, error):
+        print(f"Error loading more tasks: {error}")
+        self._loading_more = False
+    
+    def show_items(self, items, empty_text=""):
+        """Hand the items to the RecycleView, which builds only visible rows"""
+        self.ids.checklist_list.data = [self._row_data(item) for item in items]
+        self.ids.empty_label.text = "" if items else empty_text
+        if self.select_all:
+            # A select-all under search covers the new result set
+            self._update_selection_label()
+    
+    def _row_data(self, item):
+        return {
+            'item_id': item['id'],
+            'task_text': item['task'],
+            'category': item['category'],
+            'is_completed': item['is_completed'],
+            'is_custom': item['is_custom'],
+            'notes': item['notes'] or "",
+            'selected': self.select_all or item['id'] in self.selected_ids,
+            'select_mode': self.select_mode
+        }
+    
+    def _find_row(self, item_id, index=None):
+        data = self.ids.checklist_list.data
+        if index is not None and index < len(data) and data[index]['item_id'] == item_id:
+            return index
+        return next((i for i, row in enumerate(data) if row['item_id'] == item_id), None)
+    
+    def patch_item(self, item_id, index=None, **changes):
+        """Update one row's data in place so recycled views stay in sync"""
+        index = self._find_row(item_id, index)
+        if index is not None:
+            self.ids.checklist_list.data[index].update(changes)
+            # The RecycleView doesn't observe the row dicts. Report just this
+            # row as modified; a bare refresh would re-lay out every row
+            self.ids.checklist_list.refresh_from_data(modified=slice(index, index + 1))
+    
+    def insert_item(self, item):
+        """Show a newly added item without reloading the list.
         
-        app.hide_loading()
-        self.ids.checklist_list.clear_widgets()
+        Rows are ordered by category, then creation, so a new item goes
+        at the end of its category's run. An item past the last loaded
+        page is left for that page to bring in. While searching, the list
+        holds only matches, so new items are left out.
+        """
+        if self.search_text or self.current_category not in ("All", item['category']):
+            return
+        if self.items_cursor is not None and item.sort_key > tuple(self.items_cursor):
+            return
+        data = self.ids.checklist_list.data
+        index = bisect.bisect_right(data, item['category'], key=lambda row: row['category'])
+        data.insert(index, self._row_data(item))
+        self.ids.empty_label.text = ""
+    
+    def remove_item(self, item_id):
+        index = self._find_row(item_id)
+        if index is not None:
+            self.ids.checklist_list.data.pop(index)
+    
+    def apply_item_change(self, old_item=None, new_item=None):
+        """Move one item's contribution in category_counts from old to new.
         
-        if not items:
-            empty_label = OneLineListItem(
-                text="No tasks in this category",
-                theme_text_color="Secondary"
-            )
-            self.ids.checklist_list.add_widget(empty_label)
-        else:
-            for item in items:
-                container = MDCard(
-                    orientation='vertical',
-                    size_hint_y=None,
-                    height="80dp",
-                    padding="10dp",
-                    elevation=2
-                )
-                
-                checklist_item = ChecklistItem(
-                    item_id=item['id'],
-                    task_text=item['task'],
-                    category=item['category'],
-                    is_completed=item['is_completed'],
-                    is_custom=item['is_custom'],
-                    notes=item['notes'] or ""
-                )
-                container.add_widget(checklist_item)
-                self.ids.checklist_list.add_widget(container)
+        Pass only new_item for an add, only old_item for a delete and both
+        for an edit. Chips are rebuilt only if a category appeared or
+        emptied out.
+        """
+        categories = set(self.category_counts)
+        if old_item:
+            self._count_item(old_item['category'], old_item['is_completed'], -1)
+        if new_item:
+            self._count_item(new_item['category'], new_item['is_completed'], 1)
         
-        # Update progress label
+        if set(self.category_counts) != categories:
+            self.load_categories()
         self.update_progress_label()
-        self.load_categories()
+    
+    def _count_item(self, category, is_completed, delta):
+        counts = self.category_counts.setdefault(category, [0, 0])
+        counts[0] += delta
+        if is_completed:
+            counts[1] += delta
+        if counts[0] <= 0:
+            del self.category_counts[category]
     
     def update_progress_label(self):
-        app = MDApp.get_running_app()
-        if not app.current_project_id:
-            return
-            
-        stats_manager = StatsManager(app.current_project_id)
-        stats = stats_manager.get_project_stats()
+        total = sum(counts[0] for counts in self.category_counts.values())
+        completed = sum(counts[1] for counts in self.category_counts.values())
         
-        if stats['total_tasks'] > 0:
-            progress_text = f"Progress: {stats['completed_tasks']}/{stats['total_tasks']} tasks completed ({stats['overall_percentage']}%)"
+        if total > 0:
+            percentage = round(completed / total * 100, 1)
+            progress_text = f"Progress: {completed}/{total} tasks completed ({percentage}%)"
             self.ids.progress_label.text = progress_text
         else:
             self.ids.progress_label.text = "No tasks yet"
     
     def add_custom_item(self):
+        from dialogs import AddCustomItemDialog
+        
         app = MDApp.get_running_app()
         if not app.current_project_id:
             app.show_toast("No project selected")
             return
             
-        checklist_manager = ChecklistManager(app.current_project_id)
-        categories = checklist_manager.get_categories()
+        categories = sorted(self.category_counts)
         
         if not hasattr(app, 'add_item_dialog'):
             app.add_item_dialog = AddCustomItemDialog(app, categories, self.add_item_callback)
@@ -614,18 +996,26 @@ class ChecklistScreen(MDScreen):
             app.show_toast("Category and task are required")
             return
         
-        app.show_loading("Adding task...")
-        Clock.schedule_once(lambda dt: self._add_item_async(category, task, due_date), 0.1)
+        app.run_in_background(
+            self._add_item_async, app.current_project_id, category, task, due_date,
+            on_result=self._item_added,
+            loading="Adding task..."
+        )
+    
+    @timed_action
+    def _add_item_async(self, project_id, category, task, due_date):
+        from checklist_manager import ChecklistManager
+        
+        checklist_manager = ChecklistManager(project_id)
+        return checklist_manager.add_custom_item(category, task, due_date)
     
-    def _add_item_async(self, category, task, due_date):
+    def _item_added(self, result):
         app = MDApp.get_running_app()
-        checklist_manager = ChecklistManager(app.current_project_id)
-        item_id, message = checklist_manager.add_custom_item(category, task, due_date)
-        
-        app.hide_loading()
+        item, message = result
         
-        if item_id:
-            self.load_checklist_items()
+        if item:
+            self.insert_item(item)
+            self.apply_item_change(new_item=item)
             app.show_toast("Task added!")
         else:
             app.show_toast(message)
@@ -635,10 +1025,26 @@ class ChecklistScreen(MDScreen):
         if not app.current_project_id:
             app.show_toast("No project selected")
             return
-            
-        stats_manager = StatsManager(app.current_project_id)
-        stats_data = stats_manager.get_project_stats()
         
+        app.run_in_background(
+            self._load_stats_async, app.current_project_id,
+            on_result=self._show_stats_dialog,
+            loading="Loading statistics...",
+            key='stats'
+        )
+    
+    @timed_action
+    def _load_stats_async(self, project_id):
+        from stats_manager import StatsManager
+        
+        self.flush_edits()
+        stats_manager = StatsManager(project_id)
+        return stats_manager.get_project_stats()
+    
+    def _show_stats_dialog(self, stats_data):
+        from dialogs import StatsDialog
+        
+        app = MDApp.get_running_app()
         stats_dialog = StatsDialog(
             app, 
             stats_data, 
@@ -647,6 +1053,8 @@ class ChecklistScreen(MDScreen):
         stats_dialog.open()
     
     def export_data(self):
+        from dialogs import ExportDialog
+        
         app = MDApp.get_running_app()
         if not app.current_project_id:
             app.show_toast("No project selected")
@@ -660,6 +1068,9 @@ class ChecklistScreen(MDScreen):
         export_dialog.open()
     
     def export_format_selected(self, format_type):
+        from datetime import datetime
+        from export_manager import FILE_EXTENSIONS
+        
         app = MDApp.get_running_app()
         
         # Create exports directory if it doesn't exist
@@ -671,37 +1082,275 @@ class ChecklistScreen(MDScreen):
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
         safe_name = "".join(c for c in self.project_name if c.isalnum() or c in (' ', '-', '_')).rstrip()
         safe_name = safe_name.replace(' ', '_')
+        file_path = os.path.join(exports_dir, f"{safe_name}_{timestamp}.{FILE_EXTENSIONS[format_type]}")
         
-        if format_type == 'csv':
-            file_path = os.path.join(exports_dir, f"{safe_name}_{timestamp}.csv")
-            success, message = self._export_to_csv(file_path)
-        else:
-            file_path = os.path.join(exports_dir, f"{safe_name}_{timestamp}.json")
-            success, message = self._export_to_json(file_path)
+        # The export runs on the export queue; the status bar follows it
+        self.flush_edits()
+        app.get_export_queue().submit(app.current_project_id, format_type, file_path)
+        app.show_toast(f"Exporting to {file_path}")
+        self.watch_exports()
+    
+    def watch_exports(self):
+        if self._export_watcher is None:
+            self._export_watcher = Clock.schedule_interval(
+                self._update_transfer_status, EXPORT_STATUS_INTERVAL
+            )
+        self._update_transfer_status(0)
+    
+    def _update_transfer_status(self, dt):
+        app = MDApp.get_running_app()
+        queue = app.get_export_queue()
         
-        if success:
-            app.show_toast(f"Exported to {file_path}")
+        for job in queue.jobs():
+            if job.finished:
+                app.show_toast(
+                    f"Exported to {job.file_path}" if job.status == 'done' else job.message
+                )
+        queue.clear_finished()
+        
+        active = queue.active()
+        if not active:
+            self._export_status = ""
+            self._render_transfer_status()
+            self._export_watcher.cancel()
+            self._export_watcher = None
+            return
+        
+        rows = sum(job.rows_written for job in active)
+        rate = sum(job.throughput() for job in active)
+        label = active[0].format_type.upper() if len(active) == 1 else f"{len(active)} files"
+        self._export_status = f"Exporting {label}: {rows:,} rows ({rate:,.0f} rows/s)"
+        self._render_transfer_status()
+    
+    def _render_transfer_status(self):
+        self.transfer_status = "  |  ".join(
+            status for status in (self._export_status, self._import_status) if status
+        )
+    
+    def cancel_transfers(self):
+        MDApp.get_running_app().get_export_queue().cancel()
+        if self._import_cancel is not None:
+            self._import_cancel.set()
+    
+    def import_data(self):
+        from kivymd.uix.filemanager import MDFileManager
+        
+        app = MDApp.get_running_app()
+        if not app.current_project_id:
+            app.show_toast("No project selected")
+            return
+        if self._import_cancel is not None:
+            app.show_toast("An import is already running")
+            return
+        
+        if self._file_manager is None:
+            self._file_manager = MDFileManager(
+                exit_manager=lambda *args: self._file_manager.close(),
+                select_path=self.import_file_selected,
+                ext=['.csv', '.json', '.ndjson', '.gz', '.zst', '.sqlite']
+            )
+        start_dir = os.path.abspath("exports") if os.path.isdir("exports") else os.path.expanduser("~")
+        self._file_manager.show(start_dir)
+    
+    def import_file_selected(self, path):
+        app = MDApp.get_running_app()
+        self._file_manager.close()
+        if os.path.isdir(path):
+            return
+        
+        self.flush_edits()
+        self._import_cancel = threading.Event()
+        self._import_status = "Importing..."
+        self._render_transfer_status()
+        app.run_in_background(
+            self._import_async, app.current_project_id, path, self._import_cancel,
+            on_result=self._import_finished,
+            on_error=self._import_failed
+        )
+    
+    def _import_async(self, project_id, path, cancel_event):
+        from import_manager import ImportManager, ImportCancelled
+        
+        def progress(p):
+            if cancel_event.is_set():
+                raise ImportCancelled()
+            status = f"Importing: {p.imported:,} tasks ({p.throughput():,.0f} rows/s)"
+            Clock.schedule_once(lambda dt: self._show_import_progress(status))
+        
+        return ImportManager(project_id).import_file(path, progress)
+    
+    def _show_import_progress(self, status):
+        if self._import_cancel is not None:
+            self._import_status = status
+            self._render_transfer_status()
+    
+    def _import_finished(self, result):
+        success, message = result
+        self._import_cancel = None
+        self._import_status = ""
+        self._render_transfer_status()
+        MDApp.get_running_app().show_toast(message)
+        # Imported items land across categories, so reload both list and counts
+        self.load_checklist_items()
+        self.load_summary()
+    
+    def _import_failed(self, error):
+        self._import_finished((False, f"Import failed: {error}"))
+    
+    def toggle_select_mode(self):
+        self.select_mode = not self.select_mode
+        self.selected_ids = set()
+        self.select_all = False
+        self._refresh_selection()
+    
+    def toggle_selected(self, item_id, index=None):
+        if self.select_all:
+            # Fall back to the loaded rows as an explicit selection
+            self.select_all = False
+            self.selected_ids = {row['item_id'] for row in self.ids.checklist_list.data}
+        if item_id in self.selected_ids:
+            self.selected_ids.discard(item_id)
         else:
-            app.show_toast(message)
+            self.selected_ids.add(item_id)
+        self.patch_item(item_id, index, selected=item_id in self.selected_ids)
+        self._update_selection_label()
+    
+    def select_all_items(self):
+        self.select_all = True
+        self.selected_ids = set()
+        self._refresh_selection()
+    
+    def _refresh_selection(self):
+        for row in self.ids.checklist_list.data:
+            row['select_mode'] = self.select_mode
+            row['selected'] = self.select_all or row['item_id'] in self.selected_ids
+        self.ids.checklist_list.refresh_from_data()
+        self._update_selection_label()
     
-    def _export_to_csv(self, file_path):
-        try:
-            export_manager = ExportManager(app.current_project_id)
-            return export_manager.export_to_csv(file_path)
-        except Exception as e:
-            return False, f"Export failed: {str(e)}"
+    def _update_selection_label(self):
+        if self.select_all and self.search_text:
+            self.selection_label = f"All {len(self.ids.checklist_list.data)} matches"
+        elif self.select_all:
+            scope = "project" if self.current_category == "All" else self.current_category
+            self.selection_label = f"All in {scope}"
+        else:
+            self.selection_label = f"{len(self.selected_ids)} selected"
     
-    def _export_to_json(self, file_path):
-        try:
-            export_manager = ExportManager(app.current_project_id)
-            return export_manager.export_to_json(file_path)
-        except Exception as e:
-            return False, f"Export failed: {str(e)}"
+    def _selection(self):
+        """The current selection as ChecklistManager bulk-method arguments"""
+        if not self.select_all:
+            return {'item_ids': list(self.selected_ids)}
+        if self.search_text:
+            # Search results are loaded whole, so the rows shown are every match
+            return {'item_ids': [row['item_id'] for row in self.ids.checklist_list.data]}
+        if self.current_category == "All":
+            return {'predicate': lambda item: True}
+        return {'category': self.current_category}
+    
+    def bulk_action(self, action, new_category=None):
+        app = MDApp.get_running_app()
+        selection = self._selection()
+        if selection.get('item_ids') == []:
+            app.show_toast("No tasks selected")
+            return
+        
+        app.run_in_background(
+            self._bulk_action_async, app.current_project_id, action, new_category,
+            selection,
+            on_result=lambda count: self._bulk_action_finished(action, count),
+            loading="Updating tasks..."
+        )
+    
+    @timed_action
+    def _bulk_action_async(self, project_id, action, new_category, selection):
+        from checklist_manager import ChecklistManager
+        
+        self.flush_edits()
+        checklist_manager = ChecklistManager(project_id)
+        if action == 'complete':
+            return checklist_manager.complete_items(**selection)
+        if action == 'reset':
+            return checklist_manager.reset_items(**selection)
+        if action == 'move':
+            return checklist_manager.move_items(new_category, **selection)
+        return checklist_manager.delete_custom_items(**selection)
+    
+    def _bulk_action_finished(self, action, count):
+        app = MDApp.get_running_app()
+        if count is None:
+            app.show_toast("Failed to update tasks")
+            return
+        
+        done = {'complete': "completed", 'reset': "reset", 'move': "moved", 'delete': "deleted"}
+        app.show_toast(f"{count} task(s) {done[action]}")
+        self.toggle_select_mode()
+        # A bulk change can touch any row or category, so reload both
+        self.load_checklist_items()
+        self.load_summary()
+    
+    def move_selected(self):
+        from dialogs import MoveItemsDialog
+        
+        app = MDApp.get_running_app()
+        if not self.select_all and not self.selected_ids:
+            app.show_toast("No tasks selected")
+            return
+        
+        MoveItemsDialog(
+            app, sorted(self.category_counts),
+            lambda category: self.bulk_action('move', category)
+        ).open()
+    
+    def delete_selected(self):
+        from dialogs import ConfirmationDialog
+        
+        app = MDApp.get_running_app()
+        if not self.select_all and not self.selected_ids:
+            app.show_toast("No tasks selected")
+            return
+        
+        ConfirmationDialog(
+            app,
+            "Delete Tasks",
+            "Delete the selected custom tasks? Built-in tasks are kept.",
+            lambda: self.bulk_action('delete')
+        ).open()
     
     def go_back(self):
         self.manager.current = 'projects'
 
 
+SCREEN_CLASSES = {
+    'login': LoginScreen,
+    'register': RegisterScreen,
+    'projects': ProjectsScreen,
+    'checklist': ChecklistScreen,
+}
+
+
+class LazyScreenManager(MDScreenManager):
+    """Screen manager that builds each screen on first navigation.
+    
+    A screen's KV rules are compiled and the screen instantiated the
+    first time it is looked up (switching to it, or get_screen), so
+    startup only builds the login screen.
+    """
+    
+    def __init__(self, screen_classes, **kwargs):
+        self._pending_screens = dict(screen_classes)
+        super().__init__(**kwargs)
+    
+    def has_screen(self, name):
+        return name in self._pending_screens or super().has_screen(name)
+    
+    def get_screen(self, name):
+        screen_class = self._pending_screens.pop(name, None)
+        if screen_class is not None:
+            Builder.load_string(SCREEN_KV[name])
+            self.add_widget(screen_class(name=name))
+        return super().get_screen(name)
+
+
 class TheatreChecklistApp(MDApp):
     def __init__(self, **kwargs):
         super().__init__(**kwargs)
@@ -709,24 +1358,102 @@ class TheatreChecklistApp(MDApp):
         self.user_id = None
         self.current_project_id = None
         self.loading_dialog = None
+        self.background = BackgroundExecutor()
+        self.export_queue = None
+        self.write_queue = None
+        self._pending_loads = 0
     
     def build(self):
         self.theme_cls.theme_style = "Light"
         self.theme_cls.primary_palette = "Teal"
         self.theme_cls.accent_palette = "Amber"
         
-        self.sm = MDScreenManager()
-        self.sm.add_widget(LoginScreen(name='login'))
-        self.sm.add_widget(RegisterScreen(name='register'))
-        self.sm.add_widget(ProjectsScreen(name='projects'))
-        self.sm.add_widget(ChecklistScreen(name='checklist'))
+        self.sm = LazyScreenManager(SCREEN_CLASSES)
+        self.sm.current = 'login'
         return self.sm
     
+    def on_stop(self):
+        # Queued checklist edits are written before the workers go away
+        if self.write_queue is not None:
+            self.write_queue.flush()
+        self.stop_reminders()
+        self.background.shutdown(wait=True)
+        if self.export_queue is not None:
+            self.export_queue.shutdown(wait=True)
+    
+    def on_pause(self):
+        # Android often kills a paused app without calling on_stop, so
+        # queued edits are written before the app goes to the background
+        if self.write_queue is not None:
+            self.write_queue.flush()
+        return True
+    
+    def start_reminders(self):
+        """Load the user's deadlines off the UI thread and start reminding"""
+        from reminders import reminders
+        
+        self.run_in_background(
+            reminders.start, self.user_id, self.show_reminder,
+            key='reminders'
+        )
+    
+    def stop_reminders(self):
+        from reminders import reminders
+        
+        reminders.stop()
+    
+    def show_reminder(self, reminder):
+        from reminders import notify
+        
+        title = f"Due: {reminder['task']}"
+        message = f"{reminder['project_name']} · due {reminder['due_date']}"
+        if not notify(title, message):
+            self.show_toast(f"{title} ({reminder['project_name']})")
+    
+    def get_export_queue(self):
+        # Created on first export so startup doesn't import the export modules
+        if self.export_queue is None:
+            from export_jobs import ExportQueue
+            
+            self.export_queue = ExportQueue()
+        return self.export_queue
+    
+    def run_in_background(self, func, *args, on_result=None, on_error=None, loading=None,
+                          key=None, **kwargs):
+        """Run func off the UI thread and hand its result to on_result.
+        
+        If loading is given, the loading dialog shows only if the work is
+        still running after SPINNER_DELAY, so fast calls never flash it.
+        key lets a newer request supersede a pending one (see
+        BackgroundExecutor).
+        """
+        spinner = None
+        if loading:
+            self._pending_loads += 1
+            spinner = Clock.schedule_once(lambda dt: self.show_loading(loading), SPINNER_DELAY)
+        
+        def done():
+            if spinner is not None:
+                spinner.cancel()
+                self._pending_loads -= 1
+                if self._pending_loads == 0:
+                    self.hide_loading()
+        
+        return self.background.submit(
+            func, *args,
+            key=key, on_result=on_result, on_error=on_error, on_done=done,
+            **kwargs
+        )
+    
     def show_toast(self, message):
+        from kivymd.toast import toast
+        
         toast(message)
     
     def show_loading(self, message="Loading..."):
         if self.loading_dialog is None:
+            from kivymd.uix.dialog import MDDialog
+            
             self.loading_dialog = MDDialog(
                 title=message,
                 type="simple",
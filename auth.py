@@ -25,7 +25,7 @@ class AuthManager:
     
     def is_email_taken(self, email):
         try:
-            result = self.db.fetch_one("SELECT id FROM users WHERE email = ?", (email,))
+            result = self.db.fetch_one('users.id_by_email', (email,))
             return result is not None
         except Exception as e:
             print(f"Error checking email: {e}")
@@ -40,13 +40,14 @@ class AuthManager:
             if not valid:
                 return False, message
             
-            if self.is_email_taken(email):
-                return False, "Email already registered"
-            
-            self.db.execute_query(
-                'INSERT INTO users (email, password_hash) VALUES (?, ?)',
-                (email, self.hash_password(password))
-            )
+            with self.db.transaction():
+                if self.is_email_taken(email):
+                    return False, "Email already registered"
+                
+                self.db.execute_query(
+                    'users.insert',
+                    (email, self.hash_password(password))
+                )
             
             return True, "Registration successful"
         except sqlite3.IntegrityError:
@@ -58,7 +59,7 @@ class AuthManager:
     def login_user(self, email, password):
         try:
             result = self.db.fetch_one(
-                'SELECT id, email FROM users WHERE email = ? AND password_hash = ?',
+                'users.login',
                 (email, self.hash_password(password))
             )
             
@@ -0,0 +1,80 @@
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+from kivy.clock import Clock
+
+DEFAULT_WORKERS = 2
+
+
+class BackgroundExecutor:
+    """Runs blocking work (manager calls) on worker threads.
+    
+    Results are posted back to the UI thread with Clock, so callbacks may
+    touch widgets. Work submitted under a key supersedes earlier work with
+    the same key: a superseded request that hasn't started is cancelled,
+    and one that already ran has its callbacks dropped. That keeps rapid
+    category switching from painting stale lists. Only reads use keys; a
+    superseded write would be dropped without telling the user.
+    """
+    
+    def __init__(self, max_workers=DEFAULT_WORKERS):
+        self._executor = ThreadPoolExecutor(
+            max_workers=max_workers,
+            thread_name_prefix='background'
+        )
+        self._latest = {}
+        self._lock = threading.Lock()
+    
+    def submit(self, func, *args, key=None, on_result=None, on_error=None, on_done=None, **kwargs):
+        """Run func(*args, **kwargs) on a worker thread.
+        
+        on_result(result) or on_error(exception) runs on the UI thread
+        unless the request was superseded; on_done() always runs there
+        afterwards, superseded or not.
+        """
+        future = self._executor.submit(func, *args, **kwargs)
+        
+        if key is not None:
+            with self._lock:
+                previous = self._latest.get(key)
+                self._latest[key] = future
+            if previous is not None:
+                previous.cancel()
+        
+        def deliver(dt):
+            try:
+                if future.cancelled() or not self._is_latest(key, future):
+                    return
+                error = future.exception()
+                if error is not None:
+                    if on_error:
+                        on_error(error)
+                    else:
+                        print(f"Background task failed: {error}")
+                elif on_result:
+                    on_result(future.result())
+            finally:
+                if on_done:
+                    on_done()
+        
+        future.add_done_callback(lambda f: Clock.schedule_once(deliver))
+        return future
+    
+    def _is_latest(self, key, future):
+        if key is None:
+            return True
+        with self._lock:
+            if self._latest.get(key) is not future:
+                return False
+            del self._latest[key]
+            return True
+    
+    def cancel(self, key):
+        """Drop the pending request for key, if any"""
+        with self._lock:
+            future = self._latest.pop(key, None)
+        if future is not None:
+            future.cancel()
+    
+    def shutdown(self, wait=True):
+        self._executor.shutdown(wait=wait, cancel_futures=True)
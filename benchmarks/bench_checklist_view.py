@@ -0,0 +1,116 @@
+"""Checklist rendering cost at 100, 1,000 and 10,000 items.
+
+Each size runs in a fresh interpreter that shows the real ChecklistScreen
+with synthetic rows, then scrolls the list from top to bottom one step
+per frame. Reported per size:
+- the time from handing the rows to the RecycleView to the first frame;
+- median and p95 frame time while scrolling;
+- how many row widgets exist;
+- RSS growth over the empty screen.
+
+Flat row counts and RSS across sizes show the view is recycled.
+
+Needs Kivy, KivyMD and a display.
+
+    python benchmarks/bench_checklist_view.py [--sizes 100,1000,10000] [--frames N]
+"""
+import argparse
+import json
+import subprocess
+import sys
+
+from common import print_table, probe_env, temp_dir
+
+PROBE = '''
+import gc, json, time
+from common import current_rss_mb, open_database
+open_database('probe.db')
+from kivy.clock import Clock
+from kivy.core.window import Window
+from kivy.lang import Builder
+from app import SCREEN_KV, ChecklistItem, ChecklistScreen, TheatreChecklistApp
+from instrumentation import percentile
+
+SIZE, FRAMES = {size}, {frames}
+
+class ViewProbe(TheatreChecklistApp):
+    def build(self):
+        Builder.load_string(SCREEN_KV['checklist'])
+        self.screen = ChecklistScreen(name='checklist')
+        return self.screen
+    
+    def on_start(self):
+        Clock.schedule_once(self.fill, 0.5)
+    
+    def fill(self, dt):
+        items = [
+            {{'id': i, 'task': f"Task {{i}} cue light cable check", 'category': f"Category {{i % 20}}",
+              'is_completed': i % 3 == 0, 'is_custom': i % 5 == 0, 'notes': None}}
+            for i in range(SIZE)
+        ]
+        gc.collect()
+        self.rss_before = current_rss_mb()
+        self.flips = []
+        Window.bind(on_flip=self.on_flip)
+        self.start = time.perf_counter()
+        self.screen.show_items(items)
+    
+    def on_flip(self, *args):
+        self.flips.append(time.perf_counter())
+        rv = self.screen.ids.checklist_list
+        if len(self.flips) <= FRAMES:
+            rv.scroll_y = max(0.0, 1.0 - len(self.flips) / FRAMES)
+            return
+        Window.unbind(on_flip=self.on_flip)
+        frames = [b - a for a, b in zip(self.flips[1:], self.flips[2:])]
+        gc.collect()
+        print("RESULT " + json.dumps({{
+            'first_frame_ms': (self.flips[0] - self.start) * 1000,
+            'frame_p50_ms': percentile(frames, 50) * 1000,
+            'frame_p95_ms': percentile(frames, 95) * 1000,
+            'rows': sum(isinstance(o, ChecklistItem) for o in gc.get_objects()),
+            'rss_mb': current_rss_mb() - self.rss_before,
+        }}), flush=True)
+        self.stop()
+
+ViewProbe().run()
+'''
+
+
+def measure(size, frames):
+    with temp_dir() as directory:
+        result = subprocess.run(
+            [sys.executable, '-c', PROBE.format(size=size, frames=frames)],
+            cwd=directory, env=probe_env(), capture_output=True, text=True
+        )
+    for line in result.stdout.splitlines():
+        if line.startswith('RESULT '):
+            return json.loads(line[len('RESULT '):])
+    error = (result.stderr.strip().splitlines() or ['no output'])[-1]
+    raise RuntimeError(error)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--sizes', default='100,1000,10000')
+    parser.add_argument('--frames', type=int, default=120, help="frames spent scrolling")
+    args = parser.parse_args()
+    
+    rows = []
+    for size in (int(s) for s in args.sizes.split(',')):
+        try:
+            r = measure(size, args.frames)
+        except RuntimeError as e:
+            print(f"Could not run the view probe: {e}")
+            return 1
+        rows.append((
+            size, f"{r['first_frame_ms']:.0f}", f"{r['frame_p50_ms']:.1f}",
+            f"{r['frame_p95_ms']:.1f}", r['rows'], f"{r['rss_mb']:.1f}"
+        ))
+    
+    print_table(('items', 'first frame ms', 'frame p50 ms', 'frame p95 ms', 'row widgets', 'RSS +MB'), rows)
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
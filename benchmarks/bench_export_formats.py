@@ -0,0 +1,104 @@
+"""Export time, file size, read time and import time for every format.
+
+One project is exported as CSV, JSON, NDJSON (gzip, plus zstd when the
+zstandard package is installed) and a SQLite snapshot. Each file is
+then read in full the way a downstream script would, and imported back
+into an empty project with ImportManager.
+
+    python benchmarks/bench_export_formats.py [--items N] [--skip-import]
+"""
+import argparse
+import csv
+import json
+import os
+import pathlib
+import sqlite3
+import time
+
+from common import create_user, fill_project, open_database, print_table, temp_dir
+from export_manager import ExportManager, open_ndjson, zstandard
+from import_manager import ImportManager
+from project_manager import ProjectManager
+
+
+def read_csv(path):
+    with open(path, newline='', encoding='utf-8') as f:
+        return sum(1 for _ in csv.reader(f)) - 1
+
+
+def read_json(path):
+    with open(path, encoding='utf-8') as f:
+        return len(json.load(f)['tasks'])
+
+
+def read_ndjson(path):
+    # Line by line, so memory stays flat
+    with open_ndjson(path) as f:
+        return sum(1 for line in f if json.loads(line))
+
+
+def read_snapshot(path):
+    conn = sqlite3.connect(pathlib.Path(path).resolve().as_uri() + '?mode=ro', uri=True)
+    try:
+        return len(conn.execute('SELECT * FROM checklist_items').fetchall())
+    finally:
+        conn.close()
+
+
+# (label, format, export options, file name, reader)
+FORMATS = [
+    ('csv', 'csv', {}, 'export.csv', read_csv),
+    ('json', 'json', {}, 'export.json', read_json),
+    ('ndjson gzip', 'ndjson', {'compression': 'gzip'}, 'export.ndjson.gz', read_ndjson),
+    ('ndjson zstd', 'ndjson', {'compression': 'zstd'}, 'export.ndjson.zst', read_ndjson),
+    ('snapshot', 'snapshot', {}, 'export.sqlite', read_snapshot),
+]
+
+
+def timed(func, *args, **kwargs):
+    start = time.perf_counter()
+    result = func(*args, **kwargs)
+    return result, time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--items', type=int, default=100000)
+    parser.add_argument('--skip-import', action='store_true')
+    args = parser.parse_args()
+    
+    rows = []
+    with temp_dir() as directory:
+        db = open_database(os.path.join(directory, 'formats.db'))
+        projects = ProjectManager(create_user())
+        project_id, _ = projects.create_project("Formats")
+        fill_project(db, project_id, args.items)
+        exporter = ExportManager(project_id)
+        
+        for label, format_type, options, name, read in FORMATS:
+            if options.get('compression') == 'zstd' and zstandard is None:
+                continue
+            path = os.path.join(directory, name)
+            (ok, message), export_time = timed(exporter.export, format_type, path, **options)
+            if not ok:
+                raise RuntimeError(message)
+            count, read_time = timed(read, path)
+            
+            import_time = None
+            if not args.skip_import:
+                target_id, _ = projects.create_project(f"Import {label}")
+                (ok, message), import_time = timed(ImportManager(target_id).import_file, path)
+                if not ok:
+                    raise RuntimeError(message)
+            
+            rows.append((
+                label, count, f"{export_time:.1f}", f"{os.path.getsize(path) / 2**20:.1f}",
+                f"{read_time:.1f}", '-' if import_time is None else f"{import_time:.1f}"
+            ))
+    
+    print(f"{args.items} items")
+    print_table(('format', 'rows', 'export s', 'size MB', 'read s', 'import s'), rows)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,86 @@
+"""Peak memory of CSV and JSON exports as the project grows.
+
+Every export runs in a fresh interpreter so its peak RSS is its own. The
+streaming exporters should peak at the same RSS whatever the project
+size. The "json, in memory" row rebuilds the old path (every item loaded
+as a dict, then one json.dump) for comparison; its peak grows with the
+project.
+
+    python benchmarks/bench_export_memory.py [--sizes 100000,1000000]
+"""
+import argparse
+import json
+import os
+import subprocess
+import sys
+
+from common import create_user, fill_project, open_database, print_table, probe_env, temp_dir
+from project_manager import ProjectManager
+
+PROBE = '''
+import json, sys, time
+from common import current_rss_mb, open_database, peak_rss_mb
+from export_manager import ExportManager
+
+db_path, project_id, mode, out = sys.argv[1], int(sys.argv[2]), sys.argv[3], sys.argv[4]
+db = open_database(db_path)
+baseline = current_rss_mb()
+start = time.perf_counter()
+if mode == 'json-in-memory':
+    items = [dict(row) for row in db.fetch_all('export.items', (project_id,))]
+    with open(out, 'w', encoding='utf-8') as f:
+        json.dump({'project_id': project_id, 'tasks': items}, f, indent=2)
+    ok = True
+else:
+    ok, message = ExportManager(project_id).export(mode, out)
+print(json.dumps({
+    'ok': ok, 'seconds': time.perf_counter() - start,
+    'baseline_mb': baseline, 'peak_mb': peak_rss_mb(),
+}))
+'''
+
+MODES = (('csv', 'csv'), ('json', 'json'), ('json-in-memory', 'json, in memory'))
+
+
+def export_in_child(directory, db_path, project_id, mode):
+    out = os.path.join(directory, f"export-{mode}.out")
+    result = subprocess.run(
+        [sys.executable, '-c', PROBE, db_path, str(project_id), mode, out],
+        cwd=directory, env=probe_env(), capture_output=True, text=True
+    )
+    if result.returncode != 0:
+        raise RuntimeError((result.stderr.strip().splitlines() or ['no output'])[-1])
+    measured = json.loads(result.stdout.strip().splitlines()[-1])
+    measured['size_mb'] = os.path.getsize(out) / 2**20
+    os.remove(out)
+    return measured
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--sizes', default='100000,1000000')
+    args = parser.parse_args()
+    
+    rows = []
+    with temp_dir() as directory:
+        for size in (int(s) for s in args.sizes.split(',')):
+            db_path = os.path.join(directory, f"export-{size}.db")
+            db = open_database(db_path)
+            project_id, _ = ProjectManager(create_user()).create_project("Export memory")
+            fill_project(db, project_id, size)
+            db.close_connection()
+            
+            for mode, label in MODES:
+                r = export_in_child(directory, db_path, project_id, mode)
+                if not r['ok']:
+                    raise RuntimeError(f"{label} export of {size} items failed")
+                rows.append((
+                    size, label, f"{r['seconds']:.1f}", f"{r['size_mb']:.1f}",
+                    f"{r['baseline_mb']:.0f}", f"{r['peak_mb']:.0f}"
+                ))
+    
+    print_table(('items', 'export', 'seconds', 'file MB', 'start RSS MB', 'peak RSS MB'), rows)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,102 @@
+"""Mixed read/write throughput under the WAL profile and SQLite's defaults.
+
+One thread ticks random items the way the checklist screen does, one
+commit per tick, while reader threads run the stats aggregate and stream
+the export query over the same project. Reported per profile: writes and
+reads per second, the writer's median and p99 latency, and how many
+statements hit "database is locked".
+
+    python benchmarks/bench_mixed_rw.py [--items N] [--readers N] [--seconds S]
+"""
+import argparse
+import os
+import random
+import sqlite3
+import statistics
+import threading
+import time
+
+from common import create_user, fill_project, open_database, print_table, temp_dir
+from database import DEFAULT_PRAGMAS, PERFORMANCE_PRAGMAS
+from instrumentation import percentile
+from project_manager import ProjectManager
+
+PROFILES = {'default': DEFAULT_PRAGMAS, 'performance': PERFORMANCE_PRAGMAS}
+
+
+def writer(db, project_id, item_ids, stop, latencies, errors):
+    rng = random.Random(1)
+    while not stop.is_set():
+        item_id = rng.choice(item_ids)
+        done = rng.random() < 0.5
+        start = time.perf_counter()
+        try:
+            db.execute_query('items.update_status', (
+                done, '2026-01-01 12:00:00' if done else None, item_id, project_id
+            ))
+        except sqlite3.OperationalError:
+            errors.append(1)
+            continue
+        latencies.append(time.perf_counter() - start)
+
+
+def reader(db, project_id, stop, reads, errors):
+    while not stop.is_set():
+        try:
+            db.fetch_all('stats.category_totals', (project_id,))
+            for _ in db.stream('export.items', (project_id,)):
+                pass
+        except sqlite3.OperationalError:
+            errors.append(1)
+            continue
+        reads.append(1)
+
+
+def run(profile, args, directory):
+    db = open_database(os.path.join(directory, f"{profile}.db"), pragmas=PROFILES[profile])
+    project_id, _ = ProjectManager(create_user()).create_project("Mixed load")
+    fill_project(db, project_id, args.items)
+    item_ids = [row[0] for row in db.fetch_all(
+        'SELECT id FROM checklist_items WHERE project_id = ?', (project_id,)
+    )]
+    
+    stop = threading.Event()
+    latencies, reads, errors = [], [], []
+    threads = [threading.Thread(target=writer, args=(db, project_id, item_ids, stop, latencies, errors))]
+    threads += [
+        threading.Thread(target=reader, args=(db, project_id, stop, reads, errors))
+        for _ in range(args.readers)
+    ]
+    for thread in threads:
+        thread.start()
+    time.sleep(args.seconds)
+    stop.set()
+    for thread in threads:
+        thread.join()
+    
+    return (
+        profile,
+        f"{len(latencies) / args.seconds:.0f}",
+        f"{len(reads) / args.seconds:.1f}",
+        f"{statistics.median(latencies) * 1000:.2f}" if latencies else '-',
+        f"{percentile(latencies, 99) * 1000:.2f}" if latencies else '-',
+        len(errors),
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--items', type=int, default=20000)
+    parser.add_argument('--readers', type=int, default=2)
+    parser.add_argument('--seconds', type=float, default=5.0)
+    args = parser.parse_args()
+    
+    with temp_dir() as directory:
+        rows = [run(profile, args, directory) for profile in PROFILES]
+    
+    print(f"{args.items} items, 1 writer, {args.readers} readers, {args.seconds:g} s per profile")
+    print_table(('profile', 'writes/s', 'reads/s', 'write p50 ms', 'write p99 ms', 'locked'), rows)
+
+
+if __name__ == '__main__':
+    main()
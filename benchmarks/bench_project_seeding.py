@@ -0,0 +1,87 @@
+"""Commits and wall time to create a project with its default checklist.
+
+Compares ProjectManager.create_project, which seeds every template item in
+one transaction, with the old path that committed once per item, at 10,
+100 and 1,000 template items. Both SQLite profiles are run: the stock
+rollback journal with FULL sync, where each commit is an fsync, and the
+app's WAL profile.
+
+    python benchmarks/bench_project_seeding.py [--projects N]
+"""
+import argparse
+import os
+import time
+
+from common import create_user, open_database, print_table, temp_dir
+from database import DEFAULT_PRAGMAS, PERFORMANCE_PRAGMAS
+from project_manager import ProjectManager
+
+TEMPLATE_SIZES = (10, 100, 1000)
+PROFILES = {'default': DEFAULT_PRAGMAS, 'performance': PERFORMANCE_PRAGMAS}
+
+
+def template(size, categories=7):
+    items = {}
+    for i in range(size):
+        items.setdefault(f"Category {i % categories}", []).append(f"Template task {i}")
+    return items
+
+
+def create_per_item(manager, name):
+    """The pre-transaction behaviour: one commit per statement"""
+    db = manager.db
+    project_id = db.execute_query('projects.insert', (manager.user_id, name, '')).lastrowid
+    for category, tasks in manager._load_default_checklists().items():
+        for task in tasks:
+            db.execute_query('items.insert_default', (project_id, category, task, False, False))
+    return project_id
+
+
+def create_batched(manager, name):
+    project_id, message = manager.create_project(name)
+    if project_id is None:
+        raise RuntimeError(message)
+    return project_id
+
+
+def run(profile, size, create, projects, directory):
+    db = open_database(os.path.join(directory, f"{profile}-{size}-{create.__name__}.db"),
+                       pragmas=PROFILES[profile])
+    manager = ProjectManager(create_user())
+    manager._load_default_checklists = lambda: template(size)
+    
+    commits = []
+    with db.pool.writer() as conn:
+        conn.set_trace_callback(
+            lambda sql: commits.append(sql) if sql.strip().upper() == 'COMMIT' else None
+        )
+    
+    start = time.perf_counter()
+    for i in range(projects):
+        create(manager, f"Project {i}")
+    elapsed = time.perf_counter() - start
+    
+    with db.pool.writer() as conn:
+        conn.set_trace_callback(None)
+    return len(commits) / projects, elapsed / projects * 1000
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--projects', type=int, default=5, help="projects created per run")
+    args = parser.parse_args()
+    
+    rows = []
+    with temp_dir() as directory:
+        for profile in PROFILES:
+            for size in TEMPLATE_SIZES:
+                for create in (create_per_item, create_batched):
+                    commits, ms = run(profile, size, create, args.projects, directory)
+                    label = 'per item' if create is create_per_item else 'one transaction'
+                    rows.append((profile, size, label, f"{commits:.0f}", f"{ms:.1f}"))
+    
+    print_table(('profile', 'items', 'seeding', 'commits/project', 'ms/project'), rows)
+
+
+if __name__ == '__main__':
+    main()
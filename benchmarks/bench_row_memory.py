@@ -0,0 +1,68 @@
+"""Memory held by loaded checklist rows: per-row dicts versus ChecklistRow.
+
+Rows are read from a real database with items.list, so every row arrives
+with its own copy of the category string, as in the app. Each layout is
+built from a fresh fetch under tracemalloc; the fetched tuples are then
+dropped, so what remains is what a screen or cache would keep. The
+per-row total includes the task text, which both layouts share.
+
+    python benchmarks/bench_row_memory.py [--items N] [--categories N]
+"""
+import argparse
+import gc
+import os
+import tracemalloc
+
+from common import create_user, fill_project, open_database, print_table, temp_dir
+from project_manager import ProjectManager
+from rows import ChecklistRow
+
+
+def as_dict(row):
+    """The dict each row used to be turned into"""
+    return {
+        'id': row[0],
+        'category': row[1],
+        'task': row[2],
+        'is_custom': bool(row[3]),
+        'is_completed': bool(row[4]),
+        'notes': row[5],
+        'due_date': row[6],
+        'completed_date': row[7],
+        'created_at': row[8],
+    }
+
+
+def measure(db, project_id, build):
+    gc.collect()
+    tracemalloc.start()
+    rows = db.fetch_all('items.list', (project_id,))
+    loaded = [build(row) for row in rows]
+    del rows
+    gc.collect()
+    held, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return len(loaded), held, peak
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--items', type=int, default=100000)
+    parser.add_argument('--categories', type=int, default=20)
+    args = parser.parse_args()
+    
+    with temp_dir() as directory:
+        db = open_database(os.path.join(directory, 'rows.db'))
+        project_id, _ = ProjectManager(create_user()).create_project("Row memory")
+        fill_project(db, project_id, args.items, categories=args.categories)
+        
+        rows = []
+        for label, build in (('dict', as_dict), ('ChecklistRow', ChecklistRow.from_row)):
+            count, held, peak = measure(db, project_id, build)
+            rows.append((label, count, f"{held / count:.0f}", f"{held / 2**20:.1f}", f"{peak / 2**20:.1f}"))
+    
+    print_table(('layout', 'rows', 'bytes/row', 'held MB', 'peak MB'), rows)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,93 @@
+"""Search-as-you-type latency through ChecklistManager.search_items.
+
+Builds --projects projects of --per-project items (100k in all by
+default). Tasks and notes are random phrases over a stage vocabulary, so
+short prefixes match thousands of rows per project. Each query is timed
+over --runs calls on one project, after a warm-up call, and checked
+against the 10 ms budget.
+
+    python benchmarks/bench_search.py [--projects N] [--per-project N] [--runs N]
+"""
+import argparse
+import os
+import random
+import statistics
+import time
+
+from common import create_user, open_database, print_table, temp_dir
+from checklist_manager import ChecklistManager
+from instrumentation import percentile
+
+# Latency budget per search, in milliseconds
+TARGET_MS = 10
+
+QUERIES = ('li', 'lig', 'light cue', 's', 'ca ble', 'scenedoor')
+
+SYLLABLES = [
+    'ca', 'ble', 'light', 'set', 'sound', 'prop', 'cue', 'stage', 'mic', 'cos', 'tume',
+    'check', 'rig', 'fly', 'bar', 'paint', 'scene', 'lamp', 'wire', 'tape', 'door', 'flat',
+    'gel', 'fog', 'haze', 'drum', 'ret', 'ake', 'on', 'ing', 'er', 'ment',
+]
+
+
+def vocabulary(rng, size=8000):
+    return sorted({
+        ''.join(rng.choice(SYLLABLES) for _ in range(rng.randint(1, 3)))
+        for _ in range(size)
+    })
+
+
+def fill(db, user_id, projects, per_project, rng):
+    words = vocabulary(rng)
+    
+    def phrase(low, high):
+        return ' '.join(rng.choice(words) for _ in range(rng.randint(low, high))) or None
+    
+    project_ids = []
+    for p in range(projects):
+        project_id = db.execute_query('projects.insert', (user_id, f"Production {p}", '')).lastrowid
+        rows = [
+            (project_id, f"Category {i % 12}", phrase(3, 8), True, False, phrase(0, 12),
+             None, None, None)
+            for i in range(per_project)
+        ]
+        with db.transaction():
+            db.execute_many('items.import', rows)
+        project_ids.append(project_id)
+    return project_ids
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--projects', type=int, default=20)
+    parser.add_argument('--per-project', type=int, default=5000)
+    parser.add_argument('--runs', type=int, default=40)
+    args = parser.parse_args()
+    
+    rows = []
+    with temp_dir() as directory:
+        db = open_database(os.path.join(directory, 'search.db'))
+        project_ids = fill(db, create_user(), args.projects, args.per_project, random.Random(2))
+        manager = ChecklistManager(project_ids[len(project_ids) // 2])
+        
+        for category in (None, 'Category 3'):
+            for text in QUERIES:
+                found = len(manager.search_items(text, category))
+                times = []
+                for _ in range(args.runs):
+                    start = time.perf_counter()
+                    manager.search_items(text, category)
+                    times.append((time.perf_counter() - start) * 1000)
+                median = statistics.median(times)
+                rows.append((
+                    repr(text), category or 'All', found, f"{median:.2f}",
+                    f"{percentile(times, 95):.2f}", 'ok' if median < TARGET_MS else 'SLOW'
+                ))
+    
+    print(f"{args.projects * args.per_project} items in {args.projects} projects, "
+          f"median of {args.runs} runs, budget {TARGET_MS} ms")
+    print_table(('query', 'category', 'results', 'p50 ms', 'p95 ms', ''), rows)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,113 @@
+"""Cold-start cost: import time of the app module and time to first frame.
+
+Import time comes from `python -X importtime -c "import app"` in a fresh
+interpreter: the total for app and the imports that cost the most on
+their own. Time to first frame starts a fresh interpreter that runs the
+app and exits on the window's first flip; it is measured from process
+spawn, as a user would see it. Both are the median over --runs.
+
+Needs Kivy and KivyMD installed and, for the first frame, a display.
+
+    python benchmarks/bench_startup.py [--runs N] [--top N] [--module M] [--skip-frame]
+"""
+import argparse
+import re
+import statistics
+import subprocess
+import sys
+import time
+
+from common import ROOT, print_table, probe_env, temp_dir
+
+IMPORTTIME_LINE = re.compile(r'import time:\s+(\d+)\s+\|\s+(\d+)\s+\|(\s*)(\S+)')
+
+FIRST_FRAME_PROBE = '''
+from kivy.core.window import Window
+from app import TheatreChecklistApp
+
+class FirstFrameApp(TheatreChecklistApp):
+    def on_start(self):
+        super().on_start()
+        Window.bind(on_flip=self._first_flip)
+    
+    def _first_flip(self, *args):
+        Window.unbind(on_flip=self._first_flip)
+        print("FIRST_FRAME", flush=True)
+        self.stop()
+
+FirstFrameApp().run()
+'''
+
+
+def import_times(module):
+    """(self_us, cumulative_us) per module for one fresh import of module"""
+    result = subprocess.run(
+        [sys.executable, '-X', 'importtime', '-c', f"import {module}"],
+        cwd=ROOT, env=probe_env(), capture_output=True, text=True
+    )
+    if result.returncode != 0:
+        raise RuntimeError(result.stderr.strip().splitlines()[-1])
+    times = {}
+    for line in result.stderr.splitlines():
+        match = IMPORTTIME_LINE.match(line)
+        if match:
+            times[match.group(4)] = (int(match.group(1)), int(match.group(2)))
+    return times
+
+
+def first_frame_time(directory):
+    start = time.perf_counter()
+    process = subprocess.Popen(
+        [sys.executable, '-c', FIRST_FRAME_PROBE],
+        cwd=directory, env=probe_env(), stdout=subprocess.PIPE, stderr=subprocess.DEVNULL,
+        text=True
+    )
+    for line in process.stdout:
+        if line.startswith('FIRST_FRAME'):
+            elapsed = time.perf_counter() - start
+            process.wait()
+            return elapsed
+    process.wait()
+    raise RuntimeError(f"the app exited with status {process.returncode} before drawing")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--runs', type=int, default=5)
+    parser.add_argument('--top', type=int, default=15, help="slowest imports listed")
+    parser.add_argument('--module', default='app', help="module whose import is timed")
+    parser.add_argument('--skip-frame', action='store_true', help="only measure imports")
+    args = parser.parse_args()
+    
+    try:
+        runs = [import_times(args.module) for _ in range(args.runs)]
+    except RuntimeError as e:
+        print(f"Could not import {args.module}: {e}")
+        return 1
+    
+    total = statistics.median(run[args.module][1] for run in runs)
+    print(f"import {args.module}: {total / 1000:.1f} ms cumulative (median of {args.runs})")
+    self_times = {
+        name: statistics.median(run[name][0] for run in runs if name in run)
+        for name in runs[0]
+    }
+    slowest = sorted(self_times.items(), key=lambda kv: kv[1], reverse=True)[:args.top]
+    print_table(('module', 'self ms'), [(name, f"{us / 1000:.1f}") for name, us in slowest])
+    
+    if not args.skip_frame:
+        try:
+            # Each run starts without a database, as on a first launch
+            frames = []
+            for _ in range(args.runs):
+                with temp_dir() as directory:
+                    frames.append(first_frame_time(directory))
+        except RuntimeError as e:
+            print(f"Could not time the first frame: {e}")
+            return 1
+        print(f"first frame: {statistics.median(frames) * 1000:.0f} ms from spawn "
+              f"(min {min(frames) * 1000:.0f}, max {max(frames) * 1000:.0f})")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
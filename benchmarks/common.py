@@ -0,0 +1,125 @@
+"""Helpers shared by the benchmark scripts.
+
+The scripts run from a checkout with `python benchmarks/<script>.py`.
+Each builds its databases in a temporary directory and never touches
+the app's own database file.
+"""
+import logging
+import os
+import resource
+import shutil
+import statistics
+import sys
+import tempfile
+import time
+from contextlib import contextmanager
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if ROOT not in sys.path:
+    sys.path.insert(0, ROOT)
+
+from database import DatabaseManager
+from instrumentation import slow_query_logger
+
+# Large batches trip the slow-query log; keep it out of the results
+slow_query_logger.addHandler(logging.NullHandler())
+slow_query_logger.propagate = False
+
+
+# Keeps Kivy from parsing a probe's arguments or writing its config and logs
+KIVY_ENV = {'KIVY_NO_ARGS': '1', 'KIVY_NO_CONFIG': '1', 'KIVY_NO_FILELOG': '1'}
+
+
+def probe_env():
+    """Environment for a child interpreter that imports the app and common.
+    
+    Probes run with a temporary working directory, so the database the app
+    opens on startup is created there rather than in the checkout.
+    """
+    env = dict(os.environ)
+    env.update(KIVY_ENV)
+    paths = [ROOT, os.path.join(ROOT, 'benchmarks'), env.get('PYTHONPATH', '')]
+    env['PYTHONPATH'] = os.pathsep.join(path for path in paths if path)
+    return env
+
+
+def open_database(path, **kwargs):
+    """A new DatabaseManager on path, replacing the process-wide instance"""
+    if DatabaseManager._instance is not None and DatabaseManager._instance._initialized:
+        DatabaseManager._instance.close_connection()
+    DatabaseManager._instance = None
+    return DatabaseManager(path, **kwargs)
+
+
+@contextmanager
+def temp_dir():
+    path = tempfile.mkdtemp(prefix='checklist-bench-')
+    try:
+        yield path
+    finally:
+        if DatabaseManager._instance is not None and DatabaseManager._instance._initialized:
+            DatabaseManager._instance.close_connection()
+        DatabaseManager._instance = None
+        shutil.rmtree(path, ignore_errors=True)
+
+
+def create_user(email='bench@example.com', password='benchmark'):
+    """Register and log in a user on the current database; returns the id"""
+    from auth import AuthManager
+    
+    auth = AuthManager()
+    auth.register_user(email, password)
+    auth.login_user(email, password)
+    return auth.current_user['id']
+
+
+def fill_project(db, project_id, count, categories=20, done_every=3, chunk=10000):
+    """Insert count synthetic items into a project in chunked transactions"""
+    for start in range(0, count, chunk):
+        rows = [
+            (project_id, f"Category {i % categories}", f"Task {i} cue light cable check",
+             True, i % done_every == 0)
+            for i in range(start, min(start + chunk, count))
+        ]
+        with db.transaction():
+            db.execute_many(
+                'INSERT INTO checklist_items (project_id, category, task, is_custom, is_completed) '
+                'VALUES (?, ?, ?, ?, ?)',
+                rows
+            )
+
+
+def median_time(func, runs=5):
+    """Median wall time of func() in seconds over runs calls"""
+    times = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        func()
+        times.append(time.perf_counter() - start)
+    return statistics.median(times)
+
+
+def current_rss_mb():
+    """Resident set size of this process, from /proc where available"""
+    try:
+        with open('/proc/self/statm') as f:
+            pages = int(f.read().split()[1])
+        return pages * os.sysconf('SC_PAGE_SIZE') / (1024 * 1024)
+    except (OSError, ValueError):
+        return peak_rss_mb()
+
+
+def peak_rss_mb():
+    """Peak resident set size of this process so far"""
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux reports KiB, macOS bytes
+    return peak / (1024 * 1024) if sys.platform == 'darwin' else peak / 1024
+
+
+def print_table(headers, rows):
+    widths = [
+        max(len(str(value)) for value in column)
+        for column in zip(headers, *rows)
+    ]
+    for row in [headers] + list(rows):
+        print('  '.join(str(value).rjust(width) for value, width in zip(row, widths)))
@@ -1,54 +1,182 @@
+import json
+import re
 from database import DatabaseManager
 from datetime import datetime
+from project_cache import project_cache, ProjectSnapshot
+from reminders import reminders
+from rows import ChecklistRow
+
+# Items per page for get_items_page / iter_checklist_items
+DEFAULT_PAGE_SIZE = 100
+
+# Projects up to this many items are loaded whole into the project cache
+# on their first page, so later pages, category filters and counts are
+# served from memory. Larger projects are paged from the database.
+SNAPSHOT_MAX_ITEMS = 20000
+
+MAX_TASK_LENGTH = 200
+
+# Results returned by search_items
+SEARCH_LIMIT = 50
+
+# Terms at least this long are matched as prefixes (the FTS index keeps
+# prefix tables from 2 characters; a 1-character prefix would scan)
+MIN_PREFIX_LENGTH = 2
+
+_SEARCH_TERM = re.compile(r'\w+')
+
+
+def validate_custom_item(category, task):
+    """Return an error message for an invalid custom item, or None.
+    
+    category and task are expected to be stripped already.
+    """
+    if not category:
+        return "Category is required"
+    if not task:
+        return "Task description is required"
+    if len(task) > MAX_TASK_LENGTH:
+        return f"Task description too long (max {MAX_TASK_LENGTH} characters)"
+    return None
+
+
+def build_search_query(project_id, text):
+    """Turn free text into an FTS5 MATCH expression scoped to a project.
+    
+    Every word must match task or notes, each as a prefix once it is
+    MIN_PREFIX_LENGTH long, so the expression follows the user's typing.
+    Words are quoted, so FTS5 syntax in the input is matched literally.
+    Returns None when the text holds no words.
+    """
+    terms = [
+        f'"{term}"*' if len(term) >= MIN_PREFIX_LENGTH else f'"{term}"'
+        for term in _SEARCH_TERM.findall(text)
+    ]
+    if not terms:
+        return None
+    return f'project_id:{int(project_id)} AND {{task notes}}: ({" ".join(terms)})'
+
 
 class ChecklistManager:
     def __init__(self, project_id):
         self.db = DatabaseManager()
         self.project_id = project_id
     
+    def _snapshot(self):
+        """The project's cached snapshot, loading every item on a miss"""
+        snapshot = project_cache.get(self.project_id)
+        if snapshot is None:
+            snapshot = self._load_snapshot()
+        return snapshot
+    
+    def _load_snapshot(self):
+        generation = project_cache.generation(self.project_id)
+        results = self.db.fetch_all('items.list', (self.project_id,))
+        items = [self._row_to_item(row) for row in results]
+        snapshot = project_cache.load(self.project_id, items, generation)
+        if snapshot is None:
+            # A write landed while loading; serve this once uncached
+            snapshot = ProjectSnapshot(self.project_id, items)
+        return snapshot
+    
     def get_checklist_items(self, category_filter=None):
         try:
-            query = '''
-                SELECT id, category, task, is_custom, is_completed, notes, due_date, completed_date
-                FROM checklist_items 
-                WHERE project_id = ?
-            '''
-            params = [self.project_id]
+            snapshot = self._snapshot()
+            with project_cache.lock:
+                return snapshot.items(category_filter)
+        except Exception as e:
+            print(f"Error getting checklist items: {e}")
+            return []
+    
+    
+    def get_items_page(self, category_filter=None, after=None, limit=DEFAULT_PAGE_SIZE):
+        """Return (items, cursor); pass cursor as after for the next page"""
+        try:
+            # Serve from the cached snapshot. On a miss the first page loads
+            # it for projects small enough; larger ones page from the database
+            # on the (category, created_at, id) key. cursor is None at the end
+            snapshot = project_cache.get(self.project_id)
+            if snapshot is None and after is None and self._fits_snapshot():
+                snapshot = self._load_snapshot()
+            if snapshot is not None:
+                with project_cache.lock:
+                    items = snapshot.page(category_filter, after, limit)
+            else:
+                items = [self._row_to_item(row) for row in self._fetch_page(category_filter, after, limit)]
+            
+            cursor = items[-1].sort_key if len(items) == limit else None
+            return items, cursor
+        except Exception as e:
+            print(f"Error getting checklist page: {e}")
+            return [], None
+    
+    def _fits_snapshot(self):
+        # Read from the per-category counters, not a count over the items
+        total = self.db.fetch_one('stats.progress', (self.project_id,))[0]
+        return total <= SNAPSHOT_MAX_ITEMS
+    
+    def _fetch_page(self, category_filter, after, limit):
+        if category_filter and category_filter != "All":
+            if after is None:
+                return self.db.fetch_all(
+                    'items.page_by_category', (self.project_id, category_filter, limit)
+                )
+            return self.db.fetch_all(
+                'items.page_by_category_after',
+                (self.project_id, category_filter, after[1], after[2], limit)
+            )
+        
+        if after is None:
+            return self.db.fetch_all('items.page', (self.project_id, limit))
+        return self.db.fetch_all('items.page_after', (self.project_id, *after, limit))
+    
+    def iter_checklist_items(self, category_filter=None, chunk_size=DEFAULT_PAGE_SIZE):
+        """Yield the list in chunks of up to chunk_size items"""
+        cursor = None
+        while True:
+            items, cursor = self.get_items_page(category_filter, cursor, chunk_size)
+            if items:
+                yield items
+            if cursor is None:
+                return
+    
+    def search_items(self, text, category_filter=None, limit=SEARCH_LIMIT):
+        """Items whose task or notes match text, best match first"""
+        try:
+            query = build_search_query(self.project_id, text)
+            if query is None:
+                return []
             
             if category_filter and category_filter != "All":
-                query += ' AND category = ?'
-                params.append(category_filter)
-            
-            query += ' ORDER BY category, created_at'
-            
-            results = self.db.fetch_all(query, params)
-            
-            items = []
-            for row in results:
-                items.append({
-                    'id': row[0],
-                    'category': row[1],
-                    'task': row[2],
-                    'is_custom': bool(row[3]),
-                    'is_completed': bool(row[4]),
-                    'notes': row[5],
-                    'due_date': row[6],
-                    'completed_date': row[7]
-                })
-            
-            return items
+                results = self.db.fetch_all(
+                    'items.search_by_category', (query, category_filter, limit)
+                )
+            else:
+                results = self.db.fetch_all('items.search', (query, limit))
+            return [self._row_to_item(row) for row in results]
         except Exception as e:
-            print(f"Error getting checklist items: {e}")
+            print(f"Error searching checklist items: {e}")
             return []
     
+    def get_item(self, item_id):
+        try:
+            row = self.db.fetch_one('items.by_id', (item_id, self.project_id))
+            return self._row_to_item(row) if row else None
+        except Exception as e:
+            print(f"Error getting checklist item: {e}")
+            return None
+    
+    def _row_to_item(self, row):
+        return ChecklistRow.from_row(row)
+    
     def get_categories(self):
         try:
-            results = self.db.fetch_all('''
-                SELECT DISTINCT category 
-                FROM checklist_items 
-                WHERE project_id = ? 
-                ORDER BY category
-            ''', (self.project_id,))
+            snapshot = project_cache.get(self.project_id)
+            if snapshot is not None:
+                with project_cache.lock:
+                    return snapshot.categories()
+            
+            results = self.db.fetch_all('items.categories', (self.project_id,))
             
             categories = [row[0] for row in results]
             return categories
@@ -61,70 +189,225 @@ class ChecklistManager:
             category = category.strip()
             task = task.strip()
             
-            if not category:
-                return None, "Category is required"
-            if not task:
-                return None, "Task description is required"
-            if len(task) > 200:
-                return None, "Task description too long (max 200 characters)"
+            error = validate_custom_item(category, task)
+            if error:
+                return None, error
             
-            cursor = self.db.execute_query('''
-                INSERT INTO checklist_items 
-                (project_id, category, task, is_custom, is_completed, due_date)
-                VALUES (?, ?, ?, ?, ?, ?)
-            ''', (self.project_id, category, task, True, False, due_date))
+            with self.db.transaction():
+                cursor = self.db.execute_query(
+                    'items.insert_custom',
+                    (self.project_id, category, task, True, False, due_date)
+                )
+                item = self.get_item(cursor.lastrowid)
             
-            return cursor.lastrowid, "Task added successfully"
+            if item is not None:
+                project_cache.put_item(self.project_id, item)
+                reminders.update_item(self.project_id, item)
+            return item, "Task added successfully"
         except Exception as e:
             print(f"Error adding custom item: {e}")
             return None, "Failed to add task"
     
     def update_item_status(self, item_id, is_completed):
+        """Set an item's completion; returns the updated item, or None"""
         try:
             completed_date = datetime.now() if is_completed else None
             
-            self.db.execute_query('''
-                UPDATE checklist_items 
-                SET is_completed = ?, completed_date = ?
-                WHERE id = ? AND project_id = ?
-            ''', (is_completed, completed_date, item_id, self.project_id))
+            with self.db.transaction():
+                self.db.execute_query(
+                    'items.update_status',
+                    (is_completed, completed_date, item_id, self.project_id)
+                )
+                item = self.get_item(item_id)
             
-            return True
+            if item is not None:
+                project_cache.put_item(self.project_id, item)
+                reminders.update_item(self.project_id, item)
+            return item
         except Exception as e:
             print(f"Error updating item status: {e}")
+            return None
+    
+    def apply_edits(self, edits):
+        """Write {item_id: {'is_completed': ..., 'notes': ...}} in one transaction.
+        
+        Either field may be absent for an item. Returns True on success;
+        on failure nothing is written.
+        """
+        try:
+            # Same text sqlite3 stores for a datetime parameter
+            now = datetime.now().isoformat(' ')
+            status_rows = [
+                (changes['is_completed'], now if changes['is_completed'] else None,
+                 item_id, self.project_id)
+                for item_id, changes in edits.items() if 'is_completed' in changes
+            ]
+            notes_rows = [
+                (changes['notes'], item_id, self.project_id)
+                for item_id, changes in edits.items() if 'notes' in changes
+            ]
+            
+            with self.db.transaction():
+                if status_rows:
+                    self.db.execute_many('items.update_status', status_rows)
+                if notes_rows:
+                    self.db.execute_many('items.update_notes', notes_rows)
+            
+            snapshot = project_cache.peek(self.project_id)
+            if snapshot is not None:
+                for item_id, changes in edits.items():
+                    with project_cache.lock:
+                        item = snapshot.items_by_id.get(item_id)
+                    if item is None:
+                        continue
+                    if 'is_completed' in changes:
+                        changes = dict(changes, completed_date=now if changes['is_completed'] else None)
+                    project_cache.put_item(self.project_id, item.replace(**changes))
+            
+            statuses = {
+                item_id: changes['is_completed']
+                for item_id, changes in edits.items() if 'is_completed' in changes
+            }
+            if any(not is_completed for is_completed in statuses.values()):
+                reminders.refresh_project(self.project_id)
+            else:
+                reminders.remove_items(statuses)
+            return True
+        except Exception as e:
+            print(f"Error applying edits: {e}")
             return False
     
+    def complete_items(self, item_ids=None, category=None, predicate=None):
+        return self.set_items_status(True, item_ids, category, predicate)
+    
+    def reset_items(self, item_ids=None, category=None, predicate=None):
+        return self.set_items_status(False, item_ids, category, predicate)
+    
+    def set_items_status(self, is_completed, item_ids=None, category=None, predicate=None):
+        """Set the status of the items picked by item_ids, category or predicate.
+        
+        Returns the number of items changed, or None on error.
+        """
+        try:
+            completed_date = datetime.now() if is_completed else None
+            # Both statements skip items already in the target state, so
+            # their completed_date is kept
+            with self.db.transaction():
+                if predicate is None and item_ids is None and category is not None:
+                    cursor = self.db.execute_query(
+                        'items.set_status_by_category',
+                        (is_completed, completed_date, self.project_id, is_completed, category)
+                    )
+                else:
+                    cursor = self.db.execute_query(
+                        'items.set_status_by_ids',
+                        (is_completed, completed_date, self._selection(item_ids, category, predicate),
+                         self.project_id, is_completed)
+                    )
+            
+            project_cache.invalidate(self.project_id)
+            reminders.refresh_project(self.project_id)
+            return cursor.rowcount
+        except Exception as e:
+            print(f"Error updating items: {e}")
+            return None
+    
+    def delete_custom_items(self, item_ids=None, category=None, predicate=None):
+        """Delete the custom items in a selection with one DELETE.
+        
+        Built-in items in the selection are kept. Returns the number of
+        items deleted, or None on error.
+        """
+        try:
+            with self.db.transaction():
+                cursor = self.db.execute_query(
+                    'items.delete_custom_by_ids',
+                    (self._selection(item_ids, category, predicate), self.project_id)
+                )
+            
+            project_cache.invalidate(self.project_id)
+            reminders.refresh_project(self.project_id)
+            return cursor.rowcount
+        except Exception as e:
+            print(f"Error deleting items: {e}")
+            return None
+    
+    def move_items(self, new_category, item_ids=None, category=None, predicate=None):
+        """Move a selection of items to new_category with one UPDATE.
+        
+        Returns the number of items moved, or None if new_category is
+        empty or on error.
+        """
+        try:
+            new_category = new_category.strip()
+            if not new_category:
+                return None
+            
+            with self.db.transaction():
+                cursor = self.db.execute_query(
+                    'items.move_by_ids',
+                    (new_category, self._selection(item_ids, category, predicate),
+                     self.project_id, new_category)
+                )
+            
+            project_cache.invalidate(self.project_id)
+            return cursor.rowcount
+        except Exception as e:
+            print(f"Error moving items: {e}")
+            return None
+    
+    def _selection(self, item_ids, category, predicate):
+        """Resolve a selection to the JSON id array the bulk statements take"""
+        if item_ids is None and category is None and predicate is None:
+            raise ValueError("No items selected")
+        
+        # predicate(item) returns True to include an item, within category
+        # when that is given too
+        if predicate is not None or item_ids is None:
+            snapshot = self._snapshot()
+            with project_cache.lock:
+                items = snapshot.items(category)
+            wanted = None if item_ids is None else set(item_ids)
+            item_ids = [
+                item['id'] for item in items
+                if (wanted is None or item['id'] in wanted)
+                and (predicate is None or predicate(item))
+            ]
+        return json.dumps(list(item_ids))
+    
     def update_item_notes(self, item_id, notes):
+        """Replace an item's notes; returns the updated item, or None"""
         try:
-            self.db.execute_query('''
-                UPDATE checklist_items 
-                SET notes = ?
-                WHERE id = ? AND project_id = ?
-            ''', (notes, item_id, self.project_id))
+            with self.db.transaction():
+                self.db.execute_query('items.update_notes', (notes, item_id, self.project_id))
+                item = self.get_item(item_id)
             
-            return True
+            if item is not None:
+                project_cache.put_item(self.project_id, item)
+            return item
         except Exception as e:
             print(f"Error updating item notes: {e}")
-            return False
+            return None
     
     def delete_custom_item(self, item_id):
+        """Delete a custom item; returns the item as it was, or None"""
         try:
-            self.db.execute_query('''
-                DELETE FROM checklist_items 
-                WHERE id = ? AND project_id = ? AND is_custom = 1
-            ''', (item_id, self.project_id))
+            with self.db.transaction():
+                item = self.get_item(item_id)
+                if item is None or not item['is_custom']:
+                    return None
+                self.db.execute_query('items.delete_custom', (item_id, self.project_id))
             
-            return True
+            project_cache.remove_item(self.project_id, item_id)
+            reminders.remove_items([item_id])
+            return item
         except Exception as e:
             print(f"Error deleting custom item: {e}")
-            return False
+            return None
     
     def get_item_count(self):
         try:
-            result = self.db.fetch_one(
-                'SELECT COUNT(*) as count FROM checklist_items WHERE project_id = ?',
-                (self.project_id,)
-            )
+            result = self.db.fetch_one('items.count', (self.project_id,))
             return result[0] if result else 0
         except Exception as e:
             print(f"Error getting item count: {e}")
@@ -3,46 +3,278 @@ import json
 import os
 from datetime import datetime
 import threading
+import queue
+import time
 import atexit
+import functools
+from contextlib import contextmanager
+from statements import StatementRegistry, DEFAULT_STATEMENT_CACHE_SIZE
+from instrumentation import QueryInstrumentation
+from migrations import Migrator
+
+# Seconds a connection waits on a lock held by another connection before
+# raising "database is locked". Used both as the sqlite3.connect timeout and
+# as the busy_timeout PRAGMA, which would otherwise override it.
+BUSY_TIMEOUT = 30.0
+
+# Connection tuning applied whenever a connection is opened. WAL lets
+# readers (stats, export) proceed while the UI writes; NORMAL sync is
+# durable across application crashes and only risks the last commits
+# on power loss.
+PERFORMANCE_PRAGMAS = {
+    'journal_mode': 'WAL',
+    'synchronous': 'NORMAL',
+    'cache_size': -16000,        # negative means KiB, so ~16 MB
+    'mmap_size': 64 * 1024 * 1024,
+    'temp_store': 'MEMORY',
+    'busy_timeout': int(BUSY_TIMEOUT * 1000),  # milliseconds
+}
+
+# SQLite's own defaults (rollback journal, FULL sync), kept for comparison.
+# journal_mode is named explicitly because WAL is stored in the database
+# file and outlives the connection that set it.
+DEFAULT_PRAGMAS = {
+    'journal_mode': 'DELETE',
+    'synchronous': 'FULL',
+}
+
+# Rows fetched per round trip by DatabaseManager.stream
+DEFAULT_STREAM_CHUNK_SIZE = 500
+
+
+class ConnectionPool:
+    """A single writer connection plus a bounded set of reader connections.
+    
+    SQLite allows one writer at a time, so every write goes through the
+    writer connection, which a thread holds for the length of a statement
+    or transaction (re-entrantly). Reads check out a reader connection, so
+    stats, export and list loading run alongside writes. A thread that
+    holds the writer reads through it, so it sees its own uncommitted writes.
+    """
+    
+    def __init__(self, connect, max_readers=4, on_close=None):
+        self._connect = connect
+        self._on_close = on_close
+        self.max_readers = max_readers
+        
+        self._writer = None
+        self._writer_lock = threading.RLock()
+        self._writer_owner = None
+        self._writer_holds = 0
+        
+        self._idle_readers = queue.LifoQueue()
+        self._readers = []
+        self._readers_lock = threading.Lock()
+        
+        self._stats_lock = threading.Lock()
+        self._stats = {'checkouts': 0, 'waits': 0, 'in_use': 0}
+    
+    def _count(self, key, delta=1):
+        with self._stats_lock:
+            self._stats[key] += delta
+    
+    def holds_writer(self):
+        return self._writer_owner == threading.get_ident()
+    
+    @contextmanager
+    def writer(self):
+        if not self._writer_lock.acquire(blocking=False):
+            self._count('waits')
+            self._writer_lock.acquire()
+        
+        try:
+            if self._writer_holds == 0:
+                self._writer_owner = threading.get_ident()
+                self._count('checkouts')
+                self._count('in_use')
+            self._writer_holds += 1
+            
+            if self._writer is None:
+                self._writer = self._connect()
+            yield self._writer
+        finally:
+            self._writer_holds -= 1
+            if self._writer_holds == 0:
+                self._writer_owner = None
+                self._count('in_use', -1)
+            self._writer_lock.release()
+    
+    @contextmanager
+    def reader(self):
+        if self.max_readers == 0 or self.holds_writer():
+            with self.writer() as conn:
+                yield conn
+            return
+        
+        conn = self._checkout_reader()
+        try:
+            yield conn
+        finally:
+            self._idle_readers.put(conn)
+            self._count('in_use', -1)
+    
+    def _checkout_reader(self):
+        try:
+            conn = self._idle_readers.get_nowait()
+        except queue.Empty:
+            conn = None
+            with self._readers_lock:
+                if len(self._readers) < self.max_readers:
+                    conn = self._connect()
+                    self._readers.append(conn)
+            if conn is None:
+                self._count('waits')
+                conn = self._idle_readers.get()
+        
+        self._count('checkouts')
+        self._count('in_use')
+        return conn
+    
+    def reconnect_writer(self):
+        """Replace the writer connection; the caller must hold the writer"""
+        if self._writer is not None:
+            self._close(self._writer)
+        self._writer = self._connect()
+        return self._writer
+    
+    def _close(self, conn):
+        if self._on_close is not None:
+            self._on_close(conn)
+        conn.close()
+    
+    def stats(self):
+        with self._stats_lock:
+            stats = dict(self._stats)
+        stats['readers_open'] = len(self._readers)
+        stats['max_readers'] = self.max_readers
+        return stats
+    
+    def close_all(self):
+        with self._writer_lock:
+            if self._writer is not None:
+                self._close(self._writer)
+                self._writer = None
+        
+        with self._readers_lock:
+            while True:
+                try:
+                    self._idle_readers.get_nowait()
+                except queue.Empty:
+                    break
+            for conn in self._readers:
+                self._close(conn)
+            self._readers = []
+
 
 class DatabaseManager:
     _instance = None
     _lock = threading.Lock()
     
-    def __new__(cls):
+    def __new__(cls, *args, **kwargs):
         with cls._lock:
             if cls._instance is None:
                 cls._instance = super(DatabaseManager, cls).__new__(cls)
                 cls._instance._initialized = False
             return cls._instance
     
-    def __init__(self, db_name='theatre_checklists.db'):
+    def __init__(self, db_name='theatre_checklists.db', pragmas=None, max_readers=4,
+                 statement_cache_size=DEFAULT_STATEMENT_CACHE_SIZE, auto_migrate=True):
         if not self._initialized:
             self.db_name = db_name
-            self._connection = None
+            self.pragmas = dict(PERFORMANCE_PRAGMAS if pragmas is None else pragmas)
+            self.statements = StatementRegistry(cache_size=statement_cache_size)
+            self.instrumentation = QueryInstrumentation()
+            # Every connection to an in-memory database is a separate
+            # database, so there everything shares the writer
+            if db_name == ':memory:':
+                max_readers = 0
+            self.pool = ConnectionPool(self._connect, max_readers, on_close=self.statements.forget)
+            self._local = threading.local()
             self._initialized = True
             self.init_database()
+            if auto_migrate:
+                self.migrate()
             atexit.register(self.close_connection)
     
-    def get_connection(self):
-        if self._connection is None:
-            self._connection = sqlite3.connect(
-                self.db_name, 
-                check_same_thread=False,
-                timeout=30.0
-            )
-            self._connection.row_factory = sqlite3.Row
-            # Enable foreign keys
-            self._connection.execute("PRAGMA foreign_keys = ON")
-        return self._connection
+    def _connect(self):
+        conn = sqlite3.connect(
+            self.db_name, 
+            check_same_thread=False,
+            timeout=BUSY_TIMEOUT,
+            cached_statements=self.statements.cache_size
+        )
+        conn.row_factory = sqlite3.Row
+        # Enable foreign keys
+        conn.execute("PRAGMA foreign_keys = ON")
+        self._apply_pragmas(conn)
+        return conn
+    
+    def _apply_pragmas(self, conn):
+        for name, value in self.pragmas.items():
+            try:
+                conn.execute(f"PRAGMA {name} = {value}")
+            except sqlite3.Error as e:
+                print(f"Could not set PRAGMA {name}: {e}")
+    
+    def _transaction_depth(self):
+        return getattr(self._local, 'depth', 0)
+    
+    def in_transaction(self):
+        return self._transaction_depth() > 0
+    
+    @contextmanager
+    def transaction(self):
+        """Group writes under a single commit.
+        
+        The outermost block opens a transaction and commits it on success;
+        nested blocks use savepoints so an inner failure only rolls back its
+        own writes. Any exception rolls back and is re-raised. The calling
+        thread holds the writer connection for the whole block.
+        """
+        with self.pool.writer() as conn:
+            depth = self._transaction_depth()
+            
+            if depth == 0:
+                # Discard any implicit transaction left behind by a failed statement
+                if conn.in_transaction:
+                    conn.rollback()
+                conn.execute("BEGIN")
+            else:
+                conn.execute(f"SAVEPOINT sp_{depth}")
+            
+            self._local.depth = depth + 1
+            try:
+                yield conn
+            except BaseException:
+                self._local.depth = depth
+                if depth == 0:
+                    conn.rollback()
+                else:
+                    conn.execute(f"ROLLBACK TO SAVEPOINT sp_{depth}")
+                    conn.execute(f"RELEASE SAVEPOINT sp_{depth}")
+                raise
+            else:
+                self._local.depth = depth
+                if depth == 0:
+                    conn.commit()
+                else:
+                    conn.execute(f"RELEASE SAVEPOINT sp_{depth}")
+    
+    def pool_stats(self):
+        return self.pool.stats()
     
     def close_connection(self):
-        if self._connection:
-            self._connection.close()
-            self._connection = None
+        self.pool.close_all()
     
     def init_database(self):
-        conn = self.get_connection()
+        with self.pool.writer() as conn:
+            self._create_schema(conn)
+    
+    def migrate(self, target=None, dry_run=False, progress_callback=None):
+        """Bring the schema up to date (see migrations.py)"""
+        return Migrator(self).migrate(target, dry_run, progress_callback)
+    
+    def _create_schema(self, conn):
         cursor = conn.cursor()
         
         # Users table
@@ -84,38 +316,138 @@ class DatabaseManager:
             )
         ''')
         
-        # Create indexes for better performance
-        cursor.execute('CREATE INDEX IF NOT EXISTS idx_projects_user_id ON projects(user_id)')
-        cursor.execute('CREATE INDEX IF NOT EXISTS idx_items_project_id ON checklist_items(project_id)')
-        cursor.execute('CREATE INDEX IF NOT EXISTS idx_items_category ON checklist_items(category)')
-        cursor.execute('CREATE INDEX IF NOT EXISTS idx_items_completed ON checklist_items(is_completed)')
+        # Resume points for chunked migration backfills (see migrations.py)
+        cursor.execute('''
+            CREATE TABLE IF NOT EXISTS schema_migration_progress (
+                version INTEGER NOT NULL,
+                backfill TEXT NOT NULL,
+                last_key INTEGER NOT NULL,
+                PRIMARY KEY (version, backfill)
+            )
+        ''')
         
         conn.commit()
     
+    def _run(self, conn, query, params, fetch=None, many=False):
+        """Run one statement on conn, recording timings for it.
+        
+        fetch, if given, is applied to the cursor and its result returned
+        instead of the cursor; fetching is timed separately from execution.
+        """
+        name, sql = self.statements.resolve(query)
+        if many:
+            params = list(params)
+        
+        start = time.perf_counter()
+        if many:
+            cursor = conn.executemany(sql, params)
+        else:
+            cursor = conn.execute(sql, params)
+        executed = time.perf_counter()
+        
+        if fetch is None:
+            result = cursor
+            rows = max(cursor.rowcount, 0)
+        else:
+            try:
+                result = fetch(cursor)
+            finally:
+                # Close the cursor so a reader doesn't keep a stale snapshot open
+                cursor.close()
+            if isinstance(result, list):
+                rows = len(result)
+            else:
+                rows = 0 if result is None else 1
+        done = time.perf_counter()
+        
+        self.statements.record(name, sql, done - start, conn)
+        self.instrumentation.record(
+            name, sql, len(params), rows, executed - start, done - executed,
+            conn=conn, params=(params[0] if params else ()) if many else params
+        )
+        return result
+    
     def execute_query(self, query, params=()):
-        """Execute a query with proper error handling"""
-        try:
-            conn = self.get_connection()
-            cursor = conn.cursor()
-            cursor.execute(query, params)
-            conn.commit()
-            return cursor
-        except sqlite3.Error as e:
-            print(f"Database error: {e}")
-            # Try to reconnect if connection is lost
-            if "database is locked" in str(e):
-                self.close_connection()
-                conn = self.get_connection()
-                cursor = conn.cursor()
-                cursor.execute(query, params)
-                conn.commit()
+        """Execute a query with proper error handling.
+        
+        query is either a name from the statement registry or raw SQL.
+        """
+        with self.pool.writer() as conn:
+            try:
+                cursor = self._run(conn, query, params)
+                # Inside a transaction the outermost block commits
+                if not self.in_transaction():
+                    conn.commit()
                 return cursor
-            raise
+            except sqlite3.Error as e:
+                print(f"Database error: {e}")
+                # Try to reconnect if connection is lost; reconnecting would
+                # silently drop an open transaction, so let that one propagate
+                if "database is locked" in str(e) and not self.in_transaction():
+                    conn = self.pool.reconnect_writer()
+                    cursor = self._run(conn, query, params)
+                    conn.commit()
+                    return cursor
+                raise
+    
+    def execute_many(self, query, seq_of_params):
+        with self.pool.writer() as conn:
+            cursor = self._run(conn, query, seq_of_params, many=True)
+            if not self.in_transaction():
+                conn.commit()
+            return cursor
     
     def fetch_all(self, query, params=()):
-        cursor = self.execute_query(query, params)
-        return cursor.fetchall()
+        with self.pool.reader() as conn:
+            return self._run(conn, query, params, fetch=lambda cursor: cursor.fetchall())
     
     def fetch_one(self, query, params=()):
-        cursor = self.execute_query(query, params)
-        return cursor.fetchone()
\ No newline at end of file
+        with self.pool.reader() as conn:
+            return self._run(conn, query, params, fetch=lambda cursor: cursor.fetchone())
+    
+    def stream(self, query, params=(), chunk_size=DEFAULT_STREAM_CHUNK_SIZE):
+        """Yield the rows of a read query in lists of up to chunk_size.
+        
+        One reader connection is held, and the query sees one snapshot,
+        until the generator is exhausted or closed. Only time spent in
+        SQLite is recorded, not time the consumer spends between chunks.
+        """
+        name, sql = self.statements.resolve(query)
+        with self.pool.reader() as conn:
+            start = time.perf_counter()
+            cursor = conn.execute(sql, params)
+            exec_time = time.perf_counter() - start
+            fetch_time = 0.0
+            rows = 0
+            try:
+                while True:
+                    fetch_start = time.perf_counter()
+                    chunk = cursor.fetchmany(chunk_size)
+                    fetch_time += time.perf_counter() - fetch_start
+                    if not chunk:
+                        break
+                    rows += len(chunk)
+                    yield chunk
+            finally:
+                cursor.close()
+                self.statements.record(name, sql, exec_time + fetch_time, conn)
+                self.instrumentation.record(
+                    name, sql, len(params), rows, exec_time, fetch_time,
+                    conn=conn, params=params
+                )
+    
+    def statement_stats(self):
+        return self.statements.stats()
+    
+    def query_report(self, file_path=None):
+        """Query and action aggregates as JSON (see QueryInstrumentation)"""
+        return self.instrumentation.export_json(file_path)
+
+
+def timed_action(func):
+    """Attribute the queries a UI handler runs to that handler by name"""
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        with DatabaseManager().instrumentation.action(func.__name__):
+            return func(*args, **kwargs)
+    return wrapper
\ No newline at end of file
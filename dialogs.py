@@ -134,6 +134,64 @@ class AddCustomItemDialog:
         self.category_input.text = ""
         self.dialog.open()
 
+class MoveItemsDialog:
+    def __init__(self, app, categories, callback):
+        self.app = app
+        self.categories = categories
+        self.callback = callback
+        self.dialog = None
+        self.create_dialog()
+    
+    def create_dialog(self):
+        hint = "Category *"
+        if self.categories:
+            hint = f"Category * (e.g. {', '.join(self.categories[:3])})"
+        
+        self.category_input = MDTextField(
+            hint_text=hint,
+            mode="rectangle",
+            max_text_length=50
+        )
+        
+        content = MDBoxLayout(
+            orientation="vertical",
+            adaptive_height=True,
+            spacing="10dp",
+            padding="10dp"
+        )
+        content.add_widget(self.category_input)
+        
+        self.dialog = MDDialog(
+            title="Move Tasks",
+            type="custom",
+            content_cls=content,
+            buttons=[
+                MDFlatButton(
+                    text="CANCEL",
+                    theme_text_color="Custom",
+                    on_release=lambda x: self.dialog.dismiss()
+                ),
+                MDFlatButton(
+                    text="MOVE",
+                    theme_text_color="Custom",
+                    on_release=self.move_items
+                ),
+            ],
+        )
+    
+    def move_items(self, instance):
+        category = self.category_input.text.strip()
+        
+        if category:
+            self.callback(category)
+            self.dialog.dismiss()
+        else:
+            self.app.show_toast("Category is required")
+    
+    def open(self):
+        self.category_input.text = ""
+        self.dialog.open()
+
 class NotesDialog:
     def __init__(self, app, task_name, current_notes, callback):
         self.app = app
@@ -290,7 +348,9 @@ class ExportDialog:
             type="simple",
             items=[
                 "CSV Format (Excel compatible)",
-                "JSON Format (Backup)"
+                "JSON Format (Backup)",
+                "NDJSON, compressed (fast transfer)",
+                "SQLite Snapshot (another device)"
             ],
             buttons=[
                 MDFlatButton(
@@ -313,6 +373,18 @@ class ExportDialog:
             theme_text_color="Custom",
             on_release=lambda x: self.export_selected('json')
         ))
+        
+        self.dialog.buttons[0].parent.add_widget(MDFlatButton(
+            text="NDJSON",
+            theme_text_color="Custom",
+            on_release=lambda x: self.export_selected('ndjson')
+        ))
+        
+        self.dialog.buttons[0].parent.add_widget(MDFlatButton(
+            text="SNAPSHOT",
+            theme_text_color="Custom",
+            on_release=lambda x: self.export_selected('snapshot')
+        ))
     
     def export_selected(self, format_type):
         self.dialog.dismiss()
@@ -0,0 +1,53 @@
+from database import DatabaseManager
+from datetime import date, timedelta
+from rows import ChecklistRow
+
+# Items returned by the due-date queries unless a limit is given
+DEFAULT_DUE_LIMIT = 50
+
+# Days covered by get_due_this_week, today included
+WEEK_DAYS = 7
+
+
+class DueManager:
+    """Open items by due date across every project of a user.
+    
+    Due dates are compared as ISO strings, so a date-only due date sorts
+    before any time on that day. An item is overdue once its due date is
+    before today, matching ProjectManager.get_dashboard.
+    """
+    
+    def __init__(self, user_id):
+        self.db = DatabaseManager()
+        self.user_id = user_id
+    
+    def get_overdue(self, limit=DEFAULT_DUE_LIMIT):
+        """Open items due before today, oldest first"""
+        return self._fetch('due.overdue', (self.user_id, date.today().isoformat(), limit))
+    
+    def get_due_this_week(self, limit=DEFAULT_DUE_LIMIT):
+        """Open items due from today through the next WEEK_DAYS - 1 days"""
+        today = date.today()
+        return self._fetch('due.between', (
+            self.user_id, today.isoformat(),
+            (today + timedelta(days=WEEK_DAYS)).isoformat(), limit
+        ))
+    
+    def get_next_due(self, n=10):
+        """The next n open items due from today on"""
+        return self._fetch('due.upcoming', (self.user_id, date.today().isoformat(), n))
+    
+    def _fetch(self, query, params):
+        try:
+            results = self.db.fetch_all(query, params)
+            return [
+                {
+                    'project_id': row[0],
+                    'project_name': row[1],
+                    'item': ChecklistRow.from_row(row[2:])
+                }
+                for row in results
+            ]
+        except Exception as e:
+            print(f"Error getting due items: {e}")
+            return []
@@ -0,0 +1,138 @@
+import itertools
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from export_manager import ExportManager, ExportCancelled
+
+# Exports that may run at once; each holds one reader connection
+DEFAULT_EXPORT_WORKERS = 2
+
+# ExportJob.status values
+QUEUED = 'queued'
+RUNNING = 'running'
+DONE = 'done'
+FAILED = 'failed'
+CANCELLED = 'cancelled'
+
+FINISHED = (DONE, FAILED, CANCELLED)
+
+
+class ExportJob:
+    """One export of one project to one file.
+    
+    The worker thread updates status and rows_written as it goes; other
+    threads only read them, so the UI can poll a job without locking.
+    """
+    
+    def __init__(self, job_id, project_id, format_type, file_path, options=None):
+        self.job_id = job_id
+        self.project_id = project_id
+        self.format_type = format_type
+        self.file_path = file_path
+        # Passed through to ExportManager.export, e.g. compression
+        self.options = dict(options or {})
+        self.status = QUEUED
+        self.rows_written = 0
+        self.message = ""
+        self.started_at = None
+        self.finished_at = None
+        self._cancel = threading.Event()
+    
+    @property
+    def finished(self):
+        return self.status in FINISHED
+    
+    def cancel(self):
+        """Ask the job to stop; it ends after its current chunk"""
+        self._cancel.set()
+    
+    def elapsed(self):
+        if self.started_at is None:
+            return 0.0
+        return (self.finished_at or time.perf_counter()) - self.started_at
+    
+    def throughput(self):
+        """Rows written per second so far"""
+        elapsed = self.elapsed()
+        return self.rows_written / elapsed if elapsed > 0 else 0.0
+    
+    def _progress(self, rows_written):
+        self.rows_written = rows_written
+        if self._cancel.is_set():
+            raise ExportCancelled()
+    
+    def run(self):
+        if self._cancel.is_set():
+            self.status = CANCELLED
+            self.message = "Export cancelled"
+            return
+        
+        self.started_at = time.perf_counter()
+        self.status = RUNNING
+        export_manager = ExportManager(self.project_id)
+        try:
+            success, self.message = export_manager.export(
+                self.format_type, self.file_path, progress_callback=self._progress,
+                **self.options
+            )
+        except Exception as e:
+            success, self.message = False, f"Export failed: {str(e)}"
+        
+        self.finished_at = time.perf_counter()
+        if success:
+            self.status = DONE
+        elif self._cancel.is_set():
+            self.status = CANCELLED
+        else:
+            self.status = FAILED
+    
+    def __repr__(self):
+        return (f"ExportJob({self.job_id}, project={self.project_id}, "
+                f"{self.format_type}, {self.status}, rows={self.rows_written})")
+
+
+class ExportQueue:
+    """Runs ExportJobs on a small pool of worker threads.
+    
+    Several projects or formats can be queued at once; up to max_workers
+    export concurrently and the rest wait their turn. Jobs are kept until
+    cleared so their outcome can be shown after they finish.
+    """
+    
+    def __init__(self, max_workers=DEFAULT_EXPORT_WORKERS):
+        self._executor = ThreadPoolExecutor(
+            max_workers=max_workers,
+            thread_name_prefix='export'
+        )
+        self._jobs = {}
+        self._ids = itertools.count(1)
+        self._lock = threading.Lock()
+    
+    def submit(self, project_id, format_type, file_path, **options):
+        with self._lock:
+            job = ExportJob(next(self._ids), project_id, format_type, file_path, options)
+            self._jobs[job.job_id] = job
+        self._executor.submit(job.run)
+        return job
+    
+    def jobs(self):
+        with self._lock:
+            return list(self._jobs.values())
+    
+    def active(self):
+        return [job for job in self.jobs() if not job.finished]
+    
+    def cancel(self, job_id=None):
+        """Cancel one job, or every unfinished job if job_id is None"""
+        for job in self.jobs():
+            if job_id is None or job.job_id == job_id:
+                job.cancel()
+    
+    def clear_finished(self):
+        with self._lock:
+            self._jobs = {job_id: job for job_id, job in self._jobs.items() if not job.finished}
+    
+    def shutdown(self, wait=True):
+        self.cancel()
+        self._executor.shutdown(wait=wait)
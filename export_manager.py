@@ -1,75 +1,267 @@
 import csv
+import gzip
 import json
+import os
+import sqlite3
 from datetime import datetime
 from database import DatabaseManager
+from rows import ChecklistRow
+
+try:
+    import zstandard
+except ImportError:  # optional; NDJSON falls back to gzip only
+    zstandard = None
+
+# Item fields written to JSON exports
+EXPORT_FIELDS = ('category', 'task', 'is_completed', 'completed_date', 'notes')
+
+# Tasks are laid out by hand as json.dump(indent=2) would nest them,
+# encoding only the values; the indenting encoder is pure Python and
+# several times slower per task
+_encode_value = json.JSONEncoder(ensure_ascii=False).encode
+_encode_compact = json.JSONEncoder(ensure_ascii=False, separators=(',', ':')).encode
+_TASK_FIELD_PREFIXES = [(field, f'      {json.dumps(field)}: ') for field in EXPORT_FIELDS]
+
+# NDJSON and snapshot exports carry everything needed to recreate the
+# items on another device (ids are local and left out)
+TRANSFER_FIELDS = ('category', 'task', 'is_custom', 'is_completed', 'notes',
+                   'due_date', 'completed_date', 'created_at')
+
+# NDJSON exports use zstd when the zstandard package is installed
+NDJSON_COMPRESSION = 'zstd' if zstandard is not None else 'gzip'
+
+# File extension for each export format
+FILE_EXTENSIONS = {
+    'csv': 'csv',
+    'json': 'json',
+    'ndjson': 'ndjson.zst' if NDJSON_COMPRESSION == 'zstd' else 'ndjson.gz',
+    'snapshot': 'sqlite',
+}
+
+SNAPSHOT_FORMAT = 'theatre-checklist-snapshot'
+SNAPSHOT_VERSION = 1
+SNAPSHOT_SCHEMA = [
+    '''
+    CREATE TABLE snapshot_info (
+        key TEXT PRIMARY KEY,
+        value TEXT
+    )
+    ''',
+    '''
+    CREATE TABLE checklist_items (
+        id INTEGER PRIMARY KEY,
+        category TEXT NOT NULL,
+        task TEXT NOT NULL,
+        is_custom BOOLEAN DEFAULT 0,
+        is_completed BOOLEAN DEFAULT 0,
+        notes TEXT,
+        due_date DATETIME,
+        completed_date DATETIME,
+        created_at DATETIME
+    )
+    ''',
+]
+
+
+def open_ndjson(file_path, mode='rt', compression=None):
+    """Open a gzip or zstd compressed NDJSON file as text.
+    
+    When reading, compression is detected from the file's magic bytes.
+    """
+    if compression is None:
+        compression = 'gzip'
+        if 'r' in mode:
+            with open(file_path, 'rb') as f:
+                if f.read(4) == b'\x28\xb5\x2f\xfd':
+                    compression = 'zstd'
+    
+    if compression == 'zstd':
+        if zstandard is None:
+            raise ValueError("zstd compression needs the zstandard package")
+        return zstandard.open(file_path, mode, encoding='utf-8')
+    # Level 6 compresses nearly as well as the default 9 in far less time
+    return gzip.open(file_path, mode, compresslevel=6, encoding='utf-8')
+
+
+class ExportCancelled(Exception):
+    """Raised by a progress callback to stop an export in progress"""
+
 
 class ExportManager:
+    """Writes a project's items to CSV, JSON, compressed NDJSON or a
+    standalone SQLite snapshot.
+    
+    Rows are streamed from one database cursor straight to the file, so
+    memory stays flat however large the project is. progress_callback, if
+    given, is called with the running row count after each chunk; it may
+    raise ExportCancelled, in which case the partial file is removed.
+    """
+    
     def __init__(self, project_id):
         self.db = DatabaseManager()
         self.project_id = project_id
     
-    def export_to_csv(self, file_path):
+    def export_to_csv(self, file_path, progress_callback=None):
         try:
-            items = self._get_all_project_items()
-            
+            count = 0
             with open(file_path, 'w', newline='', encoding='utf-8') as csvfile:
-                fieldnames = ['Category', 'Task', 'Status', 'Completed_Date', 'Notes']
-                writer = csv.DictWriter(csvfile, fieldnames=fieldnames)
+                writer = csv.writer(csvfile)
+                writer.writerow(['Category', 'Task', 'Status', 'Completed_Date', 'Notes'])
                 
-                writer.writeheader()
-                for item in items:
-                    writer.writerow({
-                        'Category': item['category'],
-                        'Task': item['task'],
-                        'Status': 'Completed' if item['is_completed'] else 'Pending',
-                        'Completed_Date': item['completed_date'] or '',
-                        'Notes': item['notes'] or ''
-                    })
+                for items in self._iter_project_items():
+                    writer.writerows([
+                        item['category'],
+                        item['task'],
+                        'Completed' if item['is_completed'] else 'Pending',
+                        item['completed_date'] or '',
+                        item['notes'] or ''
+                    ] for item in items)
+                    count += len(items)
+                    if progress_callback:
+                        progress_callback(count)
             
-            return True, f"Exported {len(items)} tasks to CSV"
+            return True, f"Exported {count} tasks to CSV"
+        except ExportCancelled:
+            self._remove_partial(file_path)
+            return False, "Export cancelled"
         except Exception as e:
             print(f"Export error: {e}")
             return False, f"Export failed: {str(e)}"
     
-    def export_to_json(self, file_path):
+    def export_to_json(self, file_path, progress_callback=None):
+        """Write the export document incrementally.
+        
+        The layout matches json.dump(indent=2) of the whole document, but
+        tasks are written as they are read and the totals, counted along
+        the way, follow the task list.
+        """
         try:
-            items = self._get_all_project_items()
-            
-            export_data = {
-                'export_date': datetime.now().isoformat(),
-                'total_tasks': len(items),
-                'completed_tasks': sum(1 for item in items if item['is_completed']),
-                'tasks': items
-            }
-            
+            total = completed = 0
             with open(file_path, 'w', encoding='utf-8') as jsonfile:
-                json.dump(export_data, jsonfile, indent=2, ensure_ascii=False)
+                jsonfile.write('{\n')
+                jsonfile.write(f'  "export_date": {json.dumps(datetime.now().isoformat())},\n')
+                jsonfile.write('  "tasks": [')
+                
+                for items in self._iter_project_items():
+                    for item in items:
+                        jsonfile.write(',\n    {\n' if total else '\n    {\n')
+                        jsonfile.write(',\n'.join(
+                            prefix + _encode_value(item[field])
+                            for field, prefix in _TASK_FIELD_PREFIXES
+                        ))
+                        jsonfile.write('\n    }')
+                        total += 1
+                        completed += item.is_completed
+                    if progress_callback:
+                        progress_callback(total)
+                
+                jsonfile.write('\n  ],\n' if total else '],\n')
+                jsonfile.write(f'  "total_tasks": {total},\n')
+                jsonfile.write(f'  "completed_tasks": {completed}\n')
+                jsonfile.write('}')
             
-            return True, f"Exported {len(items)} tasks to JSON"
+            return True, f"Exported {total} tasks to JSON"
+        except ExportCancelled:
+            self._remove_partial(file_path)
+            return False, "Export cancelled"
         except Exception as e:
             print(f"Export error: {e}")
             return False, f"Export failed: {str(e)}"
     
-    def _get_all_project_items(self):
+    def export(self, format_type, file_path, progress_callback=None, **options):
+        """Export in the format named by a FILE_EXTENSIONS key.
+        
+        options go to that format's exporter, e.g. compression for NDJSON.
+        """
+        exporters = {
+            'csv': self.export_to_csv,
+            'json': self.export_to_json,
+            'ndjson': self.export_to_ndjson,
+            'snapshot': self.export_to_snapshot,
+        }
+        return exporters[format_type](file_path, progress_callback=progress_callback, **options)
+    
+    def export_to_ndjson(self, file_path, progress_callback=None, compression=NDJSON_COMPRESSION):
+        """One compact JSON object per line, compressed as it is written"""
         try:
-            results = self.db.fetch_all('''
-                SELECT category, task, is_completed, completed_date, notes
-                FROM checklist_items 
-                WHERE project_id = ?
-                ORDER BY category, created_at
-            ''', (self.project_id,))
+            count = 0
+            with open_ndjson(file_path, 'wt', compression) as ndjsonfile:
+                for items in self._iter_project_items():
+                    ndjsonfile.writelines(
+                        _encode_compact(item.to_dict(TRANSFER_FIELDS)) + '\n' for item in items
+                    )
+                    count += len(items)
+                    if progress_callback:
+                        progress_callback(count)
             
-            items = []
-            for row in results:
-                items.append({
-                    'category': row[0],
-                    'task': row[1],
-                    'is_completed': bool(row[2]),
-                    'completed_date': row[3],
-                    'notes': row[4]
-                })
+            return True, f"Exported {count} tasks to NDJSON"
+        except ExportCancelled:
+            self._remove_partial(file_path)
+            return False, "Export cancelled"
+        except Exception as e:
+            print(f"Export error: {e}")
+            return False, f"Export failed: {str(e)}"
+    
+    def export_to_snapshot(self, file_path, progress_callback=None):
+        """Write the project as a self-contained SQLite database.
+        
+        Items are streamed into a temporary database file next to
+        file_path, so memory stays flat, and the finished file is then
+        renamed over file_path: the path only ever holds a complete
+        snapshot.
+        """
+        partial_path = file_path + '.partial'
+        self._remove_partial(partial_path)
+        snapshot = sqlite3.connect(partial_path)
+        try:
+            # A crash mid-export just leaves a .partial file to discard,
+            # so the scratch database needs no journal or fsyncs
+            snapshot.execute('PRAGMA journal_mode = OFF')
+            snapshot.execute('PRAGMA synchronous = OFF')
+            for statement in SNAPSHOT_SCHEMA:
+                snapshot.execute(statement)
+            
+            project = self.db.fetch_one('export.project', (self.project_id,))
+            snapshot.executemany('INSERT INTO snapshot_info (key, value) VALUES (?, ?)', [
+                ('format', SNAPSHOT_FORMAT),
+                ('version', str(SNAPSHOT_VERSION)),
+                ('project_name', project[0] if project else None),
+                ('project_description', project[1] if project else None),
+                ('export_date', datetime.now().isoformat()),
+            ])
             
-            return items
+            count = 0
+            insert = (f"INSERT INTO checklist_items ({', '.join(TRANSFER_FIELDS)}) "
+                      f"VALUES ({', '.join('?' * len(TRANSFER_FIELDS))})")
+            for items in self._iter_project_items():
+                snapshot.executemany(insert, (
+                    [item[field] for field in TRANSFER_FIELDS] for item in items
+                ))
+                count += len(items)
+                if progress_callback:
+                    progress_callback(count)
+            snapshot.commit()
+            snapshot.close()
+            
+            os.replace(partial_path, file_path)
+            return True, f"Exported {count} tasks to snapshot"
+        except ExportCancelled:
+            snapshot.close()
+            self._remove_partial(partial_path)
+            return False, "Export cancelled"
         except Exception as e:
-            print(f"Error getting project items: {e}")
-            return []
\ No newline at end of file
+            print(f"Export error: {e}")
+            snapshot.close()
+            self._remove_partial(partial_path)
+            return False, f"Export failed: {str(e)}"
+    
+    def _remove_partial(self, file_path):
+        try:
+            os.remove(file_path)
+        except OSError:
+            pass
+    
+    def _iter_project_items(self):
+        """Yield the project's items in chunks, in list order"""
+        for rows in self.db.stream('export.items', (self.project_id,)):
+            yield [ChecklistRow.from_row(row) for row in rows]
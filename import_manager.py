@@ -0,0 +1,190 @@
+import csv
+import json
+import pathlib
+import sqlite3
+import time
+from itertools import islice
+from database import DatabaseManager
+from checklist_manager import validate_custom_item
+from export_manager import open_ndjson, TRANSFER_FIELDS, SNAPSHOT_FORMAT
+from project_cache import project_cache
+from reminders import reminders
+
+# Items inserted per transaction
+IMPORT_BATCH_SIZE = 5000
+
+# CSV headers written by ExportManager.export_to_csv, mapped to item fields
+CSV_HEADERS = {
+    'Category': 'category',
+    'Task': 'task',
+    'Status': 'is_completed',
+    'Completed_Date': 'completed_date',
+    'Notes': 'notes',
+}
+
+
+class ImportCancelled(Exception):
+    """Raised by a progress callback to stop an import between batches"""
+
+
+class ImportProgress:
+    """Running totals for one import, passed to progress callbacks"""
+    
+    def __init__(self):
+        self.read = 0
+        self.imported = 0
+        self.invalid = 0
+        self.duplicates = 0
+        self.started_at = time.perf_counter()
+    
+    def elapsed(self):
+        return time.perf_counter() - self.started_at
+    
+    def throughput(self):
+        """Rows read per second so far"""
+        elapsed = self.elapsed()
+        return self.read / elapsed if elapsed > 0 else 0.0
+    
+    def summary(self):
+        skipped = []
+        if self.duplicates:
+            skipped.append(f"{self.duplicates} duplicates")
+        if self.invalid:
+            skipped.append(f"{self.invalid} invalid")
+        text = f"{self.imported} tasks"
+        if skipped:
+            text += f" ({', '.join(skipped)} skipped)"
+        return text
+
+
+class ImportManager:
+    """Loads items into a project from files ExportManager produces.
+    
+    Every format goes through the same pipeline: items are validated with
+    the rules add_custom_item applies, items whose category and task
+    (ignoring case) already exist in the project or earlier in the file
+    are skipped, and the rest are inserted in batches, one transaction per
+    batch. progress_callback, if given, is called with an ImportProgress
+    after each batch and may raise ImportCancelled; batches already
+    committed are kept.
+    """
+    
+    def __init__(self, project_id):
+        self.db = DatabaseManager()
+        self.project_id = project_id
+        self.progress = None
+    
+    def import_file(self, file_path, progress_callback=None):
+        """Import by file type: .csv, .json, .sqlite, or (compressed) NDJSON"""
+        name = file_path.lower()
+        if name.endswith('.csv'):
+            return self.import_csv(file_path, progress_callback)
+        if name.endswith('.json'):
+            return self.import_json(file_path, progress_callback)
+        if name.endswith(('.sqlite', '.db')):
+            return self.import_snapshot(file_path, progress_callback)
+        return self.import_ndjson(file_path, progress_callback)
+    
+    def import_csv(self, file_path, progress_callback=None):
+        def read():
+            with open(file_path, newline='', encoding='utf-8-sig') as csvfile:
+                for row in csv.DictReader(csvfile):
+                    item = {CSV_HEADERS.get(key, key): value for key, value in row.items()}
+                    item['is_completed'] = item.get('is_completed') == 'Completed'
+                    yield item
+        
+        return self._import(read(), "CSV", progress_callback)
+    
+    def import_json(self, file_path, progress_callback=None):
+        # A JSON document has to be parsed whole; use NDJSON for large sets
+        with open(file_path, encoding='utf-8') as jsonfile:
+            data = json.load(jsonfile)
+        items = data['tasks'] if isinstance(data, dict) else data
+        return self._import(iter(items), "JSON", progress_callback)
+    
+    def import_ndjson(self, file_path, progress_callback=None):
+        def read():
+            with open_ndjson(file_path, 'rt') as ndjsonfile:
+                for line in ndjsonfile:
+                    if line.strip():
+                        yield json.loads(line)
+        
+        return self._import(read(), "NDJSON", progress_callback)
+    
+    def import_snapshot(self, file_path, progress_callback=None):
+        def read():
+            # as_uri escapes '?', '#' and '%' and handles Windows drive paths
+            uri = pathlib.Path(file_path).resolve().as_uri() + '?mode=ro'
+            snapshot = sqlite3.connect(uri, uri=True)
+            try:
+                info = dict(snapshot.execute('SELECT key, value FROM snapshot_info'))
+                if info.get('format') != SNAPSHOT_FORMAT:
+                    raise ValueError("Not a checklist snapshot")
+                
+                cursor = snapshot.execute(
+                    f"SELECT {', '.join(TRANSFER_FIELDS)} FROM checklist_items ORDER BY id"
+                )
+                for row in cursor:
+                    yield dict(zip(TRANSFER_FIELDS, row))
+            finally:
+                snapshot.close()
+        
+        return self._import(read(), "snapshot", progress_callback)
+    
+    def _import(self, items, source, progress_callback):
+        self.progress = progress = ImportProgress()
+        try:
+            seen = {
+                self._dedupe_key(row[0], row[1])
+                for row in self.db.fetch_all('items.task_keys', (self.project_id,))
+            }
+            
+            while True:
+                chunk = list(islice(items, IMPORT_BATCH_SIZE))
+                if not chunk:
+                    break
+                progress.read += len(chunk)
+                batch = [row for row in (self._prepare(item, seen) for item in chunk) if row]
+                
+                if batch:
+                    with self.db.transaction():
+                        self.db.execute_many('items.import', batch)
+                    progress.imported += len(batch)
+                    project_cache.invalidate(self.project_id)
+                if progress_callback:
+                    progress_callback(progress)
+            
+            return True, f"Imported {progress.summary()} from {source} in {progress.elapsed():.1f}s"
+        except ImportCancelled:
+            return False, f"Import cancelled after {progress.imported} tasks"
+        except Exception as e:
+            print(f"Import error: {e}")
+            return False, f"Import failed: {str(e)}"
+        finally:
+            # Batches committed before a cancel or failure stay imported
+            if progress.imported:
+                reminders.refresh_project(self.project_id)
+    
+    def _prepare(self, item, seen):
+        """Validate and dedupe one item; returns its insert row or None"""
+        category = str(item.get('category') or '').strip()
+        task = str(item.get('task') or '').strip()
+        if validate_custom_item(category, task):
+            self.progress.invalid += 1
+            return None
+        
+        key = self._dedupe_key(category, task)
+        if key in seen:
+            self.progress.duplicates += 1
+            return None
+        seen.add(key)
+        
+        return (
+            self.project_id, category, task,
+            bool(item.get('is_custom', True)), bool(item.get('is_completed')),
+            item.get('notes') or None, item.get('due_date') or None,
+            item.get('completed_date') or None, item.get('created_at') or None
+        )
+    
+    def _dedupe_key(self, category, task):
+        return category.casefold(), task.casefold()
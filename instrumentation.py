@@ -0,0 +1,175 @@
+import json
+import logging
+import threading
+import time
+from collections import deque
+from contextlib import contextmanager
+
+# Queries slower than this (in seconds) go to the slow-query log
+DEFAULT_SLOW_QUERY_THRESHOLD = 0.05
+
+# Durations kept per query/action for percentile estimates
+SAMPLE_SIZE = 1000
+
+slow_query_logger = logging.getLogger('theatre_checklist.slow_queries')
+
+
+def percentile(samples, pct):
+    if not samples:
+        return 0.0
+    ordered = sorted(samples)
+    index = min(len(ordered) - 1, int(round(pct / 100.0 * (len(ordered) - 1))))
+    return ordered[index]
+
+
+class QueryInstrumentation:
+    """Per-query timings, slow-query log and per-action aggregates.
+    
+    Every statement DatabaseManager runs is recorded with its name (or
+    normalized SQL), parameter count, rows returned and the time spent
+    executing and fetching. Queries run inside an action() block are also
+    attributed to that action, so screen handlers such as
+    _load_items_async can be ranked by their own p99.
+    """
+    
+    def __init__(self, slow_threshold=DEFAULT_SLOW_QUERY_THRESHOLD, explain_slow=False,
+                 slow_log_size=200):
+        self.enabled = True
+        self.slow_threshold = slow_threshold
+        self.explain_slow = explain_slow
+        self.slow_queries = deque(maxlen=slow_log_size)
+        self._queries = {}
+        self._actions = {}
+        self._local = threading.local()
+        self._lock = threading.Lock()
+    
+    def current_action(self):
+        stack = getattr(self._local, 'actions', None)
+        return stack[-1] if stack else None
+    
+    @contextmanager
+    def action(self, name):
+        """Attribute queries in this block (on this thread) to a named action"""
+        stack = getattr(self._local, 'actions', None)
+        if stack is None:
+            stack = self._local.actions = []
+        stack.append(name)
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            stack.pop()
+            self._record_action(name, time.perf_counter() - start)
+    
+    def _record_action(self, name, elapsed):
+        with self._lock:
+            entry = self._actions.get(name)
+            if entry is None:
+                entry = self._actions[name] = {
+                    'calls': 0, 'total_time': 0.0, 'samples': deque(maxlen=SAMPLE_SIZE)
+                }
+            entry['calls'] += 1
+            entry['total_time'] += elapsed
+            entry['samples'].append(elapsed)
+    
+    def record(self, name, sql, param_count, rows, exec_time, fetch_time, conn=None, params=()):
+        if not self.enabled:
+            return
+        
+        action = self.current_action()
+        elapsed = exec_time + fetch_time
+        
+        with self._lock:
+            entry = self._queries.get(name)
+            if entry is None:
+                entry = self._queries[name] = {
+                    'calls': 0, 'rows': 0, 'param_count': param_count,
+                    'exec_time': 0.0, 'fetch_time': 0.0, 'max_time': 0.0,
+                    'actions': {}, 'samples': deque(maxlen=SAMPLE_SIZE)
+                }
+            entry['calls'] += 1
+            entry['rows'] += rows
+            entry['exec_time'] += exec_time
+            entry['fetch_time'] += fetch_time
+            entry['max_time'] = max(entry['max_time'], elapsed)
+            entry['samples'].append(elapsed)
+            if action:
+                entry['actions'][action] = entry['actions'].get(action, 0) + 1
+        
+        if elapsed >= self.slow_threshold:
+            self._log_slow_query(name, sql, param_count, rows, exec_time, fetch_time,
+                                 action, conn, params)
+    
+    def _log_slow_query(self, name, sql, param_count, rows, exec_time, fetch_time,
+                        action, conn, params):
+        record = {
+            'timestamp': time.time(),
+            'query': name,
+            'action': action,
+            'param_count': param_count,
+            'rows': rows,
+            'exec_ms': round(exec_time * 1000, 3),
+            'fetch_ms': round(fetch_time * 1000, 3),
+        }
+        
+        if self.explain_slow and conn is not None:
+            record['query_plan'] = self.explain(conn, sql, params)
+        
+        self.slow_queries.append(record)
+        slow_query_logger.warning(json.dumps(record))
+    
+    def explain(self, conn, sql, params=()):
+        try:
+            rows = conn.execute(f"EXPLAIN QUERY PLAN {sql}", params).fetchall()
+            return [row[3] for row in rows]
+        except Exception as e:
+            return [f"EXPLAIN failed: {e}"]
+    
+    def summary(self):
+        with self._lock:
+            queries = {}
+            for name, entry in self._queries.items():
+                samples = list(entry['samples'])
+                total = entry['exec_time'] + entry['fetch_time']
+                queries[name] = {
+                    'calls': entry['calls'],
+                    'param_count': entry['param_count'],
+                    'rows': entry['rows'],
+                    'exec_ms': round(entry['exec_time'] * 1000, 3),
+                    'fetch_ms': round(entry['fetch_time'] * 1000, 3),
+                    'avg_ms': round(total / entry['calls'] * 1000, 3),
+                    'p50_ms': round(percentile(samples, 50) * 1000, 3),
+                    'p99_ms': round(percentile(samples, 99) * 1000, 3),
+                    'max_ms': round(entry['max_time'] * 1000, 3),
+                    'actions': dict(entry['actions']),
+                }
+            
+            actions = {}
+            for name, entry in self._actions.items():
+                samples = list(entry['samples'])
+                actions[name] = {
+                    'calls': entry['calls'],
+                    'avg_ms': round(entry['total_time'] / entry['calls'] * 1000, 3),
+                    'p50_ms': round(percentile(samples, 50) * 1000, 3),
+                    'p99_ms': round(percentile(samples, 99) * 1000, 3),
+                }
+            
+            return {
+                'queries': queries,
+                'actions': actions,
+                'slow_queries': list(self.slow_queries),
+            }
+    
+    def export_json(self, file_path=None):
+        """Return the aggregates as JSON, also writing them to file_path if given"""
+        data = json.dumps(self.summary(), indent=2)
+        if file_path:
+            with open(file_path, 'w', encoding='utf-8') as f:
+                f.write(data)
+        return data
+    
+    def reset(self):
+        with self._lock:
+            self._queries.clear()
+            self._actions.clear()
+            self.slow_queries.clear()
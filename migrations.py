@@ -0,0 +1,403 @@
+# Versioned schema migrations, tracked with PRAGMA user_version.
+#
+# Each Migration bumps the schema to its version. Its statements run in a
+# single transaction and must be idempotent (IF [NOT] EXISTS), because a
+# migration interrupted during a backfill runs them again on resume. Its
+# backfills then walk a table in rowid chunks, committing each chunk
+# together with its progress, so a large database can be upgraded in
+# pieces and an interrupted upgrade picks up where it stopped.
+
+DEFAULT_CHUNK_SIZE = 5000
+
+
+class Backfill:
+    """A data change applied to a table one rowid range at a time.
+    
+    sql receives :start and :end and must only touch rows whose key is
+    in (start, end]; it must also be safe to repeat for a range.
+    """
+    
+    def __init__(self, name, table, sql, key='id', chunk_size=DEFAULT_CHUNK_SIZE):
+        self.name = name
+        self.table = table
+        self.sql = sql
+        self.key = key
+        self.chunk_size = chunk_size
+
+
+class Migration:
+    def __init__(self, version, description, statements=(), backfills=()):
+        self.version = version
+        self.description = description
+        self.statements = list(statements)
+        self.backfills = list(backfills)
+
+
+MIGRATIONS = [
+    Migration(
+        1, "Composite indexes matched to the hot query shapes",
+        statements=[
+            # Superseded single-column indexes
+            'DROP INDEX IF EXISTS idx_projects_user_id',
+            'DROP INDEX IF EXISTS idx_items_project_id',
+            'DROP INDEX IF EXISTS idx_items_category',
+            'DROP INDEX IF EXISTS idx_items_completed',
+            # projects.list_for_user: WHERE user_id ORDER BY created_at
+            '''
+            CREATE INDEX IF NOT EXISTS idx_projects_user_created
+            ON projects(user_id, created_at)
+            ''',
+            # items.list*, items.categories, export.items: WHERE project_id
+            # [AND category] ORDER BY category, created_at. Carrying
+            # is_completed makes it covering for stats.category_totals.
+            '''
+            CREATE INDEX IF NOT EXISTS idx_items_project_category
+            ON checklist_items(project_id, category, created_at, is_completed)
+            ''',
+            # stats.recent_completed: WHERE project_id AND is_completed AND completed_date >=
+            '''
+            CREATE INDEX IF NOT EXISTS idx_items_project_completed
+            ON checklist_items(project_id, is_completed, completed_date)
+            ''',
+            # stats.completion_trend groups by day, so index the day itself
+            '''
+            CREATE INDEX IF NOT EXISTS idx_items_project_completed_day
+            ON checklist_items(project_id, is_completed, DATE(completed_date))
+            ''',
+        ]
+    ),
+    Migration(
+        2, "Per-project/per-category progress counters maintained by triggers",
+        statements=[
+            '''
+            CREATE TABLE IF NOT EXISTS project_category_stats (
+                project_id INTEGER NOT NULL,
+                category TEXT NOT NULL,
+                total INTEGER NOT NULL DEFAULT 0,
+                completed INTEGER NOT NULL DEFAULT 0,
+                PRIMARY KEY (project_id, category),
+                FOREIGN KEY (project_id) REFERENCES projects (id) ON DELETE CASCADE
+            ) WITHOUT ROWID
+            ''',
+            '''
+            CREATE TRIGGER IF NOT EXISTS trg_items_stats_insert
+            AFTER INSERT ON checklist_items
+            BEGIN
+                INSERT INTO project_category_stats (project_id, category, total, completed)
+                VALUES (NEW.project_id, NEW.category, 1, NEW.is_completed = 1)
+                ON CONFLICT (project_id, category) DO UPDATE
+                SET total = total + 1, completed = completed + excluded.completed;
+            END
+            ''',
+            '''
+            CREATE TRIGGER IF NOT EXISTS trg_items_stats_delete
+            AFTER DELETE ON checklist_items
+            BEGIN
+                UPDATE project_category_stats
+                SET total = total - 1, completed = completed - (OLD.is_completed = 1)
+                WHERE project_id = OLD.project_id AND category = OLD.category;
+                DELETE FROM project_category_stats
+                WHERE project_id = OLD.project_id AND category = OLD.category AND total <= 0;
+            END
+            ''',
+            '''
+            CREATE TRIGGER IF NOT EXISTS trg_items_stats_update
+            AFTER UPDATE OF project_id, category, is_completed ON checklist_items
+            WHEN OLD.project_id IS NOT NEW.project_id
+              OR OLD.category IS NOT NEW.category
+              OR (OLD.is_completed = 1) IS NOT (NEW.is_completed = 1)
+            BEGIN
+                UPDATE project_category_stats
+                SET total = total - 1, completed = completed - (OLD.is_completed = 1)
+                WHERE project_id = OLD.project_id AND category = OLD.category;
+                DELETE FROM project_category_stats
+                WHERE project_id = OLD.project_id AND category = OLD.category AND total <= 0;
+                INSERT INTO project_category_stats (project_id, category, total, completed)
+                VALUES (NEW.project_id, NEW.category, 1, NEW.is_completed = 1)
+                ON CONFLICT (project_id, category) DO UPDATE
+                SET total = total + 1, completed = completed + excluded.completed;
+            END
+            ''',
+        ],
+        backfills=[
+            # Recomputing a project's rows outright makes each chunk safe to
+            # repeat, and correct even if the triggers already counted some
+            # writes made while the backfill was still running
+            Backfill(
+                'project_category_stats', 'projects',
+                '''
+                INSERT OR REPLACE INTO project_category_stats
+                    (project_id, category, total, completed)
+                SELECT project_id, category, COUNT(*),
+                       SUM(CASE WHEN is_completed = 1 THEN 1 ELSE 0 END)
+                FROM checklist_items
+                WHERE project_id > :start AND project_id <= :end
+                GROUP BY project_id, category
+                ''',
+                chunk_size=100
+            ),
+        ]
+    ),
+    Migration(
+        3, "Keyset pagination index on (category, created_at, id)",
+        statements=[
+            # items.page*: keyset cursors on (category, created_at, id).
+            # With id ahead of is_completed the index yields that order
+            # directly instead of sorting within equal timestamps.
+            'DROP INDEX IF EXISTS idx_items_project_category',
+            '''
+            CREATE INDEX IF NOT EXISTS idx_items_project_category_keyset
+            ON checklist_items(project_id, category, created_at, id, is_completed)
+            ''',
+        ]
+    ),
+    Migration(
+        4, "Full-text index over task and notes",
+        statements=[
+            # External content: the index stores only tokens and reads the
+            # text back from checklist_items. project_id is indexed as a
+            # token so items.search narrows to one project inside the
+            # match instead of ranking every project's hits. Prefix indexes
+            # up to 5 characters keep search-as-you-type terms from merging
+            # the doclists of every token they expand to.
+            '''
+            CREATE VIRTUAL TABLE IF NOT EXISTS checklist_items_fts USING fts5(
+                project_id, task, notes,
+                content='checklist_items', content_rowid='id',
+                tokenize='unicode61 remove_diacritics 2',
+                prefix='2 3 4 5'
+            )
+            ''',
+            # Rank on the text only; task matches weigh more than notes
+            '''
+            INSERT INTO checklist_items_fts (checklist_items_fts, rank)
+            VALUES ('rank', 'bm25(0.0, 10.0, 1.0)')
+            ''',
+            '''
+            CREATE TRIGGER IF NOT EXISTS trg_items_fts_insert
+            AFTER INSERT ON checklist_items
+            BEGIN
+                INSERT INTO checklist_items_fts (rowid, project_id, task, notes)
+                VALUES (NEW.id, NEW.project_id, NEW.task, NEW.notes);
+            END
+            ''',
+            # Removing a row the index never held would corrupt it, so the
+            # 'delete' commands only run for rows the backfill has reached
+            '''
+            CREATE TRIGGER IF NOT EXISTS trg_items_fts_delete
+            AFTER DELETE ON checklist_items
+            BEGIN
+                INSERT INTO checklist_items_fts (checklist_items_fts, rowid, project_id, task, notes)
+                SELECT 'delete', OLD.id, OLD.project_id, OLD.task, OLD.notes
+                WHERE EXISTS (SELECT 1 FROM checklist_items_fts_docsize WHERE id = OLD.id);
+            END
+            ''',
+            '''
+            CREATE TRIGGER IF NOT EXISTS trg_items_fts_update
+            AFTER UPDATE OF project_id, task, notes ON checklist_items
+            BEGIN
+                INSERT INTO checklist_items_fts (checklist_items_fts, rowid, project_id, task, notes)
+                SELECT 'delete', OLD.id, OLD.project_id, OLD.task, OLD.notes
+                WHERE EXISTS (SELECT 1 FROM checklist_items_fts_docsize WHERE id = OLD.id);
+                INSERT INTO checklist_items_fts (rowid, project_id, task, notes)
+                VALUES (NEW.id, NEW.project_id, NEW.task, NEW.notes);
+            END
+            ''',
+        ],
+        backfills=[
+            # Rows the triggers indexed already (written during the
+            # backfill) have a docsize entry and are skipped, which also
+            # makes a repeated chunk a no-op
+            Backfill(
+                'checklist_items_fts', 'checklist_items',
+                '''
+                INSERT INTO checklist_items_fts (rowid, project_id, task, notes)
+                SELECT id, project_id, task, notes
+                FROM checklist_items
+                WHERE id > :start AND id <= :end
+                AND id NOT IN (
+                    SELECT id FROM checklist_items_fts_docsize
+                    WHERE id > :start AND id <= :end
+                )
+                '''
+            ),
+        ]
+    ),
+    Migration(
+        5, "Project dashboard: last activity counters and a due-date index",
+        statements=[
+            # projects.dashboard counts each project's open items due before
+            # today; without this it walks every open item of every project
+            '''
+            CREATE INDEX IF NOT EXISTS idx_items_project_due
+            ON checklist_items(project_id, is_completed, due_date)
+            ''',
+            # projects.dashboard reads this instead of scanning every
+            # project's items for its newest change
+            '''
+            CREATE TABLE IF NOT EXISTS project_activity (
+                project_id INTEGER PRIMARY KEY,
+                last_activity TIMESTAMP NOT NULL,
+                FOREIGN KEY (project_id) REFERENCES projects (id) ON DELETE CASCADE
+            )
+            ''',
+            '''
+            CREATE TRIGGER IF NOT EXISTS trg_items_activity_insert
+            AFTER INSERT ON checklist_items
+            BEGIN
+                INSERT INTO project_activity (project_id, last_activity)
+                VALUES (NEW.project_id, CURRENT_TIMESTAMP)
+                ON CONFLICT (project_id) DO UPDATE SET last_activity = excluded.last_activity;
+            END
+            ''',
+            '''
+            CREATE TRIGGER IF NOT EXISTS trg_items_activity_update
+            AFTER UPDATE ON checklist_items
+            BEGIN
+                INSERT INTO project_activity (project_id, last_activity)
+                VALUES (NEW.project_id, CURRENT_TIMESTAMP)
+                ON CONFLICT (project_id) DO UPDATE SET last_activity = excluded.last_activity;
+            END
+            ''',
+            # Only an UPDATE here: when a project is deleted its items go
+            # with it, and inserting a row for it would fail the foreign key
+            '''
+            CREATE TRIGGER IF NOT EXISTS trg_items_activity_delete
+            AFTER DELETE ON checklist_items
+            BEGIN
+                UPDATE project_activity SET last_activity = CURRENT_TIMESTAMP
+                WHERE project_id = OLD.project_id;
+            END
+            ''',
+        ],
+        backfills=[
+            # Seeds each project from its newest item timestamp, keeping
+            # any later time the triggers recorded while this was running
+            Backfill(
+                'project_activity', 'projects',
+                '''
+                INSERT INTO project_activity (project_id, last_activity)
+                SELECT p.id, MAX(p.created_at, COALESCE(MAX(i.created_at), ''),
+                                 COALESCE(MAX(i.completed_date), ''))
+                FROM projects p
+                LEFT JOIN checklist_items i ON i.project_id = p.id
+                WHERE p.id > :start AND p.id <= :end
+                GROUP BY p.id
+                ON CONFLICT (project_id) DO UPDATE
+                SET last_activity = MAX(last_activity, excluded.last_activity)
+                ''',
+                chunk_size=100
+            ),
+        ]
+    ),
+]
+
+
+class Migrator:
+    def __init__(self, db, migrations=None):
+        self.db = db
+        self.migrations = sorted(
+            MIGRATIONS if migrations is None else migrations,
+            key=lambda migration: migration.version
+        )
+    
+    def current_version(self):
+        return self.db.fetch_one('PRAGMA user_version')[0]
+    
+    def latest_version(self):
+        return self.migrations[-1].version if self.migrations else 0
+    
+    def pending(self, target=None):
+        current = self.current_version()
+        return [
+            migration for migration in self.migrations
+            if migration.version > current and (target is None or migration.version <= target)
+        ]
+    
+    def migrate(self, target=None, dry_run=False, progress_callback=None):
+        """Apply pending migrations in order and return a report per migration.
+        
+        With dry_run nothing is written; the report lists the statements
+        that would run and an estimate of the rows each backfill touches.
+        progress_callback(version, backfill_name, rows_done) is called after
+        every committed chunk.
+        """
+        reports = []
+        
+        for migration in self.pending(target):
+            report = {
+                'version': migration.version,
+                'description': migration.description,
+                'statements': len(migration.statements),
+                'backfills': {},
+            }
+            
+            if dry_run:
+                for backfill in migration.backfills:
+                    report['backfills'][backfill.name] = {
+                        'estimated_rows': self._estimate_rows(migration, backfill)
+                    }
+                reports.append(report)
+                continue
+            
+            with self.db.transaction():
+                for statement in migration.statements:
+                    self.db.execute_query(statement)
+            
+            for backfill in migration.backfills:
+                rows = self._run_backfill(migration, backfill, progress_callback)
+                report['backfills'][backfill.name] = {'rows': rows}
+            
+            with self.db.transaction():
+                self.db.execute_query(
+                    'DELETE FROM schema_migration_progress WHERE version = ?',
+                    (migration.version,)
+                )
+                self.db.execute_query(f'PRAGMA user_version = {int(migration.version)}')
+            
+            reports.append(report)
+        
+        return reports
+    
+    def _last_key(self, migration, backfill):
+        row = self.db.fetch_one(
+            'SELECT last_key FROM schema_migration_progress WHERE version = ? AND backfill = ?',
+            (migration.version, backfill.name)
+        )
+        return row[0] if row else 0
+    
+    def _estimate_rows(self, migration, backfill):
+        row = self.db.fetch_one(
+            f'SELECT COUNT(*) FROM {backfill.table} WHERE {backfill.key} > ?',
+            (self._last_key(migration, backfill),)
+        )
+        return row[0]
+    
+    def _run_backfill(self, migration, backfill, progress_callback=None):
+        start = self._last_key(migration, backfill)
+        rows_done = 0
+        
+        while True:
+            end = self.db.fetch_one(f'''
+                SELECT MAX({backfill.key}), COUNT(*) FROM (
+                    SELECT {backfill.key} FROM {backfill.table}
+                    WHERE {backfill.key} > ?
+                    ORDER BY {backfill.key}
+                    LIMIT ?
+                )
+            ''', (start, backfill.chunk_size))
+            
+            if end[0] is None:
+                return rows_done
+            
+            with self.db.transaction():
+                self.db.execute_query(backfill.sql, {'start': start, 'end': end[0]})
+                self.db.execute_query('''
+                    INSERT OR REPLACE INTO schema_migration_progress (version, backfill, last_key)
+                    VALUES (?, ?, ?)
+                ''', (migration.version, backfill.name, end[0]))
+            
+            start = end[0]
+            rows_done += end[1]
+            if progress_callback:
+                progress_callback(migration.version, backfill.name, rows_done)
@@ -0,0 +1,218 @@
+import bisect
+import sys
+import threading
+from collections import OrderedDict
+
+# Projects kept in memory at once; the least recently used is evicted
+DEFAULT_MAX_PROJECTS = 4
+
+
+def _sort_key(item):
+    return item.sort_key
+
+
+class ProjectSnapshot:
+    """Every checklist item of one project, indexed by id and by category.
+    
+    Each category's items stay sorted by ChecklistRow.sort_key, the same
+    order and cursor the database pages use, and per-category
+    (total, completed) counts are maintained as items change, so filtering,
+    the category list and progress are all answered without SQLite.
+    Items are shared with callers and must be treated as read-only.
+    """
+    
+    def __init__(self, project_id, items):
+        self.project_id = project_id
+        self.items_by_id = {}
+        self.by_category = {}
+        self.counts = {}
+        for item in items:
+            self._add(item)
+    
+    def _add(self, item):
+        self.items_by_id[item['id']] = item
+        bucket = self.by_category.setdefault(item['category'], [])
+        bisect.insort(bucket, item, key=_sort_key)
+        counts = self.counts.setdefault(item['category'], [0, 0])
+        counts[0] += 1
+        if item['is_completed']:
+            counts[1] += 1
+    
+    def _remove(self, item_id):
+        item = self.items_by_id.pop(item_id, None)
+        if item is None:
+            return None
+        category = item['category']
+        bucket = self.by_category[category]
+        del bucket[self._position(bucket, item)]
+        counts = self.counts[category]
+        counts[0] -= 1
+        if item['is_completed']:
+            counts[1] -= 1
+        if counts[0] == 0:
+            del self.by_category[category]
+            del self.counts[category]
+        return item
+    
+    def put(self, item):
+        """Add an item, or replace it in place if it is already present"""
+        old = self.items_by_id.get(item['id'])
+        if old is not None and old.sort_key == item.sort_key:
+            bucket = self.by_category[item['category']]
+            bucket[self._position(bucket, old)] = item
+            self.items_by_id[item['id']] = item
+            counts = self.counts[item['category']]
+            counts[1] += int(bool(item['is_completed'])) - int(bool(old['is_completed']))
+        else:
+            self._remove(item['id'])
+            self._add(item)
+    
+    @staticmethod
+    def _position(bucket, item):
+        return bisect.bisect_left(bucket, item.sort_key, key=_sort_key)
+    
+    def remove(self, item_id):
+        return self._remove(item_id)
+    
+    def page(self, category_filter, after, limit):
+        """Up to limit items following the sort key after (from the start if None)"""
+        if category_filter and category_filter != "All":
+            categories = [category_filter] if category_filter in self.by_category else []
+        else:
+            categories = sorted(self.by_category)
+        
+        items = []
+        for category in categories:
+            if after is not None and category < after[0]:
+                continue
+            bucket = self.by_category[category]
+            start = 0
+            if after is not None and category == after[0]:
+                start = bisect.bisect_right(bucket, tuple(after), key=_sort_key)
+            items.extend(bucket[start:start + limit - len(items)])
+            if len(items) >= limit:
+                break
+        return items
+    
+    def items(self, category_filter=None):
+        if category_filter and category_filter != "All":
+            return list(self.by_category.get(category_filter, ()))
+        items = []
+        for category in sorted(self.by_category):
+            items.extend(self.by_category[category])
+        return items
+    
+    def categories(self):
+        return sorted(self.by_category)
+    
+    def category_counts(self):
+        return {category: tuple(counts) for category, counts in sorted(self.counts.items())}
+    
+    def memory_footprint(self):
+        """Approximate bytes held by the cached items and their indexes"""
+        size = sys.getsizeof(self.items_by_id) + sys.getsizeof(self.by_category)
+        for item in self.items_by_id.values():
+            size += sys.getsizeof(item)
+            # Category strings are interned and counted once per bucket
+            size += sum(sys.getsizeof(item[field]) for field in
+                        ('task', 'notes', 'due_date', 'completed_date') if item[field] is not None)
+        for category, bucket in self.by_category.items():
+            size += sys.getsizeof(bucket) + sys.getsizeof(category)
+        return size
+
+
+class ProjectCache:
+    """LRU cache of ProjectSnapshots with write-through updates.
+    
+    ChecklistManager loads a project's items on first use and then
+    applies each of its writes here after committing them. A generation
+    counter per project stops a load that raced with a write from
+    storing the pre-write rows.
+    """
+    
+    def __init__(self, max_projects=DEFAULT_MAX_PROJECTS):
+        self.max_projects = max_projects
+        self._snapshots = OrderedDict()
+        self._generations = {}
+        self._lock = threading.RLock()
+        self.hits = 0
+        self.misses = 0
+    
+    def generation(self, project_id):
+        with self._lock:
+            return self._generations.get(project_id, 0)
+    
+    def _touch(self, project_id):
+        self._generations[project_id] = self._generations.get(project_id, 0) + 1
+    
+    def get(self, project_id):
+        """Return the snapshot if cached, counting the lookup as a hit or miss"""
+        with self._lock:
+            snapshot = self._snapshots.get(project_id)
+            if snapshot is None:
+                self.misses += 1
+                return None
+            self._snapshots.move_to_end(project_id)
+            self.hits += 1
+            return snapshot
+    
+    def peek(self, project_id):
+        """Return the snapshot if cached, uncounted; for write-through updates"""
+        with self._lock:
+            return self._snapshots.get(project_id)
+    
+    def load(self, project_id, items, generation):
+        """Store freshly loaded items unless the project changed meanwhile"""
+        with self._lock:
+            if self._generations.get(project_id, 0) != generation:
+                return None
+            snapshot = ProjectSnapshot(project_id, items)
+            self._snapshots[project_id] = snapshot
+            self._snapshots.move_to_end(project_id)
+            while len(self._snapshots) > self.max_projects:
+                self._snapshots.popitem(last=False)
+            return snapshot
+    
+    def put_item(self, project_id, item):
+        with self._lock:
+            self._touch(project_id)
+            snapshot = self._snapshots.get(project_id)
+            if snapshot is not None:
+                snapshot.put(item)
+    
+    def remove_item(self, project_id, item_id):
+        with self._lock:
+            self._touch(project_id)
+            snapshot = self._snapshots.get(project_id)
+            if snapshot is not None:
+                snapshot.remove(item_id)
+    
+    def invalidate(self, project_id=None):
+        with self._lock:
+            if project_id is None:
+                for cached_id in list(self._snapshots):
+                    self._touch(cached_id)
+                self._snapshots.clear()
+            else:
+                self._touch(project_id)
+                self._snapshots.pop(project_id, None)
+    
+    @property
+    def lock(self):
+        """Hold while reading a snapshot another thread may be updating"""
+        return self._lock
+    
+    def stats(self):
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                'hits': self.hits,
+                'misses': self.misses,
+                'hit_rate': round(self.hits / lookups, 3) if lookups else 0.0,
+                'projects': len(self._snapshots),
+                'items': sum(len(s.items_by_id) for s in self._snapshots.values()),
+                'memory_bytes': sum(s.memory_footprint() for s in self._snapshots.values()),
+            }
+
+
+project_cache = ProjectCache()
@@ -1,7 +1,9 @@
 import json
 import os
 from database import DatabaseManager
-from datetime import datetime
+from project_cache import project_cache
+from reminders import reminders
+from datetime import date, datetime
 
 class ProjectManager:
     def __init__(self, user_id):
@@ -18,22 +20,24 @@ class ProjectManager:
             if len(name) > 100:
                 return None, "Project name too long (max 100 characters)"
             
-            # Check for duplicate project names for this user
-            existing = self.db.fetch_one(
-                "SELECT id FROM projects WHERE user_id = ? AND name = ?", 
-                (self.user_id, name)
-            )
-            if existing:
-                return None, "You already have a project with this name"
-            
-            # Create project
-            cursor = self.db.execute_query(
-                'INSERT INTO projects (user_id, name, description) VALUES (?, ?, ?)',
-                (self.user_id, name, description.strip())
-            )
-            
-            project_id = cursor.lastrowid
-            self._add_default_checklist_items(project_id)
+            # Create the project and seed its checklist in one transaction,
+            # so a new project costs a single commit and is never half-seeded.
+            # The duplicate check runs inside it, on the writer, so two
+            # creates with the same name can't both pass it
+            with self.db.transaction():
+                existing = self.db.fetch_one(
+                    'projects.id_by_name', 
+                    (self.user_id, name)
+                )
+                if existing:
+                    return None, "You already have a project with this name"
+                
+                cursor = self.db.execute_query(
+                    'projects.insert',
+                    (self.user_id, name, description.strip())
+                )
+                project_id = cursor.lastrowid
+                self._add_default_checklist_items(project_id)
             
             return project_id, "Project created successfully"
         except Exception as e:
@@ -43,17 +47,12 @@ class ProjectManager:
     def _add_default_checklist_items(self, project_id):
         default_items = self._load_default_checklists()
         
-        for category, tasks in default_items.items():
-            for task in tasks:
-                try:
-                    self.db.execute_query('''
-                        INSERT INTO checklist_items 
-                        (project_id, category, task, is_custom, is_completed) 
-                        VALUES (?, ?, ?, ?, ?)
-                    ''', (project_id, category, task, False, False))
-                except Exception as e:
-                    print(f"Error adding default item: {e}")
-                    continue
+        rows = [
+            (project_id, category, task, False, False)
+            for category, tasks in default_items.items()
+            for task in tasks
+        ]
+        self.db.execute_many('items.insert_default', rows)
     
     def _load_default_checklists(self):
         default_data = {
@@ -114,9 +113,7 @@ class ProjectManager:
     def get_user_projects(self):
         try:
             results = self.db.fetch_all(
-                '''SELECT id, name, description, created_at 
-                   FROM projects WHERE user_id = ? 
-                   ORDER BY created_at DESC''',
+                'projects.list_for_user',
                 (self.user_id,)
             )
             
@@ -134,18 +131,55 @@ class ProjectManager:
             print(f"Error getting user projects: {e}")
             return []
     
-    def delete_project(self, project_id):
+    def get_dashboard(self):
+        """Every project with its progress, overdue count and last activity.
+        
+        One query however many projects the user has: totals come from
+        the per-category counters and last_activity from project_activity,
+        both kept current by triggers. An item is overdue once its due
+        date is before today and it is still open.
+        """
         try:
-            # Verify project belongs to user
-            project = self.db.fetch_one(
-                "SELECT id FROM projects WHERE id = ? AND user_id = ?",
-                (project_id, self.user_id)
+            results = self.db.fetch_all(
+                'projects.dashboard',
+                (date.today().isoformat(), self.user_id)
             )
             
-            if not project:
-                return False, "Project not found"
+            projects = []
+            for row in results:
+                total, completed = row[4], row[5]
+                projects.append({
+                    'id': row[0],
+                    'name': row[1],
+                    'description': row[2],
+                    'created_at': row[3],
+                    'total': total,
+                    'completed': completed,
+                    'percentage': round((completed / total * 100), 1) if total > 0 else 0,
+                    'overdue': row[6],
+                    'last_activity': row[7]
+                })
             
-            self.db.execute_query('DELETE FROM projects WHERE id = ?', (project_id,))
+            return projects
+        except Exception as e:
+            print(f"Error getting project dashboard: {e}")
+            return []
+    
+    def delete_project(self, project_id):
+        try:
+            with self.db.transaction():
+                # Verify project belongs to user
+                project = self.db.fetch_one(
+                    'projects.owned',
+                    (project_id, self.user_id)
+                )
+                
+                if not project:
+                    return False, "Project not found"
+                
+                self.db.execute_query('projects.delete', (project_id,))
+            project_cache.invalidate(project_id)
+            reminders.remove_project(project_id)
             return True, "Project deleted successfully"
         except Exception as e:
             print(f"Error deleting project: {e}")
@@ -154,7 +188,7 @@ class ProjectManager:
     def get_project_details(self, project_id):
         try:
             result = self.db.fetch_one(
-                'SELECT name, description FROM projects WHERE id = ? AND user_id = ?',
+                'projects.details',
                 (project_id, self.user_id)
             )
             
@@ -172,7 +206,7 @@ class ProjectManager:
                 return False, "Project name cannot be empty"
             
             self.db.execute_query(
-                'UPDATE projects SET name = ?, description = ? WHERE id = ? AND user_id = ?',
+                'projects.update',
                 (name, description.strip(), project_id, self.user_id)
             )
             
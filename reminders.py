@@ -0,0 +1,237 @@
+import heapq
+import itertools
+import threading
+import time
+from datetime import date, datetime
+
+from database import DatabaseManager
+
+try:
+    from plyer import notification
+except ImportError:  # optional; without it reminders show in the app only
+    notification = None
+
+# Hour of the day (local time) a date-only due date reminds at
+DEFAULT_REMINDER_HOUR = 9
+
+# Longest single wait in seconds. A long sleep is re-armed in steps of
+# this, so a suspended device or clock change can't make a reminder late
+# by more than MAX_WAIT. The heap is re-checked, not the database.
+MAX_WAIT = 3600
+
+
+def due_timestamp(due_date, hour=DEFAULT_REMINDER_HOUR):
+    """Epoch seconds at which a due date falls due, or None if unparseable"""
+    if not due_date:
+        return None
+    text = str(due_date)
+    try:
+        value = datetime.fromisoformat(text)
+    except ValueError:
+        return None
+    if len(text) <= len('YYYY-MM-DD'):
+        value = value.replace(hour=hour)
+    return value.timestamp()
+
+
+def notify(title, message):
+    """Raise a system notification; returns False where there is none"""
+    if notification is None:
+        return False
+    try:
+        notification.notify(title=title, message=message, app_name="Theatre Checklist")
+        return True
+    except Exception as e:
+        print(f"Notification error: {e}")
+        return False
+
+
+class ReminderScheduler:
+    """Calls on_due(reminder) on the UI thread when an open item falls due.
+    
+    The managers report deadline changes from any thread through
+    update_item, remove_items, refresh_project and remove_project.
+    """
+    
+    def __init__(self):
+        self.user_id = None
+        self.on_due = None
+        # Deadlines by due time; one Clock event is armed for the earliest,
+        # so nothing polls the database after start()
+        self._heap = []
+        self._entries = {}        # item_id -> [fire_at, seq, item_id, reminder or None]
+        self._project_names = {}  # project_id -> name, for projects seen in a load
+        self._counter = itertools.count()
+        self._lock = threading.Lock()
+        self._clock = None
+        self._event = None
+        self._armed_at = None
+    
+    @property
+    def running(self):
+        return self.user_id is not None
+    
+    def start(self, user_id, on_due):
+        """Load the user's upcoming deadlines and begin firing reminders"""
+        from kivy.clock import Clock
+        
+        rows = DatabaseManager().fetch_all('due.reminders', (user_id, date.today().isoformat()))
+        with self._lock:
+            self._reset()
+            self.user_id = user_id
+            self.on_due = on_due
+            self._clock = Clock
+            now = time.time()
+            for row in rows:
+                self._schedule(row, now)
+            self._arm()
+    
+    def stop(self):
+        with self._lock:
+            self._reset()
+            self.user_id = None
+            self.on_due = None
+    
+    def pending_count(self):
+        with self._lock:
+            return len(self._entries)
+    
+    def update_item(self, project_id, item):
+        """An item was added or changed: schedule, move or drop its reminder"""
+        if not self.running:
+            return
+        if item['is_completed'] or due_timestamp(item['due_date']) is None:
+            self.remove_items([item['id']])
+            return
+        if project_id not in self._project_names:
+            # First dated item of this project; the reload learns its name
+            self.refresh_project(project_id)
+            return
+        
+        with self._lock:
+            self._schedule(
+                (project_id, self._project_names[project_id], item['id'], item['task'],
+                 item['due_date']),
+                time.time()
+            )
+            self._arm()
+    
+    def remove_items(self, item_ids):
+        """Items were completed or deleted"""
+        if not self.running:
+            return
+        with self._lock:
+            for item_id in item_ids:
+                self._discard(item_id)
+            self._arm()
+    
+    def refresh_project(self, project_id):
+        """Reload one project's deadlines after a change too broad to patch"""
+        if not self.running:
+            return
+        try:
+            rows = DatabaseManager().fetch_all(
+                'due.reminders_for_project',
+                (project_id, self.user_id, date.today().isoformat())
+            )
+        except Exception as e:
+            # The write itself succeeded; only its reminders are stale
+            print(f"Error loading reminders: {e}")
+            return
+        with self._lock:
+            self._discard_project(project_id)
+            now = time.time()
+            for row in rows:
+                self._schedule(row, now)
+            self._arm()
+    
+    def remove_project(self, project_id):
+        if not self.running:
+            return
+        with self._lock:
+            self._discard_project(project_id)
+            self._project_names.pop(project_id, None)
+            self._arm()
+    
+    # The methods below expect self._lock to be held
+    
+    def _reset(self):
+        if self._event is not None:
+            self._event.cancel()
+        self._event = None
+        self._armed_at = None
+        self._heap = []
+        self._entries = {}
+        self._project_names = {}
+    
+    def _schedule(self, row, now):
+        project_id, project_name, item_id, task, due_date = row
+        self._project_names[project_id] = project_name
+        self._discard(item_id)
+        fire_at = due_timestamp(due_date)
+        # Deadlines already past are the overdue list's job, not a reminder's
+        if fire_at is None or fire_at <= now:
+            return
+        reminder = {
+            'project_id': project_id,
+            'project_name': project_name,
+            'item_id': item_id,
+            'task': task,
+            'due_date': due_date,
+        }
+        entry = [fire_at, next(self._counter), item_id, reminder]
+        self._entries[item_id] = entry
+        heapq.heappush(self._heap, entry)
+    
+    def _discard(self, item_id):
+        # The entry stays in the heap marked dead and is skipped at the top
+        entry = self._entries.pop(item_id, None)
+        if entry is not None:
+            entry[-1] = None
+    
+    def _discard_project(self, project_id):
+        for item_id in [
+            item_id for item_id, entry in self._entries.items()
+            if entry[-1]['project_id'] == project_id
+        ]:
+            self._discard(item_id)
+    
+    def _arm(self):
+        """Point the Clock event at the earliest live deadline"""
+        while self._heap and self._heap[0][-1] is None:
+            heapq.heappop(self._heap)
+        # Dead entries buried below the top are dropped once they dominate
+        if len(self._heap) > 2 * len(self._entries) + 64:
+            self._heap = [entry for entry in self._heap if entry[-1] is not None]
+            heapq.heapify(self._heap)
+        
+        fire_at = self._heap[0][0] if self._heap else None
+        if fire_at == self._armed_at or self._clock is None:
+            return
+        if self._event is not None:
+            self._event.cancel()
+            self._event = None
+        self._armed_at = fire_at
+        if fire_at is not None:
+            delay = min(max(fire_at - time.time(), 0), MAX_WAIT)
+            self._event = self._clock.schedule_once(self._fire, delay)
+    
+    def _fire(self, dt):
+        due = []
+        with self._lock:
+            self._event = None
+            self._armed_at = None
+            now = time.time()
+            while self._heap and (self._heap[0][-1] is None or self._heap[0][0] <= now):
+                entry = heapq.heappop(self._heap)
+                if entry[-1] is not None:
+                    del self._entries[entry[2]]
+                    due.append(entry[-1])
+            self._arm()
+            on_due = self.on_due
+        
+        for reminder in due:
+            on_due(reminder)
+
+
+reminders = ReminderScheduler()
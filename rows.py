@@ -0,0 +1,74 @@
+import sys
+from collections.abc import Mapping
+
+# Bits of ChecklistRow.flags
+COMPLETED = 1
+CUSTOM = 2
+
+
+class ChecklistRow(Mapping):
+    """One checklist item, stored compactly and read like a dict.
+    
+    Attributes live in __slots__ rather than a per-row dict, the two
+    booleans share one small int, and category names are interned so
+    every row in a category points at the same string. Rows are treated
+    as immutable: use replace() to derive a changed copy.
+    """
+    
+    __slots__ = ('id', 'category', 'task', 'flags', 'notes', 'due_date', 'completed_date',
+                 'created_at')
+    
+    FIELDS = ('id', 'category', 'task', 'is_custom', 'is_completed',
+              'notes', 'due_date', 'completed_date', 'created_at')
+    
+    def __init__(self, id, category, task, is_custom=False, is_completed=False,
+                 notes=None, due_date=None, completed_date=None, created_at=None):
+        self.id = id
+        self.category = sys.intern(category)
+        self.task = task
+        self.flags = (COMPLETED if is_completed else 0) | (CUSTOM if is_custom else 0)
+        self.notes = notes
+        self.due_date = due_date
+        self.completed_date = completed_date
+        self.created_at = created_at
+    
+    @classmethod
+    def from_row(cls, row):
+        """Build from a (id, category, task, is_custom, is_completed,
+        notes, due_date, completed_date, created_at) database row"""
+        return cls(*row)
+    
+    @property
+    def sort_key(self):
+        """Position in list order, also used as the keyset pagination cursor"""
+        return (self.category, self.created_at or '', self.id)
+    
+    @property
+    def is_completed(self):
+        return bool(self.flags & COMPLETED)
+    
+    @property
+    def is_custom(self):
+        return bool(self.flags & CUSTOM)
+    
+    def __getitem__(self, key):
+        if key not in self.FIELDS:
+            raise KeyError(key)
+        return getattr(self, key)
+    
+    def __iter__(self):
+        return iter(self.FIELDS)
+    
+    def __len__(self):
+        return len(self.FIELDS)
+    
+    def replace(self, **changes):
+        values = {field: getattr(self, field) for field in self.FIELDS}
+        values.update(changes)
+        return ChecklistRow(**values)
+    
+    def to_dict(self, fields=FIELDS):
+        return {field: getattr(self, field) for field in fields}
+    
+    def __repr__(self):
+        return f"ChecklistRow({self.to_dict()!r})"
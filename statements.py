@@ -0,0 +1,362 @@
+import threading
+from collections import OrderedDict
+
+# Compiled statements kept per connection (sqlite3's default is 128)
+DEFAULT_STATEMENT_CACHE_SIZE = 256
+
+# Every query the managers issue, by name. Managers pass the name to
+# DatabaseManager instead of inline SQL, so each statement has one
+# canonical text (and one compiled form) and its own counters.
+STATEMENTS = {
+    # auth.py
+    'users.id_by_email': 'SELECT id FROM users WHERE email = ?',
+    'users.insert': 'INSERT INTO users (email, password_hash) VALUES (?, ?)',
+    'users.login': 'SELECT id, email FROM users WHERE email = ? AND password_hash = ?',
+    
+    # project_manager.py
+    'projects.id_by_name': 'SELECT id FROM projects WHERE user_id = ? AND name = ?',
+    'projects.insert': 'INSERT INTO projects (user_id, name, description) VALUES (?, ?, ?)',
+    'projects.list_for_user': '''
+        SELECT id, name, description, created_at 
+        FROM projects WHERE user_id = ? 
+        ORDER BY created_at DESC
+    ''',
+    'projects.owned': 'SELECT id FROM projects WHERE id = ? AND user_id = ?',
+    'projects.delete': 'DELETE FROM projects WHERE id = ?',
+    'projects.details': 'SELECT name, description FROM projects WHERE id = ? AND user_id = ?',
+    'projects.update': 'UPDATE projects SET name = ?, description = ? WHERE id = ? AND user_id = ?',
+    # One row per project: progress from the category counters, last
+    # activity from project_activity, overdue counted per project
+    'projects.dashboard': '''
+        SELECT p.id, p.name, p.description, p.created_at,
+               COALESCE(SUM(s.total), 0) as total,
+               COALESCE(SUM(s.completed), 0) as completed,
+               (SELECT COUNT(*) FROM checklist_items i
+                WHERE i.project_id = p.id AND i.is_completed = 0
+                AND i.due_date IS NOT NULL AND i.due_date < ?) as overdue,
+               COALESCE(a.last_activity, p.created_at) as last_activity
+        FROM projects p
+        LEFT JOIN project_category_stats s ON s.project_id = p.id
+        LEFT JOIN project_activity a ON a.project_id = p.id
+        WHERE p.user_id = ?
+        GROUP BY p.id
+        ORDER BY p.created_at DESC
+    ''',
+    'items.insert_default': '''
+        INSERT INTO checklist_items 
+        (project_id, category, task, is_custom, is_completed) 
+        VALUES (?, ?, ?, ?, ?)
+    ''',
+    
+    # checklist_manager.py
+    'items.list': '''
+        SELECT id, category, task, is_custom, is_completed, notes, due_date, completed_date, created_at
+        FROM checklist_items 
+        WHERE project_id = ?
+        ORDER BY category, created_at, id
+    ''',
+    'items.list_by_category': '''
+        SELECT id, category, task, is_custom, is_completed, notes, due_date, completed_date, created_at
+        FROM checklist_items 
+        WHERE project_id = ? AND category = ?
+        ORDER BY category, created_at, id
+    ''',
+    'items.page': '''
+        SELECT id, category, task, is_custom, is_completed, notes, due_date, completed_date, created_at
+        FROM checklist_items 
+        WHERE project_id = ?
+        ORDER BY category, created_at, id
+        LIMIT ?
+    ''',
+    'items.page_after': '''
+        SELECT id, category, task, is_custom, is_completed, notes, due_date, completed_date, created_at
+        FROM checklist_items 
+        WHERE project_id = ? AND (category, created_at, id) > (?, ?, ?)
+        ORDER BY category, created_at, id
+        LIMIT ?
+    ''',
+    'items.page_by_category': '''
+        SELECT id, category, task, is_custom, is_completed, notes, due_date, completed_date, created_at
+        FROM checklist_items 
+        WHERE project_id = ? AND category = ?
+        ORDER BY created_at, id
+        LIMIT ?
+    ''',
+    'items.page_by_category_after': '''
+        SELECT id, category, task, is_custom, is_completed, notes, due_date, completed_date, created_at
+        FROM checklist_items 
+        WHERE project_id = ? AND category = ? AND (created_at, id) > (?, ?)
+        ORDER BY created_at, id
+        LIMIT ?
+    ''',
+    'items.by_id': '''
+        SELECT id, category, task, is_custom, is_completed, notes, due_date, completed_date, created_at
+        FROM checklist_items 
+        WHERE id = ? AND project_id = ?
+    ''',
+    'items.categories': '''
+        SELECT category 
+        FROM project_category_stats 
+        WHERE project_id = ? 
+        ORDER BY category
+    ''',
+    'items.insert_custom': '''
+        INSERT INTO checklist_items 
+        (project_id, category, task, is_custom, is_completed, due_date)
+        VALUES (?, ?, ?, ?, ?, ?)
+    ''',
+    'items.update_status': '''
+        UPDATE checklist_items 
+        SET is_completed = ?, completed_date = ?
+        WHERE id = ? AND project_id = ?
+    ''',
+    'items.update_notes': '''
+        UPDATE checklist_items 
+        SET notes = ?
+        WHERE id = ? AND project_id = ?
+    ''',
+    'items.delete_custom': '''
+        DELETE FROM checklist_items 
+        WHERE id = ? AND project_id = ? AND is_custom = 1
+    ''',
+    # Bulk statements take their ids as one JSON array parameter, so each
+    # is a single fixed statement whatever the selection size. The unary +
+    # keeps the planner on rowid lookups for the ids rather than scanning
+    # the project through its index.
+    'items.set_status_by_ids': '''
+        UPDATE checklist_items 
+        SET is_completed = ?, completed_date = ?
+        WHERE id IN (SELECT value FROM json_each(?))
+        AND +project_id = ? AND is_completed != ?
+    ''',
+    'items.set_status_by_category': '''
+        UPDATE checklist_items 
+        SET is_completed = ?, completed_date = ?
+        WHERE project_id = ? AND is_completed != ? AND category = ?
+    ''',
+    'items.delete_custom_by_ids': '''
+        DELETE FROM checklist_items 
+        WHERE id IN (SELECT value FROM json_each(?))
+        AND +project_id = ? AND is_custom = 1
+    ''',
+    'items.move_by_ids': '''
+        UPDATE checklist_items 
+        SET category = ?
+        WHERE id IN (SELECT value FROM json_each(?))
+        AND +project_id = ? AND category != ?
+    ''',
+    'items.count': 'SELECT COUNT(*) as count FROM checklist_items WHERE project_id = ?',
+    # The MATCH expression carries the project filter (see build_search_query)
+    'items.search': '''
+        SELECT ci.id, ci.category, ci.task, ci.is_custom, ci.is_completed, ci.notes,
+               ci.due_date, ci.completed_date, ci.created_at
+        FROM checklist_items_fts
+        JOIN checklist_items ci ON ci.id = checklist_items_fts.rowid
+        WHERE checklist_items_fts MATCH ?
+        ORDER BY checklist_items_fts.rank
+        LIMIT ?
+    ''',
+    'items.search_by_category': '''
+        SELECT ci.id, ci.category, ci.task, ci.is_custom, ci.is_completed, ci.notes,
+               ci.due_date, ci.completed_date, ci.created_at
+        FROM checklist_items_fts
+        JOIN checklist_items ci ON ci.id = checklist_items_fts.rowid
+        WHERE checklist_items_fts MATCH ? AND ci.category = ?
+        ORDER BY checklist_items_fts.rank
+        LIMIT ?
+    ''',
+    
+    # stats_manager.py
+    'stats.category_counters': '''
+        SELECT category, total, completed
+        FROM project_category_stats 
+        WHERE project_id = ?
+        ORDER BY category
+    ''',
+    'stats.progress': '''
+        SELECT COALESCE(SUM(total), 0), COALESCE(SUM(completed), 0)
+        FROM project_category_stats 
+        WHERE project_id = ?
+    ''',
+    'stats.category_totals': '''
+        SELECT 
+            category,
+            COUNT(*) as total,
+            SUM(CASE WHEN is_completed = 1 THEN 1 ELSE 0 END) as completed
+        FROM checklist_items 
+        WHERE project_id = ?
+        GROUP BY category
+        ORDER BY category
+    ''',
+    'stats.clear_counters': 'DELETE FROM project_category_stats WHERE project_id = ?',
+    'stats.rebuild_counters': '''
+        INSERT INTO project_category_stats (project_id, category, total, completed)
+        SELECT project_id, category, COUNT(*),
+               SUM(CASE WHEN is_completed = 1 THEN 1 ELSE 0 END)
+        FROM checklist_items 
+        WHERE project_id = ?
+        GROUP BY project_id, category
+    ''',
+    'stats.recent_completed': '''
+        SELECT COUNT(*) FROM checklist_items 
+        WHERE project_id = ? AND is_completed = 1 
+        AND completed_date >= datetime('now', '-7 days')
+    ''',
+    'stats.completion_trend': '''
+        SELECT 
+            DATE(completed_date) as date,
+            COUNT(*) as completed
+        FROM checklist_items 
+        WHERE project_id = ? AND is_completed = 1
+        AND DATE(completed_date) >= DATE('now', '-30 days')
+        GROUP BY DATE(completed_date)
+        ORDER BY date
+    ''',
+    
+    # due_manager.py: open items by due date across a user's projects.
+    # Each project is a range seek on idx_items_project_due.
+    'due.overdue': '''
+        SELECT p.id, p.name,
+               ci.id, ci.category, ci.task, ci.is_custom, ci.is_completed, ci.notes,
+               ci.due_date, ci.completed_date, ci.created_at
+        FROM projects p
+        JOIN checklist_items ci ON ci.project_id = p.id
+        WHERE p.user_id = ? AND ci.is_completed = 0 AND ci.due_date < ?
+        ORDER BY ci.due_date, ci.id
+        LIMIT ?
+    ''',
+    'due.between': '''
+        SELECT p.id, p.name,
+               ci.id, ci.category, ci.task, ci.is_custom, ci.is_completed, ci.notes,
+               ci.due_date, ci.completed_date, ci.created_at
+        FROM projects p
+        JOIN checklist_items ci ON ci.project_id = p.id
+        WHERE p.user_id = ? AND ci.is_completed = 0
+        AND ci.due_date >= ? AND ci.due_date < ?
+        ORDER BY ci.due_date, ci.id
+        LIMIT ?
+    ''',
+    'due.upcoming': '''
+        SELECT p.id, p.name,
+               ci.id, ci.category, ci.task, ci.is_custom, ci.is_completed, ci.notes,
+               ci.due_date, ci.completed_date, ci.created_at
+        FROM projects p
+        JOIN checklist_items ci ON ci.project_id = p.id
+        WHERE p.user_id = ? AND ci.is_completed = 0 AND ci.due_date >= ?
+        ORDER BY ci.due_date, ci.id
+        LIMIT ?
+    ''',
+    
+    # reminders.py
+    'due.reminders': '''
+        SELECT p.id, p.name, ci.id, ci.task, ci.due_date
+        FROM projects p
+        JOIN checklist_items ci ON ci.project_id = p.id
+        WHERE p.user_id = ? AND ci.is_completed = 0 AND ci.due_date >= ?
+    ''',
+    'due.reminders_for_project': '''
+        SELECT p.id, p.name, ci.id, ci.task, ci.due_date
+        FROM projects p
+        JOIN checklist_items ci ON ci.project_id = p.id
+        WHERE p.id = ? AND p.user_id = ? AND ci.is_completed = 0 AND ci.due_date >= ?
+    ''',
+    
+    # export_manager.py
+    'export.project': 'SELECT name, description FROM projects WHERE id = ?',
+    'export.items': '''
+        SELECT id, category, task, is_custom, is_completed, notes, due_date, completed_date, created_at
+        FROM checklist_items 
+        WHERE project_id = ?
+        ORDER BY category, created_at, id
+    ''',
+    
+    # import_manager.py
+    'items.import': '''
+        INSERT INTO checklist_items 
+        (project_id, category, task, is_custom, is_completed, notes, due_date, completed_date, created_at)
+        VALUES (?, ?, ?, ?, ?, ?, ?, ?, COALESCE(?, CURRENT_TIMESTAMP))
+    ''',
+    'items.task_keys': 'SELECT category, task FROM checklist_items WHERE project_id = ?',
+}
+
+
+def normalize_sql(sql):
+    return ' '.join(sql.split())
+
+
+class StatementRegistry:
+    """Named statements plus per-statement cache and latency counters.
+    
+    One LRU is kept per connection, mirroring the compiled-statement cache
+    sqlite3 keeps on each connection (sized by the same cache_size), so
+    hits and misses show which statements stay compiled and which get
+    evicted. A statement's first run on each pooled connection is a miss.
+    Records without a connection share one LRU of their own.
+    """
+    
+    def __init__(self, statements=None, cache_size=DEFAULT_STATEMENT_CACHE_SIZE):
+        self.cache_size = cache_size
+        self._statements = dict(STATEMENTS if statements is None else statements)
+        self._lrus = {}           # id(conn) -> OrderedDict of sql -> name
+        self._counters = {}
+        self._lock = threading.Lock()
+    
+    def register(self, name, sql):
+        self._statements[name] = sql
+    
+    def resolve(self, query):
+        """Return (name, sql) for a statement name or a raw SQL string"""
+        sql = self._statements.get(query)
+        if sql is not None:
+            return query, sql
+        return normalize_sql(query), query
+    
+    def record(self, name, sql, elapsed, conn=None):
+        with self._lock:
+            counters = self._counters.get(name)
+            if counters is None:
+                counters = self._counters[name] = {
+                    'calls': 0, 'hits': 0, 'misses': 0,
+                    'total_time': 0.0, 'max_time': 0.0
+                }
+            
+            key = None if conn is None else id(conn)
+            lru = self._lrus.get(key)
+            if lru is None:
+                lru = self._lrus[key] = OrderedDict()
+            if sql in lru:
+                lru.move_to_end(sql)
+                counters['hits'] += 1
+            else:
+                lru[sql] = name
+                counters['misses'] += 1
+                if len(lru) > self.cache_size:
+                    lru.popitem(last=False)
+            
+            counters['calls'] += 1
+            counters['total_time'] += elapsed
+            counters['max_time'] = max(counters['max_time'], elapsed)
+    
+    def forget(self, conn):
+        """Drop the LRU of a connection that is being closed"""
+        with self._lock:
+            self._lrus.pop(id(conn), None)
+    
+    def stats(self):
+        with self._lock:
+            stats = {}
+            for name, counters in self._counters.items():
+                entry = dict(counters)
+                entry['avg_time'] = counters['total_time'] / counters['calls']
+                stats[name] = entry
+            return stats
+    
+    def top(self, limit=10):
+        """Statements ordered by total time spent, slowest first"""
+        stats = self.stats()
+        ranked = sorted(stats.items(), key=lambda kv: kv[1]['total_time'], reverse=True)
+        return ranked[:limit]
+    
+    def reset_stats(self):
+        with self._lock:
+            self._counters.clear()
@@ -1,5 +1,6 @@
 from database import DatabaseManager
 from datetime import datetime, timedelta
+from project_cache import project_cache
 
 class StatsManager:
     def __init__(self, project_id):
@@ -8,17 +9,8 @@ class StatsManager:
     
     def get_project_stats(self):
         try:
-            # Get category statistics
-            results = self.db.fetch_all('''
-                SELECT 
-                    category,
-                    COUNT(*) as total,
-                    SUM(CASE WHEN is_completed = 1 THEN 1 ELSE 0 END) as completed
-                FROM checklist_items 
-                WHERE project_id = ?
-                GROUP BY category
-                ORDER BY category
-            ''', (self.project_id,))
+            # Category statistics come from the trigger-maintained counters
+            results = self.db.fetch_all('stats.category_counters', (self.project_id,))
             
             category_stats = {}
             total_tasks = 0
@@ -37,11 +29,7 @@ class StatsManager:
             overall_percentage = round((completed_tasks / total_tasks * 100), 1) if total_tasks > 0 else 0
             
             # Get recent activity (last 7 days)
-            recent_result = self.db.fetch_one('''
-                SELECT COUNT(*) FROM checklist_items 
-                WHERE project_id = ? AND is_completed = 1 
-                AND completed_date >= datetime('now', '-7 days')
-            ''', (self.project_id,))
+            recent_result = self.db.fetch_one('stats.recent_completed', (self.project_id,))
             
             recent_activity = recent_result[0] if recent_result else 0
             
@@ -61,18 +49,59 @@ class StatsManager:
             print(f"Error getting project stats: {e}")
             return self._get_empty_stats()
     
+    def get_category_counts(self):
+        """Return {category: (total, completed)} from the maintained counters"""
+        try:
+            snapshot = project_cache.get(self.project_id)
+            if snapshot is not None:
+                with project_cache.lock:
+                    return snapshot.category_counts()
+            
+            results = self.db.fetch_all('stats.category_counters', (self.project_id,))
+            return {row[0]: (row[1], row[2]) for row in results}
+        except Exception as e:
+            print(f"Error getting category counts: {e}")
+            return {}
+    
+    def check_counters(self, repair=False):
+        """Compare project_category_stats with checklist_items.
+        
+        Returns a list of (category, counted, actual) mismatches, where each
+        side is a (total, completed) pair. With repair=True the project's
+        counters are rebuilt from checklist_items when they disagree.
+        """
+        try:
+            counted = {
+                row[0]: (row[1], row[2])
+                for row in self.db.fetch_all('stats.category_counters', (self.project_id,))
+            }
+            actual = {
+                row[0]: (row[1], row[2])
+                for row in self.db.fetch_all('stats.category_totals', (self.project_id,))
+            }
+            
+            mismatches = [
+                (category, counted.get(category, (0, 0)), actual.get(category, (0, 0)))
+                for category in sorted(set(counted) | set(actual))
+                if counted.get(category) != actual.get(category)
+            ]
+            
+            if mismatches and repair:
+                self.rebuild_counters()
+            
+            return mismatches
+        except Exception as e:
+            print(f"Error checking counters: {e}")
+            return []
+    
+    def rebuild_counters(self):
+        with self.db.transaction():
+            self.db.execute_query('stats.clear_counters', (self.project_id,))
+            self.db.execute_query('stats.rebuild_counters', (self.project_id,))
+    
     def _get_completion_trend(self):
         try:
-            results = self.db.fetch_all('''
-                SELECT 
-                    DATE(completed_date) as date,
-                    COUNT(*) as completed
-                FROM checklist_items 
-                WHERE project_id = ? AND is_completed = 1
-                AND completed_date >= datetime('now', '-30 days')
-                GROUP BY DATE(completed_date)
-                ORDER BY date
-            ''', (self.project_id,))
+            results = self.db.fetch_all('stats.completion_trend', (self.project_id,))
             
             trend = []
             for row in results:
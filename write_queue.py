@@ -0,0 +1,105 @@
+import threading
+
+from kivy.clock import Clock
+
+# Seconds of quiet after the last edit before pending edits are written
+DEFAULT_FLUSH_DELAY = 0.75
+
+# Distinct items with pending edits that trigger an immediate flush
+DEFAULT_MAX_PENDING = 25
+
+
+class WriteBehindQueue:
+    """Coalesces checklist edits and writes them in one transaction.
+    
+    The UI applies an edit to its rows straight away and records it here.
+    Edits to the same item are merged (the last value wins, and an edit
+    undone before the flush disappears), and all pending edits are
+    written together once the queue has been quiet for delay seconds or
+    max_pending items are waiting. flush() writes synchronously and is
+    what screen exit and app shutdown call.
+    
+    If a write fails the transaction rolls back and on_failure receives,
+    on the UI thread, {item_id: {field: value}} with the values the rows
+    should be reverted to.
+    """
+    
+    def __init__(self, project_id, executor=None, on_failure=None,
+                 delay=DEFAULT_FLUSH_DELAY, max_pending=DEFAULT_MAX_PENDING):
+        self.project_id = project_id
+        self.executor = executor
+        self.on_failure = on_failure
+        self.delay = delay
+        self.max_pending = max_pending
+        
+        self._pending = {}     # item_id -> {field: new value}
+        self._originals = {}   # item_id -> {field: value before the first pending edit}
+        self._lock = threading.Lock()
+        # Held across take-and-write so batches commit in the order taken
+        self._flush_lock = threading.Lock()
+        self._event = None
+    
+    def record(self, item_id, original, **changes):
+        """Queue changes to one item; original holds its current values"""
+        with self._lock:
+            originals = self._originals.setdefault(item_id, {})
+            pending = self._pending.setdefault(item_id, {})
+            for field, value in changes.items():
+                originals.setdefault(field, original[field])
+                if value == originals[field]:
+                    pending.pop(field, None)
+                    del originals[field]
+                else:
+                    pending[field] = value
+            if not pending:
+                del self._pending[item_id]
+                del self._originals[item_id]
+            count = len(self._pending)
+        
+        if count:
+            self._schedule(0 if count >= self.max_pending else self.delay)
+    
+    def pending_count(self):
+        with self._lock:
+            return len(self._pending)
+    
+    def _schedule(self, delay):
+        if self._event is not None:
+            self._event.cancel()
+        self._event = Clock.schedule_once(self._flush_later, delay)
+    
+    def _flush_later(self, dt):
+        self._event = None
+        if self.executor is not None:
+            self.executor.submit(self.flush)
+        else:
+            self.flush()
+    
+    def flush(self):
+        """Write every pending edit now; returns False if the write failed"""
+        from checklist_manager import ChecklistManager
+        
+        with self._flush_lock:
+            with self._lock:
+                edits, originals = self._pending, self._originals
+                self._pending, self._originals = {}, {}
+            if not edits:
+                return True
+            
+            if ChecklistManager(self.project_id).apply_edits(edits):
+                return True
+            
+            with self._lock:
+                reverts = {}
+                for item_id, fields in originals.items():
+                    newer = self._pending.get(item_id, {})
+                    for field, value in fields.items():
+                        if field in newer:
+                            # Re-edited since: that edit now starts from the stored value
+                            self._originals[item_id][field] = value
+                        else:
+                            reverts.setdefault(item_id, {})[field] = value
+            
+            if self.on_failure and reverts:
+                Clock.schedule_once(lambda dt: self.on_failure(reverts))
+            return False